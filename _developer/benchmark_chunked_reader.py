@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmark_chunked_reader.py
+"""
+
+# pylint: disable=invalid-name
+
+"""
+Measures the throughput of "ChunkedReaderMixin._read_chunked_data()" for a
+generated chunked transfer-encoded stream. Usage:
+
+python benchmark_chunked_reader.py [total size in MiB] [chunk size in bytes]
+"""
+
+from io import BufferedReader, RawIOBase
+from os import path
+from time import time
+import sys
+
+sys.path.insert(0, path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+
+from pas_http_client.chunked_reader_mixin import ChunkedReaderMixin
+
+class ChunkedStream(RawIOBase):
+    """
+Raw stream generating chunked transfer-encoded data of the given size.
+    """
+
+    def __init__(self, total_size, chunk_size):
+        RawIOBase.__init__(self)
+
+        self.chunk_data = "{0:x}\r\n".format(chunk_size).encode("ascii") + (b"x" * chunk_size) + b"\r\n"
+        self.chunks_left = total_size // chunk_size
+        self.pending = memoryview(b"")
+    #
+
+    def readable(self):
+        return True
+    #
+
+    def readinto(self, buffer):
+        if (len(self.pending) < 1):
+            if (self.chunks_left > 0):
+                self.chunks_left -= 1
+                self.pending = memoryview(self.chunk_data)
+            elif (self.chunks_left == 0):
+                self.chunks_left = -1
+                self.pending = memoryview(b"0\r\n\r\n")
+            else: return 0
+        #
+
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+
+        return size
+    #
+#
+
+class ChunkedReader(ChunkedReaderMixin):
+    """
+Minimal class using the chunked reader mixin.
+    """
+
+    __slots__ = ChunkedReaderMixin._mixin_slots_
+#
+
+def run(total_size, chunk_size):
+    """
+Runs the benchmark and prints the throughput measured.
+    """
+
+    reader = BufferedReader(ChunkedStream(total_size, chunk_size), 65536)
+    chunked_reader = ChunkedReader()
+    received = [ 0 ]
+
+    def callback(data): received[0] += len(data)
+
+    start_time = time()
+    chunked_reader._read_chunked_data(reader, callback)
+    duration = time() - start_time
+
+    print("{0:d} MiB in chunks of {1:d} bytes: {2:.3f} s, {3:.1f} MiB/s".format(received[0] // 1048576,
+                                                                             chunk_size,
+                                                                             duration,
+                                                                             received[0] / 1048576 / duration
+                                                                            ))
+#
+
+if (__name__ == "__main__"):
+    total_size = 1048576 * (int(sys.argv[1]) if (len(sys.argv) > 1) else 1024)
+    chunk_sizes = ([ int(sys.argv[2]) ] if (len(sys.argv) > 2) else [ 256, 4096, 65536, 1048576 ])
+
+    for chunk_size in chunk_sizes: run(total_size, chunk_size)
+#
@@ -17,8 +17,42 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from .abstract_connection_factory import AbstractConnectionFactory
+from .abstract_content_decoder import AbstractContentDecoder
 from .abstract_raw_client import AbstractRawClient
+from .address_resolver import AddressResolver
+from .abstract_response_cache_store import AbstractResponseCacheStore
+from .async_client import AsyncClient
+from .async_connection_pool import AsyncConnectionPool
+from .async_raw_client import AsyncRawClient
+from .async_response import AsyncResponse
+from .body_reader import BodyReader
 from .chunked_reader_mixin import ChunkedReaderMixin
+from .circuit_breaker import CircuitBreaker
 from .client import Client
+from .concurrency_limiter import ConcurrencyLimiter
+from .connection_pool import ConnectionPool
+from .decoding_body_reader import DecodingBodyReader
+from .file_response_cache_store import FileResponseCacheStore
+from .gzip_body_encoder import GzipBodyEncoder
+from .hedging_policy import HedgingPolicy
+from .http_connection_factory import HttpConnectionFactory
+from .https_connection_factory import HttpsConnectionFactory
+from .load_balanced_client import LoadBalancedClient
+from .load_balancer import LoadBalancer
+from .memory_response_cache_store import MemoryResponseCacheStore
+from .multipart_form_data import MultipartFormData
+from .pipeline_socket import PipelineSocket
+from .rate_limiter import RateLimiter
 from .raw_client import RawClient
+from .request_coalescer import RequestCoalescer
+from .request_deadline import RequestDeadline
 from .response import Response
+from .response_cache import ResponseCache
+from .response_cache_entry import ResponseCacheEntry
+from .retry_budget import RetryBudget
+from .retry_policy import RetryPolicy
+from .socket_options import SocketOptions
+from .tls_context_cache import TlsContextCache
+from .unix_socket_connection_factory import UnixSocketConnectionFactory
+from .zlib_content_decoder import ZlibContentDecoder
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.not_implemented_exception import NotImplementedException
+
+class AbstractConnectionFactory(object):
+    """
+Abstract factory creating connections of a specific transport for a given
+client.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def create_async_connection(self, client, host, port, timeout):
+        """
+Returns a new, not yet connected asyncio based HTTP connection.
+
+:param client: Client instance requesting the connection
+:param host: Host name or address to connect to
+:param port: Port to connect to
+:param timeout: Timeout in seconds for connecting
+
+:return: (object) AsyncConnection instance
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def create_connection(self, client, host, port, timeout):
+        """
+Returns a new, not yet connected HTTP connection.
+
+:param client: Client instance requesting the connection
+:param host: Host name or address to connect to
+:param port: Port to connect to
+:param timeout: Socket timeout in seconds
+
+:return: (object) HTTP connection compatible with "http.client"
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+#
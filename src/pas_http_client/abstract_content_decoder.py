@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.not_implemented_exception import NotImplementedException
+
+class AbstractContentDecoder(object):
+    """
+Abstract incremental decoder for a HTTP content-coding.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @property
+    def is_pending(self):
+        """
+Returns true if decoded data is pending without providing further input.
+
+:return: (bool) True if pending
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def decode(self, data, max_length = 0):
+        """
+Decodes the given data.
+
+:param data: Encoded data; empty to continue with pending input
+:param max_length: Maximum number of bytes returned; 0 for unlimited
+
+:return: (bytes) Decoded data
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def flush(self):
+        """
+Returns remaining decoded data after all input has been provided.
+
+:return: (bytes) Decoded data
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+#
@@ -20,19 +20,19 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 # pylint: disable=import-error,invalid-name,no-name-in-module
 
 from base64 import b64encode
+from os import fstat
 from weakref import proxy, ProxyTypes
 
-try: from urllib.parse import quote_plus, urlencode, urlsplit
-except ImportError:
-    from urllib import quote_plus, urlencode
-    from urlparse import urlsplit
-#
+try: from urllib.parse import quote_plus, urlencode
+except ImportError: from urllib import quote_plus, urlencode
 
 from dpt_runtime.binary import Binary
 from dpt_runtime.not_implemented_exception import NotImplementedException
 from dpt_runtime.type_exception import TypeException
 from pas_rfc_basics.header import Header
 
+from .multipart_form_data import MultipartFormData
+
 class AbstractRawClient(object):
     """
 Abstract HTTP-like client abstraction layer returning raw responses.
@@ -137,6 +137,30 @@ Socket timeout in seconds
         self.url = url
     #
 
+    def __copy__(self):
+        """
+python.org: Called to implement the built-in function copy.copy().
+
+Returns a copy of this client sharing its configuration but no connection.
+
+:return: (object) Client copy
+:since:  v1.0.0
+        """
+
+        _return = self.__class__.__new__(self.__class__)
+
+        for _class in self.__class__.__mro__:
+            for name in getattr(_class, "__slots__", [ ]):
+                if (name != "__weakref__" and hasattr(self, name)): setattr(_return, name, getattr(self, name))
+            #
+        #
+
+        _return.connection = None
+        if (self.headers is not None): _return.headers = self.headers.copy()
+
+        return _return
+    #
+
     @property
     def log_handler(self):
         """
@@ -241,69 +265,108 @@ Configures the HTTP connection for later use.
         raise NotImplementedException()
     #
 
-    def request(self, method, separator = ";", params = None, data = None):
+    def _get_request_kwargs(self, separator = ";", params = None, data = None):
         """
-Call a given request method on the connected HTTP server.
+Returns the keyword arguments for "_request()" based on the given request
+parameters. File objects, memoryviews, iterables and "MultipartFormData"
+given as body are sent as a stream with "Content-Length" if known or
+chunked transfer-encoded otherwise. File objects must be opened in binary
+mode.
 
-:param method: HTTP method
 :param separator: Query parameter separator
 :param params: Parsed query parameters as str
 :param data: HTTP body
 
-:return: (dict) Response data; 'body' may contain the catched exception
+:return: (dict) Keyword arguments
 :since:  v1.0.0
         """
 
-        # pylint: disable=broad-except,star-args
+        path = self.path
 
-        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.request({1})- (#echo(__LINE__)#)", self, method)
+        if (type(params) is str):
+            if ("?" not in path): path += "?"
+            elif (not path.endswith(separator)): path += separator
 
-        try:
-            path = self.path
+            path += params
+        #
+
+        headers = (None if (self.headers is None) else self.headers.copy())
+        _return = { "url": path }
 
-            if (type(params) is str):
-                if ("?" not in path): path += "?"
-                elif (not path.endswith(separator)): path += separator
+        if (data is not None):
+            if (isinstance(data, dict)):
+                if (headers is None): headers = { }
+                if ("content-type" not in headers): headers['content-type'] = "application/x-www-form-urlencoded"
 
-                path += params
+                data = urlencode(data)
+            elif (isinstance(data, MultipartFormData)):
+                if (headers is None): headers = { }
+                if ("content-type" not in headers): headers['content-type'] = data.content_type
             #
 
-            headers = (None if (self.headers is None) else self.headers.copy())
-            kwargs = { "url": path }
+            if (self._is_body_streamed(data)):
+                if (hasattr(data, "read") and (not isinstance(data.read(0), Binary.BYTES_TYPE))): raise TypeException("File given as body is not opened in binary mode")
+                body_length = self._get_body_length(data)
 
-            if (data is not None):
-                if (isinstance(data, dict)):
+                if (body_length is not None):
                     if (headers is None): headers = { }
-                    if ("content-type" not in headers): headers['content-type'] = "application/x-www-form-urlencoded"
-
-                    data = urlencode(data)
+                    if ("content-length" not in headers): headers['content-length'] = str(body_length)
+                elif (headers is None or "content-length" not in headers):
+                    if (headers is None): headers = { }
+                    headers['transfer-encoding'] = "chunked"
+                    _return['encode_chunked'] = True
                 #
 
-                kwargs['body'] = Binary.utf8_bytes(data)
-            #
+                _return['body'] = data
+            else: _return['body'] = Binary.utf8_bytes(data)
+        #
 
-            if (self._auth_name is not None):
-                auth_data = "{0}:{1}".format(self._auth_name, self._auth_password)
+        if (self._auth_name is not None):
+            auth_data = "{0}:{1}".format(self._auth_name, self._auth_password)
 
-                if (type(auth_data) is not Binary.BYTES_TYPE): auth_data = Binary.utf8_bytes(auth_data)
-                base64_data = b64encode(auth_data)
-                if (type(base64_data) is not str): base64_data = Binary.str(base64_data)
+            if (type(auth_data) is not Binary.BYTES_TYPE): auth_data = Binary.utf8_bytes(auth_data)
+            base64_data = b64encode(auth_data)
+            if (type(base64_data) is not str): base64_data = Binary.str(base64_data)
 
-                kwargs['headers'] = { "Authorization": "Basic {0}".format(base64_data) }
-                if (headers is not None): kwargs['headers'].update(headers)
-            elif (headers is not None): kwargs['headers'] = headers
+            _return['headers'] = { "Authorization": "Basic {0}".format(base64_data) }
+            if (headers is not None): _return['headers'].update(headers)
+        elif (headers is not None): _return['headers'] = headers
 
+        return _return
+    #
+
+    def request(self, method, separator = ";", params = None, data = None):
+        """
+Call a given request method on the connected HTTP server.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+:param data: HTTP body
+
+:return: (dict) Response data; 'body' may contain the catched exception
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,star-args
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.request({1})- (#echo(__LINE__)#)", self, method)
+
+        try:
+            kwargs = self._get_request_kwargs(separator, params, data)
             _return = self._request(method, **kwargs)
         except Exception as handled_exception: _return = { "code": None, "headers": None, "body": handled_exception }
 
         return _return
     #
 
-    def _request(self, method, **kwargs):
+    def _request(self, method, deadline = None, **kwargs):
         """
 Sends the request to the connected HTTP server and returns the result.
 
 :param method: HTTP method
+:param deadline: Deadline of the request; None to create one based on the
+                 configured timeouts
 
 :return: (dict) Response data; 'body' may contain the catched Exception
 :since:  v1.0.0
@@ -394,4 +457,56 @@ Returns a RFC 7231 compliant dict of headers from the entire HTTP response.
 
         return _return
     #
+
+    @staticmethod
+    def _get_body_length(data):
+        """
+Returns the number of bytes left to send for the given streamed body.
+
+:param data: Streamed HTTP body
+
+:return: (int) Body length; None if unknown
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = None
+
+        if (isinstance(data, memoryview)): _return = data.nbytes
+        elif (isinstance(data, MultipartFormData)): _return = data.length
+        elif (hasattr(data, "read")):
+            try: _return = fstat(data.fileno()).st_size - data.tell()
+            except Exception:
+                try:
+                    position = data.tell()
+                    _return = data.seek(0, 2) - position
+                    data.seek(position)
+                except Exception: _return = None
+            #
+
+            if (_return is not None and _return < 0): _return = None
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _is_body_streamed(data):
+        """
+Returns true if the given body should be sent as a stream instead of being
+converted to bytes before.
+
+:param data: HTTP body
+
+:return: (bool) True if streamed
+:since:  v1.0.0
+        """
+
+        return (hasattr(data, "read")
+                or hasattr(data, "__aiter__")
+                or isinstance(data, memoryview)
+                or (hasattr(data, "__iter__") and (not isinstance(data, ( str, Binary.BYTES_TYPE, bytearray, dict ))))
+               )
+    #
 #
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.not_implemented_exception import NotImplementedException
+
+class AbstractResponseCacheStore(object):
+    """
+Abstract storage for entries of a response cache.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def clear(self):
+        """
+Removes all entries.
+
+:since: v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def delete(self, key):
+        """
+Removes the entry for the given key.
+
+:param key: Cache key
+
+:since: v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def get(self, key):
+        """
+Returns the entry for the given key.
+
+:param key: Cache key
+
+:return: (object) ResponseCacheEntry instance; None if not stored
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def set(self, key, entry):
+        """
+Stores the entry for the given key replacing an existing one.
+
+:param key: Cache key
+:param entry: ResponseCacheEntry instance
+
+:since: v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+#
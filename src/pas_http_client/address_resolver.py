@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+import errno
+import socket
+
+from collections import OrderedDict
+from selectors import DefaultSelector, EVENT_WRITE
+from threading import RLock, Thread
+from time import time
+
+class AddressResolver(object):
+    """
+Thread-safe host name resolver caching addresses for a fixed time. New
+connections race the resolved addresses as described in RFC 8305 ("Happy
+Eyeballs"). Addresses failing repeatedly are ejected for some time.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    CONNECT_IN_PROGRESS_ERRORS = ( errno.EAGAIN, errno.EINPROGRESS, errno.EWOULDBLOCK, 10035 )
+    """
+"connect_ex()" results of non-blocking sockets still connecting
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_address_failures",
+                  "connection_attempt_delay",
+                  "_ejected_addresses",
+                  "ejection_duration",
+                  "_entries",
+                  "_lock",
+                  "max_address_failures",
+                  "max_entries",
+                  "ttl"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide AddressResolver instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self, ttl = 60, connection_attempt_delay = 0.25, max_entries = 1024, max_address_failures = 5, ejection_duration = 30):
+        """
+Constructor __init__(AddressResolver)
+
+:param ttl: Seconds resolved addresses are cached
+:param connection_attempt_delay: Seconds to wait for a connection attempt
+                                 before the next address is tried in
+                                 parallel
+:param max_entries: Maximum number of host names cached
+:param max_address_failures: Number of consecutive failures after which an
+                             address is ejected; None to never eject
+:param ejection_duration: Seconds an address is ejected
+
+:since: v1.0.0
+        """
+
+        self._address_failures = { }
+        """
+Number of consecutive failures per socket address
+        """
+        self.connection_attempt_delay = connection_attempt_delay
+        """
+Seconds to wait for a connection attempt before the next address is tried
+        """
+        self._ejected_addresses = { }
+        """
+UNIX timestamp the ejection ends per socket address
+        """
+        self.ejection_duration = ejection_duration
+        """
+Seconds an address is ejected
+        """
+        self._entries = OrderedDict()
+        """
+Expiry time and addresses per host and port in insertion order
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self.max_address_failures = max_address_failures
+        """
+Number of consecutive failures after which an address is ejected
+        """
+        self.max_entries = max_entries
+        """
+Maximum number of host names cached
+        """
+        self.ttl = ttl
+        """
+Seconds resolved addresses are cached
+        """
+    #
+
+    def clear(self):
+        """
+Removes all cached addresses and ejections.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._address_failures.clear()
+            self._ejected_addresses.clear()
+            self._entries.clear()
+        #
+    #
+
+    def create_connection(self, address, timeout = socket._GLOBAL_DEFAULT_TIMEOUT, source_address = None, socket_options = None):
+        """
+Connects to the given address and returns the socket. Compatible with
+"socket.create_connection()".
+
+:param address: Tuple of host and port
+:param timeout: Socket timeout in seconds
+:param source_address: Tuple of host and port to bind to before connecting
+:param socket_options: SocketOptions instance applied before connecting
+
+:return: (object) Connected socket
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        if (timeout is socket._GLOBAL_DEFAULT_TIMEOUT): timeout = socket.getdefaulttimeout()
+
+        addresses = self.get_addresses(address[0], address[1])
+        timeout_time = (None if (timeout is None) else time() + timeout)
+
+        errors = [ ]
+        next_attempt_time = 0
+        pending_sockets = { }
+        selector = DefaultSelector()
+
+        try:
+            while (len(addresses) > 0 or len(pending_sockets) > 0):
+                if (len(addresses) > 0 and (len(pending_sockets) < 1 or time() >= next_attempt_time)):
+                    connect_address = addresses.pop(0)
+                    sock = self._start_connect(connect_address, source_address, socket_options, errors)
+
+                    if (sock is not None):
+                        pending_sockets[sock] = connect_address[4]
+                        selector.register(sock, EVENT_WRITE)
+
+                        next_attempt_time = time() + self.connection_attempt_delay
+                    #
+
+                    continue
+                #
+
+                select_timeout = (next_attempt_time - time() if (len(addresses) > 0) else None)
+
+                if (timeout_time is not None):
+                    timeout_left = timeout_time - time()
+                    if (timeout_left <= 0): raise socket.timeout("Timeout occurred while connecting")
+
+                    select_timeout = (timeout_left if (select_timeout is None) else min(select_timeout, timeout_left))
+                #
+
+                for ( selector_key, _ ) in selector.select(select_timeout):
+                    sock = selector_key.fileobj
+                    selector.unregister(sock)
+
+                    socket_address = pending_sockets.pop(sock)
+                    error_code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+
+                    if (error_code == 0):
+                        sock.settimeout(timeout)
+                        return sock
+                    #
+
+                    self.record_address_result(socket_address, True)
+
+                    errors.append(socket.error(error_code, "Connection to {0!r} failed".format(address)))
+                    sock.close()
+
+                    next_attempt_time = 0
+                #
+            #
+        finally:
+            for sock in pending_sockets: sock.close()
+            selector.close()
+        #
+
+        if (len(errors) > 0): raise errors[-1]
+        raise socket.error("No address found for {0!r}".format(address))
+    #
+
+    def get_addresses(self, host, port):
+        """
+Returns the addresses of the given host ordered for connection attempts.
+Addresses are resolved if not cached. Ejected addresses are left out unless
+all of them are ejected.
+
+:param host: Host name or address
+:param port: Port
+
+:return: (list) List of "getaddrinfo()" results
+:since:  v1.0.0
+        """
+
+        key = ( host, port )
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None and entry[0] > time()): return self._get_healthy_addresses(entry[1])
+        #
+
+        addresses = self._get_interleaved_addresses(socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM))
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = ( time() + self.ttl, addresses )
+
+            while (len(self._entries) > self.max_entries): self._entries.popitem(False)
+
+            return self._get_healthy_addresses(addresses)
+        #
+    #
+
+    def _get_healthy_addresses(self, addresses):
+        """
+Returns the given addresses without the ejected ones. The lock must be
+held.
+
+:param addresses: List of "getaddrinfo()" results
+
+:return: (list) List of "getaddrinfo()" results
+:since:  v1.0.0
+        """
+
+        if (len(self._ejected_addresses) < 1): _return = list(addresses)
+        else:
+            current_time = time()
+
+            for socket_address in [ socket_address
+                                    for ( socket_address, ejection_end_time ) in self._ejected_addresses.items()
+                                    if (ejection_end_time <= current_time)
+                                  ]: del(self._ejected_addresses[socket_address])
+
+            _return = [ address for address in addresses if (address[4] not in self._ejected_addresses) ]
+            if (len(_return) < 1): _return = list(addresses)
+        #
+
+        return _return
+    #
+
+    def is_address_ejected(self, socket_address):
+        """
+Returns true if the given socket address is currently ejected.
+
+:param socket_address: Socket address as returned by "getaddrinfo()"
+
+:return: (bool) True if ejected
+:since:  v1.0.0
+        """
+
+        with self._lock: return (self._ejected_addresses.get(socket_address, 0) > time())
+    #
+
+    def prefetch(self, host, port):
+        """
+Resolves the addresses of the given host in the background if they are
+not cached.
+
+:param host: Host name or address
+:param port: Port
+
+:since: v1.0.0
+        """
+
+        thread = Thread(target = self._prefetch, args = ( host, port ))
+        thread.daemon = True
+        thread.start()
+    #
+
+    def _prefetch(self, host, port):
+        """
+Resolves the addresses of the given host ignoring errors.
+
+:param host: Host name or address
+:param port: Port
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        try: self.get_addresses(host, port)
+        except Exception: pass
+    #
+
+    def record_address_result(self, socket_address, is_failure):
+        """
+Records the result of a connection attempt or request to the given socket
+address. The address is ejected after too many consecutive failures. Only
+successful requests reset the failure count.
+
+:param socket_address: Socket address as returned by "getaddrinfo()"
+:param is_failure: True if the attempt failed
+
+:since: v1.0.0
+        """
+
+        if (self.max_address_failures is not None):
+            with self._lock:
+                if (not is_failure): self._address_failures.pop(socket_address, None)
+                else:
+                    failures = self._address_failures.get(socket_address, 0) + 1
+
+                    if (failures < self.max_address_failures): self._address_failures[socket_address] = failures
+                    else:
+                        self._address_failures.pop(socket_address, None)
+                        self._ejected_addresses[socket_address] = time() + self.ejection_duration
+                    #
+                #
+            #
+        #
+    #
+
+    def _start_connect(self, address, source_address, socket_options, errors):
+        """
+Starts a non-blocking connection attempt to the given address.
+
+:param address: "getaddrinfo()" result
+:param source_address: Tuple of host and port to bind to before connecting
+:param socket_options: SocketOptions instance applied before connecting
+:param errors: List errors are appended to
+
+:return: (object) Socket connecting; None on error
+:since:  v1.0.0
+        """
+
+        ( family, socket_type, protocol, _, socket_address ) = address
+        _return = None
+
+        try:
+            _return = socket.socket(family, socket_type, protocol)
+
+            if (socket_options is not None): socket_options.apply(_return)
+            if (source_address is not None): _return.bind(source_address)
+
+            _return.setblocking(False)
+            error_code = _return.connect_ex(socket_address)
+
+            if (error_code != 0 and error_code not in self.__class__.CONNECT_IN_PROGRESS_ERRORS):
+                raise socket.error(error_code, "Connection to {0!r} failed".format(socket_address))
+            #
+        except socket.error as handled_exception:
+            if (_return is not None): _return.close()
+
+            errors.append(handled_exception)
+            self.record_address_result(socket_address, True)
+
+            _return = None
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide AddressResolver instance.
+
+:return: (object) AddressResolver instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+
+    @staticmethod
+    def _get_interleaved_addresses(addresses):
+        """
+Returns the given addresses with address families alternating starting
+with the first one returned by the resolver as described in RFC 8305.
+
+:param addresses: List of "getaddrinfo()" results
+
+:return: (list) List of "getaddrinfo()" results
+:since:  v1.0.0
+        """
+
+        families = [ ]
+        family_addresses = { }
+
+        for address in addresses:
+            if (address[0] not in family_addresses):
+                families.append(address[0])
+                family_addresses[address[0]] = [ ]
+            #
+
+            if (address not in family_addresses[address[0]]): family_addresses[address[0]].append(address)
+        #
+
+        _return = [ ]
+
+        while (len(families) > 0):
+            for family in list(families):
+                _return.append(family_addresses[family].pop(0))
+                if (len(family_addresses[family]) < 1): families.remove(family)
+            #
+        #
+
+        return _return
+    #
+#
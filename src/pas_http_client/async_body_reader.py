@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+import asyncio
+
+from dpt_runtime.io_exception import IOException
+
+from .body_reader import BodyReader
+
+class AsyncBodyReader(BodyReader):
+    """
+Awaitable body reader releasing the underlying asyncio based connection as
+soon as the response body has been read completely.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    async def __call__(self, n = None):
+        """
+python.org: Called when the instance is "called" as a function.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        try:
+            if (self._deadline is None): _return = await (self._response.read() if (n is None) else self._response.read(n))
+            else: _return = await self._read_until_deadline(n)
+        except BaseException:
+            self.close()
+            raise
+        #
+
+        if (self._response.isclosed()): self._release(True)
+        return _return
+    #
+
+    async def _read_until_deadline(self, n = None):
+        """
+Reads data with one stream read at most per call of "read1()" limited by the
+read idle timeout and the deadline.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        _return = bytearray()
+
+        while ((n is None or len(_return) < n) and (not self._response.isclosed())):
+            size = (self.__class__.READ_BLOCK_SIZE if (n is None) else n - len(_return))
+
+            try: data = await asyncio.wait_for(self._response.read1(size), self.apply_read_timeout())
+            except asyncio.TimeoutError: raise IOException("Timeout occurred before EOF")
+
+            if (not data): break
+            _return += data
+        #
+
+        return bytes(_return)
+    #
+#
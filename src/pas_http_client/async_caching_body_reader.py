@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .caching_body_reader import CachingBodyReader
+
+class AsyncCachingBodyReader(CachingBodyReader):
+    """
+Awaitable body reader passing the data read from the given awaitable body
+reader through and providing the complete body to a callback at EOF.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    async def __call__(self, n = None):
+        """
+python.org: Called when the instance is "called" as a function.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        _return = await self._body_reader(n)
+        self._add_data(_return, n is None or len(_return) < 1)
+
+        return _return
+    #
+#
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .async_raw_client import AsyncRawClient
+from .async_response import AsyncResponse
+
+class AsyncClient(AsyncRawClient):
+    """
+asyncio based HTTP client for requesting and parsing data.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=arguments-differ
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, url, timeout = 6, event_handler = None):
+        """
+Constructor __init__(AsyncClient)
+
+:param url: URL to be called
+:param timeout: Connection timeout in seconds
+:param event_handler: EventHandler to use
+
+:since: v1.0.0
+        """
+
+        AsyncRawClient.__init__(self, url, timeout, True, event_handler)
+    #
+
+    def _new_response(self, raw_response):
+        """
+Initializes an HTTP response object based on the received raw data.
+
+:param raw_response: Raw response dict
+
+:return: (object) AsyncResponse object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        _return = AsyncResponse()
+        _return._set_code(raw_response['code'])
+        _return._set_headers(raw_response['headers'])
+
+        if (isinstance(raw_response['body'], Exception)): _return._set_exception(raw_response['body'])
+        if ("body_reader" in raw_response): _return._set_body_reader(raw_response['body_reader'])
+        if ("body_decoder" in raw_response): _return._set_body_decoder(raw_response['body_decoder'])
+
+        return _return
+    #
+
+    async def request(self, method, separator = ";", params = None, data = None):
+        """
+Call a given request method on the connected HTTP server.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+:param data: HTTP body
+
+:return: (object) AsyncResponse object
+:since:  v1.0.0
+        """
+
+        raw_response = await AsyncRawClient.request(self, method, separator, params, data)
+        return self._new_response(raw_response)
+    #
+#
@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+import socket
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+
+from .async_connection_response import AsyncConnectionResponse
+
+class AsyncConnection(object):
+    """
+HTTP/1.1 connection based on asyncio streams providing a subset of the
+"http.client" connection API as coroutines.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__",
+                  "address_resolver",
+                  "host",
+                  "port",
+                  "_reader",
+                  "_response",
+                  "socket_options",
+                  "socket_path",
+                  "ssl_context",
+                  "ssl_handshake_timeout",
+                  "timeout",
+                  "_writer"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, host, port, timeout = None, ssl_context = None, socket_path = None):
+        """
+Constructor __init__(AsyncConnection)
+
+:param host: Host name or address to connect to
+:param port: Port to connect to
+:param timeout: Timeout in seconds for connecting
+:param ssl_context: SSL/TLS context to use; None for plain connections
+:param socket_path: Path of an UNIX domain socket to connect to instead of
+                    the host
+
+:since: v1.0.0
+        """
+
+        self.address_resolver = None
+        """
+Address resolver used to connect; None to let asyncio resolve the host
+name
+        """
+        self.host = host
+        """
+Host name or address to connect to
+        """
+        self.port = port
+        """
+Port to connect to
+        """
+        self._reader = None
+        """
+asyncio stream reader
+        """
+        self._response = None
+        """
+Response currently being received
+        """
+        self.socket_options = None
+        """
+Socket options applied to new TCP connections
+        """
+        self.socket_path = socket_path
+        """
+Path of an UNIX domain socket to connect to instead of the host
+        """
+        self.ssl_context = ssl_context
+        """
+SSL/TLS context to use; None for plain connections
+        """
+        self.ssl_handshake_timeout = None
+        """
+Timeout in seconds for the SSL/TLS handshake; None for the asyncio default
+        """
+        self.timeout = timeout
+        """
+Timeout in seconds for connecting
+        """
+        self._writer = None
+        """
+asyncio stream writer
+        """
+    #
+
+    @property
+    def _host_header(self):
+        """
+Returns the value of the "Host" header for requests.
+
+:return: (str) Host header value
+:since:  v1.0.0
+        """
+
+        _return = (self.host.split("%", 1)[0] if (self.socket_path is None) else self.host)
+        if (":" in _return): _return = "[{0}]".format(_return)
+
+        default_port = (80 if (self.ssl_context is None) else 443)
+        if (self.port is not None and self.port != default_port): _return += ":{0:d}".format(self.port)
+
+        return _return
+    #
+
+    @property
+    def is_connected(self):
+        """
+Returns true if the connection is established and has not been closed by
+the peer.
+
+:return: (bool) True if connected
+:since:  v1.0.0
+        """
+
+        return (self._writer is not None
+                and (not self._writer.is_closing())
+                and (not self._reader.at_eof())
+               )
+    #
+
+    @property
+    def peer_address(self):
+        """
+Returns the socket address of the connected peer.
+
+:return: (tuple) Socket address; None if not connected
+:since:  v1.0.0
+        """
+
+        return (None if (self._writer is None) else self._writer.get_extra_info("peername"))
+    #
+
+    def close(self):
+        """
+Closes the connection.
+
+:since: v1.0.0
+        """
+
+        writer = self._writer
+
+        self._reader = None
+        self._response = None
+        self._writer = None
+
+        if (writer is not None): writer.close()
+    #
+
+    async def connect(self):
+        """
+Connects to the HTTP server. The timeout is extended by the SSL/TLS
+handshake timeout if set.
+
+:since: v1.0.0
+        """
+
+        kwargs = { }
+        timeout = self.timeout
+
+        if (self.ssl_context is not None):
+            kwargs['ssl'] = self.ssl_context
+            kwargs['server_hostname'] = self.host.split("%", 1)[0]
+
+            if (self.ssl_handshake_timeout is not None):
+                kwargs['ssl_handshake_timeout'] = self.ssl_handshake_timeout
+                if (timeout is not None): timeout += self.ssl_handshake_timeout
+            #
+        #
+
+        if (self.socket_path is not None): connection_coroutine = asyncio.open_unix_connection(self.socket_path, **kwargs)
+        elif (self.address_resolver is None): connection_coroutine = asyncio.open_connection(self.host, self.port, **kwargs)
+        else: connection_coroutine = self._open_resolved_connection(**kwargs)
+
+        ( self._reader, self._writer ) = await asyncio.wait_for(connection_coroutine, timeout)
+
+        if (self.socket_options is not None and self.socket_path is None):
+            self.socket_options.apply(self._writer.get_extra_info("socket"), True)
+        #
+    #
+
+    async def _connect_address(self, address):
+        """
+Connects a new non-blocking socket to the given address.
+
+:param address: "getaddrinfo()" result
+
+:return: (object) Connected socket
+:since:  v1.0.0
+        """
+
+        ( family, socket_type, protocol, _, socket_address ) = address
+        _return = socket.socket(family, socket_type, protocol)
+
+        try:
+            if (self.socket_options is not None): self.socket_options.apply(_return)
+
+            _return.setblocking(False)
+            await asyncio.get_event_loop().sock_connect(_return, socket_address)
+        except Exception:
+            _return.close()
+            self.address_resolver.record_address_result(socket_address, True)
+
+            raise
+        except BaseException:
+            _return.close()
+            raise
+        #
+
+        return _return
+    #
+
+    async def _open_resolved_connection(self, **kwargs):
+        """
+Opens the streams for a socket connected to the addresses of the address
+resolver. Addresses are raced as described in RFC 8305.
+
+:return: (tuple) asyncio stream reader and writer
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        loop = asyncio.get_event_loop()
+        addresses = await loop.run_in_executor(None, self.address_resolver.get_addresses, self.host, self.port)
+
+        exception = None
+        pending_tasks = set()
+        sock = None
+
+        try:
+            while (sock is None and (len(addresses) > 0 or len(pending_tasks) > 0)):
+                if (len(addresses) > 0): pending_tasks.add(loop.create_task(self._connect_address(addresses.pop(0))))
+
+                ( done_tasks, pending_tasks ) = await asyncio.wait(pending_tasks,
+                                                                   timeout = (self.address_resolver.connection_attempt_delay if (len(addresses) > 0) else None),
+                                                                   return_when = asyncio.FIRST_COMPLETED
+                                                                  )
+
+                for task in done_tasks:
+                    if (task.exception() is not None): exception = task.exception()
+                    elif (sock is None): sock = task.result()
+                    else: task.result().close()
+                #
+            #
+        finally:
+            for task in pending_tasks: task.cancel()
+        #
+
+        if (sock is None): raise (IOException("No address found for '{0}'".format(self.host)) if (exception is None) else exception)
+
+        return await asyncio.open_connection(sock = sock, **kwargs)
+    #
+
+    async def getresponse(self):
+        """
+Receives the response headers of the request sent before.
+
+:return: (object) AsyncConnectionResponse instance
+:since:  v1.0.0
+        """
+
+        if (self._response is None or self._response.status is not None): raise IOException("No request has been sent before")
+
+        await self._response.begin()
+        return self._response
+    #
+
+    async def request(self, method, url, body = None, headers = None, encode_chunked = False):
+        """
+Sends a request to the HTTP server.
+
+:param method: HTTP method
+:param url: Request path
+:param body: HTTP body; file objects and (asynchronous) iterables are sent
+             as a stream
+:param headers: Request headers
+:param encode_chunked: True to send the streamed body chunked
+                       transfer-encoded
+
+:since: v1.0.0
+        """
+
+        if (self._response is not None and (not self._response.isclosed())): raise IOException("Response of the previous request has not been read")
+        if (not self.is_connected): await self.connect()
+
+        request_headers = { "host": self._host_header, "accept-encoding": "identity" }
+
+        if (headers is not None):
+            for name in headers:
+                value = headers[name]
+                request_headers[name.lower()] = (", ".join(value) if (type(value) is list) else str(value))
+            #
+        #
+
+        is_body_streamed = (body is not None and (not isinstance(body, ( str, Binary.BYTES_TYPE, bytearray ))))
+
+        if (is_body_streamed):
+            if ("content-length" not in request_headers and "transfer-encoding" not in request_headers):
+                request_headers['transfer-encoding'] = "chunked"
+                encode_chunked = True
+            #
+        else:
+            if (body is not None): body = Binary.utf8_bytes(body)
+
+            if ("content-length" not in request_headers
+                and (body is not None or method in ( "PATCH", "POST", "PUT" ))
+               ): request_headers['content-length'] = str(0 if (body is None) else len(body))
+        #
+
+        request_data = "{0} {1} HTTP/1.1\r\n".format(method, url)
+        for name in request_headers: request_data += "{0}: {1}\r\n".format(name, request_headers[name])
+        request_data += "\r\n"
+
+        self._writer.write(Binary.utf8_bytes(request_data))
+
+        if (is_body_streamed): await self._send_streamed_body(body, encode_chunked)
+        elif (body is not None and len(body) > 0): self._writer.write(body)
+
+        self._response = AsyncConnectionResponse(self, self._reader, method)
+
+        await self._writer.drain()
+    #
+
+    async def _send_body_data(self, data, encode_chunked):
+        """
+Sends a part of a streamed body.
+
+:param data: Body data
+:param encode_chunked: True to send the data as a chunk
+
+:since: v1.0.0
+        """
+
+        if (type(data) is str): data = Binary.utf8_bytes(data)
+
+        if (len(data) > 0):
+            if (encode_chunked):
+                self._writer.write(Binary.utf8_bytes("{0:x}\r\n".format(len(data))))
+                self._writer.write(data)
+                self._writer.write(Binary.bytes("\r\n"))
+            else: self._writer.write(data)
+
+            await self._writer.drain()
+        #
+    #
+
+    async def _send_streamed_body(self, body, encode_chunked):
+        """
+Sends the given file object, memoryview or (asynchronous) iterable as body.
+
+:param body: Streamed HTTP body
+:param encode_chunked: True to send the body chunked transfer-encoded
+
+:since: v1.0.0
+        """
+
+        if (hasattr(body, "read")):
+            while True:
+                data = body.read(65536)
+                if (not data): break
+
+                await self._send_body_data(data, encode_chunked)
+            #
+        elif (isinstance(body, memoryview)): await self._send_body_data(body, encode_chunked)
+        elif (hasattr(body, "__aiter__")):
+            async for data in body: await self._send_body_data(data, encode_chunked)
+        else:
+            for data in body: await self._send_body_data(data, encode_chunked)
+        #
+
+        if (encode_chunked): self._writer.write(Binary.bytes("0\r\n\r\n"))
+    #
+#
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+
+from collections import OrderedDict
+from threading import RLock
+from time import time
+
+from dpt_runtime.io_exception import IOException
+
+class AsyncConnectionPool(object):
+    """
+Pool of idle asyncio based HTTP connections keyed by the event loop and
+the connection parameters used to create them. It provides the semantics of
+"ConnectionPool" for coroutines running in the same event loop. Connections
+of closed event loops are discarded. The pool may be shared by event loops
+running in different threads.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_active_counts",
+                  "_borrowed_loop_keys",
+                  "idle_timeout",
+                  "_idle_connections",
+                  "_idle_ids",
+                  "_lock",
+                  "max_connections_per_host",
+                  "max_idle_connections",
+                  "_waiters"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide AsyncConnectionPool instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self, max_connections_per_host = 10, idle_timeout = 60, max_idle_connections = 100):
+        """
+Constructor __init__(AsyncConnectionPool)
+
+:param max_connections_per_host: Maximum number of borrowed connections per
+                                 pool key
+:param idle_timeout: Seconds an idle connection is kept before it is closed
+:param max_idle_connections: Maximum number of idle connections kept in
+                             total; the least recently used ones are closed
+                             first.
+
+:since: v1.0.0
+        """
+
+        self._active_counts = { }
+        """
+Number of borrowed connections per event loop and pool key
+        """
+        self._borrowed_loop_keys = { }
+        """
+Event loop and pool key per borrowed connection ID
+        """
+        self.idle_timeout = idle_timeout
+        """
+Seconds an idle connection is kept before it is closed
+        """
+        self._idle_connections = OrderedDict()
+        """
+Idle connections in least recently used order
+        """
+        self._idle_ids = { }
+        """
+List of idle connection IDs per event loop and pool key
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self.max_connections_per_host = max_connections_per_host
+        """
+Maximum number of borrowed connections per pool key
+        """
+        self.max_idle_connections = max_idle_connections
+        """
+Maximum number of idle connections kept in total
+        """
+        self._waiters = { }
+        """
+Futures of coroutines waiting for a free connection slot per event loop and
+pool key
+        """
+    #
+
+    @property
+    def idle_count(self):
+        """
+Returns the number of idle connections currently pooled.
+
+:return: (int) Number of idle connections
+:since:  v1.0.0
+        """
+
+        with self._lock: return len(self._idle_connections)
+    #
+
+    async def borrow(self, key, factory, timeout = None):
+        """
+Returns an idle connection for the given pool key or a new one created by
+calling the given factory.
+
+:param key: Pool key
+:param factory: Callable returning a new connection
+:param timeout: Seconds to wait for a free connection slot
+
+:return: (object) Connection
+:since:  v1.0.0
+        """
+
+        loop = asyncio.get_event_loop()
+        loop_key = ( loop, key )
+        timeout_time = (None if (timeout is None) else time() + timeout)
+
+        self._remove_closed_loops()
+        self._close_expired_connections()
+
+        while True:
+            waiter = None
+
+            with self._lock:
+                connection = self._pop_idle_connection(loop_key)
+
+                if (connection is None and self._active_counts.get(loop_key, 0) >= self.max_connections_per_host):
+                    waiter = loop.create_future()
+                    self._waiters.setdefault(loop_key, [ ]).append(waiter)
+                else: self._increase_active_count(loop_key)
+            #
+
+            if (waiter is not None):
+                try:
+                    if (timeout_time is None): await waiter
+                    else: await asyncio.wait_for(waiter, max(0, timeout_time - time()))
+                except asyncio.TimeoutError: raise IOException("Timeout occurred while waiting for a pooled connection")
+                finally:
+                    with self._lock: self._remove_waiter(loop_key, waiter)
+                #
+            elif (connection is None):
+                try: connection = factory()
+                except BaseException:
+                    self._decrease_active_count(loop_key)
+                    raise
+                #
+
+                break
+            elif (connection.is_connected): break
+            else:
+                connection.close()
+                self._decrease_active_count(loop_key)
+            #
+        #
+
+        with self._lock: self._borrowed_loop_keys[id(connection)] = loop_key
+        return connection
+    #
+
+    def clear(self):
+        """
+Closes all idle connections.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            entries = list(self._idle_connections.values())
+
+            self._idle_connections.clear()
+            self._idle_ids.clear()
+        #
+
+        for ( loop_key, connection, _ ) in entries: self._close_connection(loop_key, connection)
+    #
+
+    def _close_expired_connections(self):
+        """
+Closes idle connections exceeding the idle timeout.
+
+:since: v1.0.0
+        """
+
+        expired_entries = [ ]
+
+        if (self.idle_timeout is not None):
+            expiry_time = time() - self.idle_timeout
+
+            with self._lock:
+                while (len(self._idle_connections) > 0):
+                    connection_id = next(iter(self._idle_connections))
+                    ( loop_key, _, idle_time ) = self._idle_connections[connection_id]
+
+                    if (idle_time > expiry_time): break
+                    expired_entries.append(( loop_key, self._remove_idle_connection(connection_id) ))
+                #
+            #
+        #
+
+        for ( loop_key, connection ) in expired_entries: self._close_connection(loop_key, connection)
+    #
+
+    @staticmethod
+    def _close_connection(loop_key, connection):
+        """
+Closes the given idle connection in its event loop. Connections of a closed
+event loop can not be closed anymore and are left to the garbage collector.
+
+:param loop_key: Tuple of the event loop and pool key
+:param connection: Connection
+
+:since: v1.0.0
+        """
+
+        loop = loop_key[0]
+
+        if (AsyncConnectionPool._is_running_loop(loop)): connection.close()
+        elif (not loop.is_closed()): loop.call_soon_threadsafe(connection.close)
+    #
+
+    def _decrease_active_count(self, loop_key):
+        """
+Decreases the number of borrowed connections for the given event loop and
+pool key and wakes up all coroutines waiting for it. Each of them checks
+again if it may borrow a connection so that a slot is not lost if a woken up
+one has been cancelled in the meantime.
+
+:param loop_key: Tuple of the event loop and pool key
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            active_count = self._active_counts.get(loop_key, 0) - 1
+
+            if (active_count > 0): self._active_counts[loop_key] = active_count
+            elif (loop_key in self._active_counts): del(self._active_counts[loop_key])
+
+            waiters = list(self._waiters.get(loop_key, [ ]))
+        #
+
+        if (len(waiters) > 0):
+            loop = loop_key[0]
+
+            if (self._is_running_loop(loop)): self._wake_waiters(waiters)
+            elif (not loop.is_closed()): loop.call_soon_threadsafe(self._wake_waiters, waiters)
+        #
+    #
+
+    def discard(self, key, connection):
+        """
+Closes a borrowed connection instead of returning it to the pool.
+
+:param key: Pool key
+:param connection: Borrowed connection
+
+:since: v1.0.0
+        """
+
+        self.release(key, connection, False)
+    #
+
+    def _increase_active_count(self, loop_key):
+        """
+Increases the number of borrowed connections for the given event loop and
+pool key. Must be called with the lock held.
+
+:param loop_key: Tuple of the event loop and pool key
+
+:since: v1.0.0
+        """
+
+        self._active_counts[loop_key] = 1 + self._active_counts.get(loop_key, 0)
+    #
+
+    def _pop_idle_connection(self, loop_key):
+        """
+Removes and returns the most recently used idle connection for the given
+event loop and pool key. Must be called with the lock held.
+
+:param loop_key: Tuple of the event loop and pool key
+
+:return: (object) Connection; None if not available
+:since:  v1.0.0
+        """
+
+        idle_ids = self._idle_ids.get(loop_key)
+        return (None if (idle_ids is None) else self._remove_idle_connection(idle_ids[-1]))
+    #
+
+    def release(self, key, connection, is_reusable = True):
+        """
+Returns a borrowed connection to the pool. The connection is accounted for
+the event loop it has been borrowed in. Connections of closed event loops
+have been removed from the pool already and are ignored.
+
+:param key: Pool key
+:param connection: Borrowed connection
+:param is_reusable: False if the connection should be closed
+
+:since: v1.0.0
+        """
+
+        with self._lock: loop_key = self._borrowed_loop_keys.pop(id(connection), None)
+
+        if (loop_key is None): return
+
+        evicted_entries = [ ]
+
+        if (is_reusable and connection.is_connected and (not loop_key[0].is_closed())):
+            with self._lock:
+                connection_id = id(connection)
+
+                self._idle_connections[connection_id] = ( loop_key, connection, time() )
+                self._idle_ids.setdefault(loop_key, [ ]).append(connection_id)
+
+                while (len(self._idle_connections) > self.max_idle_connections):
+                    connection_id = next(iter(self._idle_connections))
+                    evicted_entries.append(( self._idle_connections[connection_id][0], self._remove_idle_connection(connection_id) ))
+                #
+            #
+        else: evicted_entries.append(( loop_key, connection ))
+
+        for ( evicted_loop_key, evicted_connection ) in evicted_entries: self._close_connection(evicted_loop_key, evicted_connection)
+        self._decrease_active_count(loop_key)
+    #
+
+    def _remove_idle_connection(self, connection_id):
+        """
+Removes the idle connection with the given ID. Must be called with the lock
+held.
+
+:param connection_id: Idle connection ID
+
+:return: (object) Connection
+:since:  v1.0.0
+        """
+
+        ( loop_key, _return, _ ) = self._idle_connections.pop(connection_id)
+
+        idle_ids = self._idle_ids[loop_key]
+        idle_ids.remove(connection_id)
+        if (len(idle_ids) < 1): del(self._idle_ids[loop_key])
+
+        return _return
+    #
+
+    def _remove_closed_loops(self):
+        """
+Removes idle connections, borrowed connection counts and waiters of closed
+event loops.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            for connection_id in [ connection_id for ( connection_id, entry ) in self._idle_connections.items() if entry[0][0].is_closed() ]:
+                self._remove_idle_connection(connection_id)
+            #
+
+            for connection_id in [ connection_id for ( connection_id, loop_key ) in self._borrowed_loop_keys.items() if loop_key[0].is_closed() ]:
+                del(self._borrowed_loop_keys[connection_id])
+            #
+
+            for loop_key in [ loop_key for loop_key in self._active_counts if loop_key[0].is_closed() ]: del(self._active_counts[loop_key])
+            for loop_key in [ loop_key for loop_key in self._waiters if loop_key[0].is_closed() ]: del(self._waiters[loop_key])
+        #
+    #
+
+    def _remove_waiter(self, loop_key, waiter):
+        """
+Removes the given waiter future. Must be called with the lock held.
+
+:param loop_key: Tuple of the event loop and pool key
+:param waiter: Waiter future
+
+:since: v1.0.0
+        """
+
+        waiters = self._waiters.get(loop_key)
+
+        if (waiters is not None and waiter in waiters):
+            waiters.remove(waiter)
+            if (len(waiters) < 1): del(self._waiters[loop_key])
+        #
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide AsyncConnectionPool instance.
+
+:return: (object) AsyncConnectionPool instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+
+    @staticmethod
+    def _is_running_loop(loop):
+        """
+Returns true if the given event loop is the one running in the current
+thread.
+
+:param loop: Event loop
+
+:return: (bool) True if running in the current thread
+:since:  v1.0.0
+        """
+
+        try: return (asyncio.get_running_loop() is loop)
+        except RuntimeError: return False
+    #
+
+    @staticmethod
+    def _wake_waiters(waiters):
+        """
+Wakes up the coroutines waiting with the given futures. Must be called in
+the event loop of the futures.
+
+:param waiters: List of waiter futures
+
+:since: v1.0.0
+        """
+
+        for waiter in waiters:
+            if (not waiter.done()): waiter.set_result(None)
+        #
+    #
+#
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+
+class AsyncConnectionResponse(object):
+    """
+HTTP/1.1 response received on an asyncio based connection. Chunked
+transfer-encoded data is decoded while reading.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    MAX_HEADERS = 100
+    """
+Maximum number of response headers accepted
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_chunk_left",
+                  "_connection",
+                  "_headers",
+                  "_is_chunked",
+                  "_is_closed",
+                  "_length",
+                  "_method",
+                  "_reader",
+                  "reason",
+                  "status",
+                  "will_close"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, connection, reader, method):
+        """
+Constructor __init__(AsyncConnectionResponse)
+
+:param connection: AsyncConnection instance
+:param reader: asyncio stream reader
+:param method: HTTP method of the request
+
+:since: v1.0.0
+        """
+
+        self._chunk_left = None
+        """
+Bytes left to read of the current chunk
+        """
+        self._connection = connection
+        """
+AsyncConnection instance
+        """
+        self._headers = [ ]
+        """
+List of response header tuples
+        """
+        self._is_chunked = False
+        """
+True if the body is chunked transfer-encoded
+        """
+        self._is_closed = False
+        """
+True if the body has been read completely
+        """
+        self._length = None
+        """
+Bytes left to read of the body; None if unknown
+        """
+        self._method = method
+        """
+HTTP method of the request
+        """
+        self._reader = reader
+        """
+asyncio stream reader
+        """
+        self.reason = None
+        """
+HTTP status reason phrase
+        """
+        self.status = None
+        """
+HTTP status code
+        """
+        self.will_close = False
+        """
+True if the connection is closed after the response
+        """
+    #
+
+    async def begin(self):
+        """
+Receives and parses the status line and headers.
+
+:since: v1.0.0
+        """
+
+        while True:
+            status_line = Binary.str(await self._reader.readline())
+            status_data = status_line.strip().split(" ", 2)
+
+            if (len(status_data) < 2 or (not status_data[0].startswith("HTTP/"))): raise IOException("Invalid HTTP status line received")
+
+            version = status_data[0]
+            status = int(status_data[1])
+            self.reason = (status_data[2] if (len(status_data) > 2) else "")
+
+            headers = await self._read_headers()
+
+            if (status >= 200 or status == 101): break
+        #
+
+        self.status = status
+        self._headers = headers
+
+        connection_header = (self.getheader("connection") or "").lower()
+        transfer_encoding = (self.getheader("transfer-encoding") or "").lower()
+        content_length = self.getheader("content-length")
+
+        self.will_close = ("close" in connection_header
+                           or (version == "HTTP/1.0" and "keep-alive" not in connection_header)
+                          )
+
+        if (self._method == "HEAD" or status in ( 204, 304 ) or status < 200): self._length = 0
+        elif ("chunked" in transfer_encoding): self._is_chunked = True
+        elif (content_length is not None): self._length = int(content_length)
+        else: self.will_close = True
+
+        if (self._length == 0): self._close()
+    #
+
+    def _close(self):
+        """
+Marks the body as read completely and closes the connection if required.
+
+:since: v1.0.0
+        """
+
+        self._is_closed = True
+        if (self.will_close): self._connection.close()
+    #
+
+    def close(self):
+        """
+Closes the response. The connection is closed if the body has not been
+read completely.
+
+:since: v1.0.0
+        """
+
+        if (not self._is_closed):
+            self.will_close = True
+            self._close()
+        #
+    #
+
+    def getheader(self, name, default = None):
+        """
+Returns the value of the given response header.
+
+:param name: Header name
+:param default: Default value
+
+:return: (str) Header value
+:since:  v1.0.0
+        """
+
+        name = name.lower()
+        values = [ header[1] for header in self._headers if header[0].lower() == name ]
+
+        return (", ".join(values) if (len(values) > 0) else default)
+    #
+
+    def getheaders(self):
+        """
+Returns the response headers.
+
+:return: (list) List of header tuples
+:since:  v1.0.0
+        """
+
+        return self._headers[:]
+    #
+
+    def isclosed(self):
+        """
+Returns true if the body has been read completely or the response has been
+closed.
+
+:return: (bool) True if closed
+:since:  v1.0.0
+        """
+
+        return self._is_closed
+    #
+
+    async def read(self, n = None):
+        """
+Reads data of the response body.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        if (self._is_closed): _return = Binary.BYTES_TYPE()
+        elif (self._is_chunked): _return = await self._read_chunked(n)
+        elif (self._length is None):
+            _return = await self._reader.read(-1 if (n is None) else n)
+            if (n is None or len(_return) < 1): self._close()
+        else:
+            if (n is None or n > self._length): n = self._length
+
+            _return = await self._reader.readexactly(n)
+            self._length -= n
+
+            if (self._length < 1): self._close()
+        #
+
+        return _return
+    #
+
+    async def read1(self, n):
+        """
+Reads data of the response body with at most one read of the underlying
+stream.
+
+:param n: Maximum number of bytes to read
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        if (self._is_closed): _return = Binary.BYTES_TYPE()
+        elif (self._is_chunked):
+            _return = Binary.BYTES_TYPE()
+            if (self._chunk_left is None): await self._read_chunk_size()
+
+            if (self._chunk_left is not None):
+                _return = await self._reader.read(min(self._chunk_left, n))
+                if (len(_return) < 1): raise IOException("Stream has been closed before EOF")
+
+                self._chunk_left -= len(_return)
+
+                if (self._chunk_left < 1):
+                    await self._reader.readexactly(2)
+                    self._chunk_left = None
+                #
+            #
+        elif (self._length is None):
+            _return = await self._reader.read(n)
+            if (len(_return) < 1): self._close()
+        else:
+            _return = await self._reader.read(min(n, self._length))
+            if (len(_return) < 1): raise IOException("Stream has been closed before EOF")
+
+            self._length -= len(_return)
+            if (self._length < 1): self._close()
+        #
+
+        return _return
+    #
+
+    async def _read_chunked(self, n = None):
+        """
+Reads and decodes chunked transfer-encoded data.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        data_list = [ ]
+        size_read = 0
+
+        while (n is None or size_read < n):
+            if (self._chunk_left is None):
+                await self._read_chunk_size()
+                if (self._chunk_left is None): break
+            #
+
+            part_size = (self._chunk_left if (n is None) else min(self._chunk_left, n - size_read))
+
+            data_list.append(await self._reader.readexactly(part_size))
+            size_read += part_size
+            self._chunk_left -= part_size
+
+            if (self._chunk_left < 1):
+                await self._reader.readexactly(2)
+                self._chunk_left = None
+            #
+        #
+
+        return Binary.BYTES_TYPE().join(data_list)
+    #
+
+    async def _read_chunk_size(self):
+        """
+Reads the size line of the next chunk. The trailer fields are read and the
+response is closed after the last chunk.
+
+:since: v1.0.0
+        """
+
+        chunk_octets = (await self._reader.readline()).split(Binary.bytes(";"), 1)[0].strip()
+        if (len(chunk_octets) < 1): raise IOException("Invalid chunk size received")
+
+        self._chunk_left = int(chunk_octets, 16)
+
+        if (self._chunk_left == 0):
+            self._chunk_left = None
+
+            await self._read_headers()
+            self._close()
+        #
+    #
+
+    async def _read_headers(self):
+        """
+Reads header lines until an empty line is received. Used for response
+headers and chunked trailers.
+
+:return: (list) List of header tuples
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        while True:
+            header_line = await self._reader.readline()
+
+            if (len(header_line) < 1): raise IOException("Connection closed while receiving headers")
+            header_line = Binary.str(header_line).rstrip("\r\n")
+            if (header_line == ""): break
+
+            if (len(_return) >= AsyncConnectionResponse.MAX_HEADERS): raise IOException("Too many headers received")
+
+            header_data = header_line.split(":", 1)
+            if (len(header_data) == 2): _return.append(( header_data[0].strip(), header_data[1].strip() ))
+        #
+
+        return _return
+    #
+#
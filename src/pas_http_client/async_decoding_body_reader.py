@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .decoding_body_reader import DecodingBodyReader
+
+class AsyncDecodingBodyReader(DecodingBodyReader):
+    """
+Awaitable body reader decoding content-coded data read from an awaitable
+source reader incrementally.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    async def __call__(self, n = None):
+        """
+python.org: Called when the instance is "called" as a function.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        data = bytearray()
+
+        while ((not self._is_eof) and (n is None or len(data) < n)):
+            encoded_data = ((await self._source(self.buffer_size)) if (not self._decoder.is_pending) else None)
+            data += self._decode(encoded_data, (self.buffer_size if (n is None) else n - len(data)))
+        #
+
+        return bytes(data)
+    #
+#
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+
+from functools import partial
+from time import time
+
+try: import http.client as http_client
+except ImportError: import httplib as http_client
+
+from dpt_runtime.io_exception import IOException
+
+from .async_body_reader import AsyncBodyReader
+from .async_caching_body_reader import AsyncCachingBodyReader
+from .async_connection_pool import AsyncConnectionPool
+from .async_decoding_body_reader import AsyncDecodingBodyReader
+from .raw_client import RawClient
+from .request_deadline import RequestDeadline
+
+class AsyncRawClient(RawClient):
+    """
+Minimal asyncio based HTTP client abstraction layer returning raw HTTP
+responses. All request methods are coroutines.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    _caching_body_reader_class = AsyncCachingBodyReader
+    """
+Body reader class used to store responses in the response cache
+    """
+    _decoding_body_reader_class = AsyncDecodingBodyReader
+    """
+Body reader class used to decode content-coded bodies
+    """
+
+    def __init__(self, url, timeout = 30, return_reader = False, log_handler = None):
+        """
+Constructor __init__(AsyncRawClient)
+
+:param url: URL to be called
+:param timeout: Socket timeout in seconds
+:param return_reader: Returns a body reader instead of reading the response
+                      if true.
+:param log_handler: Log handler to use
+
+:since: v1.0.0
+        """
+
+        RawClient.__init__(self, url, timeout, return_reader, log_handler)
+        self._connection_pool = AsyncConnectionPool.get_instance()
+    #
+
+    async def _acquire_request_limits(self, deadline, request_count = 1):
+        """
+Acquires a token of the rate limiter per request and a slot of the
+concurrency limiter before a connection is used without blocking the event
+loop. Blocking limiters wait until the request deadline at most.
+
+:param deadline: RequestDeadline limiting the time to wait
+:param request_count: Number of requests sent on the connection
+
+:since: v1.0.0
+        """
+
+        host_key = self._host_key
+        concurrency_limiter = self._concurrency_limiter
+        rate_limiter = self._rate_limiter
+
+        if (rate_limiter is not None):
+            for _ in range(request_count):
+                delay = rate_limiter.reserve(host_key, (deadline.get_timeout(None) if (rate_limiter.is_blocking) else 0))
+                if (delay is None): raise IOException("Rate limit for {0!r} exceeded".format(host_key))
+
+                if (delay > 0): await asyncio.sleep(delay)
+            #
+        #
+
+        if (concurrency_limiter is not None
+            and (not await concurrency_limiter.acquire_async(host_key, timeout = deadline.get_timeout(None)))
+           ): raise IOException("Concurrency limit for {0!r} reached".format(host_key))
+    #
+
+    async def _connect(self, connection, deadline):
+        """
+Connects the given asyncio based connection applying the connect and
+SSL/TLS handshake timeouts.
+
+:param connection: AsyncConnection instance
+:param deadline: RequestDeadline limiting the time to connect
+
+:since: v1.0.0
+        """
+
+        connection.timeout = self._get_phase_timeout(self._connect_timeout)
+        if (hasattr(connection, "ssl_handshake_timeout")): connection.ssl_handshake_timeout = self._get_phase_timeout(self._tls_handshake_timeout)
+
+        try: await asyncio.wait_for(connection.connect(), deadline.get_timeout(None))
+        finally: connection.timeout = self.timeout
+    #
+
+    async def _get_connection(self, deadline = None):
+        """
+Returns a connection to the HTTP server. Connections are borrowed from the
+connection pool if one is set and connected before being returned.
+
+:param deadline: RequestDeadline limiting the time to wait and connect
+
+:return: (object) AsyncConnection instance
+:since:  v1.0.0
+        """
+
+        if (deadline is None): deadline = RequestDeadline()
+
+        connection_pool = self._connection_pool
+        connection_pool_key = self._connection_pool_key
+
+        if (connection_pool is None):
+            if (self.connection is None): self.connection = self._new_connection()
+        else: self.connection = await connection_pool.borrow(connection_pool_key, self._new_connection, deadline.get_timeout(self.timeout))
+
+        connection = self.connection
+
+        if (hasattr(connection, "is_connected") and (not connection.is_connected)):
+            try: await self._connect(connection, deadline)
+            except BaseException:
+                self._release_connection(connection_pool, connection_pool_key, connection, False)
+                raise
+            #
+        #
+
+        return connection
+    #
+
+    def _new_cached_raw_response(self, method, cache_entry):
+        """
+Returns the raw response dict for the given response cache entry.
+
+:param method: HTTP method
+:param cache_entry: ResponseCacheEntry instance
+
+:return: (dict) Response data
+:since:  v1.0.0
+        """
+
+        _return = RawClient._new_cached_raw_response(self, method, cache_entry)
+
+        if ("body_reader" in _return):
+            read = _return['body_reader']
+
+            async def body_reader(n = None):
+                """
+Returns the data read from the cached body.
+                """
+
+                return read(n)
+            #
+
+            _return['body_reader'] = body_reader
+        #
+
+        return _return
+    #
+
+    def _new_connection(self):
+        """
+Returns a new asyncio based connection to the HTTP server.
+
+:return: (object) AsyncConnection instance
+:since:  v1.0.0
+        """
+
+        _return = self.connection_factory.create_async_connection(self, self._connection_host, self.port, self.timeout)
+        if (self._address_resolver is not None and hasattr(_return, "address_resolver")): _return.address_resolver = self._address_resolver
+        if (self._socket_options is not None and hasattr(_return, "socket_options")): _return.socket_options = self._socket_options
+
+        return _return
+    #
+
+    async def request(self, method, separator = ";", params = None, data = None):
+        """
+Call a given request method on the connected HTTP server. Failed requests
+are sent again as defined by the retry policy.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+:param data: HTTP body
+
+:return: (dict) Response data; 'body' may contain the catched exception
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,star-args
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.request({1})- (#echo(__LINE__)#)", self, method)
+
+        try:
+            kwargs = self._get_request_kwargs(separator, params, data)
+            _return = await (self._request(method, **kwargs) if (self._retry_policy is None) else self._request_retried(method, kwargs))
+        except Exception as handled_exception: _return = { "code": None, "headers": None, "body": handled_exception }
+
+        return _return
+    #
+
+    async def _request(self, method, deadline = None, **kwargs):
+        """
+Sends the request to the connected HTTP server and returns the result.
+Cancelled requests are not recorded as failures of the host.
+
+:param method: HTTP method
+:param deadline: Deadline shared by all attempts of the request; None to
+                 create one based on the total timeout
+
+:return: (dict) Response data; 'body' may contain the catched Exception
+:since:  v1.0.0
+        """
+
+        # pylint: disable=star-args
+
+        ( _return, cache_entry ) = self._get_cached_raw_response(method, kwargs)
+        if (_return is not None): return _return
+
+        if (deadline is None): deadline = RequestDeadline(self._total_timeout)
+
+        await self._acquire_request_limits(deadline)
+
+        try: is_probe = (False if (self._circuit_breaker is None) else self._circuit_breaker.acquire(self._host_key))
+        except Exception:
+            self._release_request_limits(False)
+            raise
+        #
+
+        request_time = time()
+
+        connection_pool = self._connection_pool
+        connection_pool_key = self._connection_pool_key
+
+        try: connection = await self._get_connection(deadline)
+        except asyncio.CancelledError:
+            self._release_request_limits(is_probe)
+            raise
+        except BaseException:
+            self._record_request_result(request_time, None, is_probe)
+            raise
+        #
+
+        peer_address = (None if (self._address_resolver is None) else getattr(connection, "peer_address", None))
+
+        try:
+            await asyncio.wait_for(connection.request(method, **kwargs), deadline.get_timeout(None))
+            response = await asyncio.wait_for(connection.getresponse(), deadline.get_timeout(self._get_phase_timeout(self._first_byte_timeout)))
+        except asyncio.TimeoutError:
+            self._release_connection(connection_pool, connection_pool_key, connection, False)
+            self._record_request_result(request_time, None, is_probe, peer_address)
+
+            raise IOException("Timeout occurred while waiting for the response")
+        except asyncio.CancelledError:
+            self._release_connection(connection_pool, connection_pool_key, connection, False)
+            self._release_request_limits(is_probe)
+
+            raise
+        except BaseException:
+            self._release_connection(connection_pool, connection_pool_key, connection, False)
+            self._record_request_result(request_time, None, is_probe, peer_address)
+
+            raise
+        #
+
+        self._record_request_result(request_time, response.status, is_probe, peer_address)
+
+        _return = { "code": response.status, "headers": { }, "body": None }
+        for header in response.getheaders(): _return['headers'][header[0].lower().replace("-", "_")] = header[1]
+
+        body_reader = AsyncBodyReader(response,
+                                      partial(self._release_connection, connection_pool, connection_pool_key, connection),
+                                      deadline = deadline,
+                                      read_idle_timeout = self._get_phase_timeout(self._read_idle_timeout)
+                                     )
+
+        revalidated_response = self._get_revalidated_raw_response(method, kwargs, cache_entry, response, _return['headers'], request_time)
+
+        if (revalidated_response is not None):
+            await body_reader()
+            return revalidated_response
+        #
+
+        body_reader = self._get_caching_body_reader(method, kwargs, response, _return['headers'], body_reader, request_time)
+        body_decoder = self._get_body_decoder(method, response.getheader("content-encoding"))
+
+        if (self._return_reader):
+            _return['body_reader'] = body_reader
+            if (body_decoder is not None): _return['body_decoder'] = body_decoder
+        #
+
+        if (response.status < 100 or response.status >= 400):
+            _return['body'] = http_client.HTTPException("{0} {1}".format(str(response.status), str(response.reason)), response.status)
+
+            if (not self._return_reader):
+                error_body = await body_reader()
+                if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -AsyncRawClient._request()- reporting: {0:d} for '{1}'", response.status, error_body)
+            #
+        elif (method != "HEAD" and (not self._return_reader)):
+            _return['body'] = await (body_reader() if (body_decoder is None) else body_decoder(body_reader)())
+        #
+
+        return _return
+    #
+
+    async def _request_retried(self, method, kwargs):
+        """
+Sends the request and repeats it as defined by the retry policy. All
+attempts share the deadline of the request. Cancelled requests are not
+repeated.
+
+:param method: HTTP method
+:param kwargs: Keyword arguments for "_request()"
+
+:return: (dict) Response data of the last attempt
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,star-args
+
+        body_position = self._get_body_replay_position(kwargs.get("body"))
+        deadline = RequestDeadline(self._total_timeout)
+        retry_count = 0
+
+        if (self._retry_policy.budget is not None): self._retry_policy.budget.deposit(self._host_key)
+
+        while True:
+            exception = None
+            retry_count += 1
+
+            try: _return = await self._request(method, deadline, **kwargs)
+            except Exception as handled_exception:
+                _return = None
+                exception = handled_exception
+            #
+
+            delay = (None if (body_position is None or self._is_cancelled) else self._get_retry_delay(method, retry_count, _return, exception, deadline))
+            if (delay is None): break
+
+            if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -AsyncRawClient._request_retried()- retrying {0} in {1:.3f} seconds", method, delay)
+
+            self._prepare_retry(kwargs, body_position, _return)
+            if (delay > 0): await asyncio.sleep(delay)
+        #
+
+        if (exception is not None): raise exception
+        return _return
+    #
+#
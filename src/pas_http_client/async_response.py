@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .chunked_reader_mixin import ChunkedReaderMixin
+from .response import Response
+
+class AsyncResponse(Response):
+    """
+HTTP response object of the asyncio based client. The body is read with
+coroutines.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    async def iter_content(self, chunk_size = 65536):
+        """
+Returns an asynchronous generator yielding the response body in parts of
+the given size.
+
+:param chunk_size: Maximum size of each part
+
+:return: (object) Asynchronous generator yielding bytes
+:since:  v1.0.0
+        """
+
+        while True:
+            data = await self.read(chunk_size)
+            if (not data): break
+
+            yield data
+        #
+    #
+
+    async def iter_lines(self, chunk_size = 65536, delimiter = None):
+        """
+Returns an asynchronous generator yielding the response body line by line.
+Lines are returned without the line terminator.
+
+:param chunk_size: Maximum size of each part read
+:param delimiter: Line delimiter; None for LF and CRLF
+
+:return: (object) Asynchronous generator yielding bytes
+:since:  v1.0.0
+        """
+
+        line_delimiter = (ChunkedReaderMixin.BINARY_NEWLINE[-1:] if (delimiter is None) else delimiter)
+        pending_data = bytearray()
+
+        async for data in self.iter_content(chunk_size):
+            pending_data += data
+            lines = pending_data.split(line_delimiter)
+            pending_data = lines.pop()
+
+            for line in lines: yield self._get_line_bytes(line, delimiter is None)
+        #
+
+        if (len(pending_data) > 0): yield self._get_line_bytes(pending_data, delimiter is None)
+    #
+
+    async def read(self, n = 0):
+        """
+Reads data using the given body reader. Chunked transfer-encoded and
+content-coded data is handled automatically.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        body_reader = (self._body_reader if (self._decoding_reader is None) else self._decoding_reader)
+        return await (body_reader() if (n < 1) else body_reader(n))
+    #
+
+    async def readinto(self, buffer):
+        """
+Reads data into the given writable buffer.
+
+:param buffer: Writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        buffer_view = memoryview(buffer)
+
+        data = await self.read(len(buffer_view))
+        _return = len(data)
+
+        buffer_view[:_return] = data
+        return _return
+    #
+#
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+import os
+import ssl
+
+from selectors import DefaultSelector, EVENT_READ
+
+from dpt_runtime.io_exception import IOException
+
+class BodyReader(object):
+    """
+Callable body reader releasing the underlying connection as soon as the
+response body has been read completely.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    READ_BLOCK_SIZE = 65536
+    """
+Number of bytes read at once while reading until EOF in parts
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_deadline",
+                  "_is_raw_chunked",
+                  "_read_idle_timeout",
+                  "_release_callback",
+                  "_response",
+                  "_sock"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, response, release_callback = None, is_raw_chunked_reading = False, sock = None, deadline = None, read_idle_timeout = None):
+        """
+Constructor __init__(BodyReader)
+
+:param response: HTTP response object of "http.client"
+:param release_callback: Callback called with "is_reusable" as soon as the
+                         connection is no longer used by this reader
+:param is_raw_chunked_reading: True to provide the raw socket reader for
+                               chunked transfer-encoded bodies
+:param sock: Socket the response is received on
+:param deadline: RequestDeadline limiting the time reading the body may take
+:param read_idle_timeout: Seconds to wait for each read to receive data
+
+:since: v1.0.0
+        """
+
+        self._deadline = deadline
+        """
+RequestDeadline limiting the time reading the body may take
+        """
+        self._is_raw_chunked = (is_raw_chunked_reading and getattr(response, "chunked", False))
+        """
+True if the chunked transfer-encoded body is read from the raw socket
+        """
+        self._read_idle_timeout = read_idle_timeout
+        """
+Seconds to wait for each read to receive data
+        """
+        self._release_callback = release_callback
+        """
+Callback called with "is_reusable" after EOF or on close
+        """
+        self._response = response
+        """
+HTTP response object
+        """
+        self._sock = sock
+        """
+Socket the response is received on
+        """
+
+        if (response.isclosed()): self._release(True)
+    #
+
+    def __call__(self, n = None):
+        """
+python.org: Called when the instance is "called" as a function.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        try:
+            if (self._deadline is not None
+                and self._deadline.expiry_time is not None
+                and hasattr(self._response, "read1")
+               ): _return = self._read_until_deadline(n)
+            else:
+                self.apply_read_timeout()
+                _return = (self._response.read() if (n is None) else self._response.read(n))
+            #
+        except Exception:
+            self.close()
+            raise
+        #
+
+        if (self._response.isclosed()): self._release(True)
+        return _return
+    #
+
+    def __del__(self):
+        """
+Destructor __del__(BodyReader)
+
+:since: v1.0.0
+        """
+
+        self.close()
+    #
+
+    @property
+    def deadline(self):
+        """
+Returns the deadline limiting the time reading the body may take.
+
+:return: (object) RequestDeadline instance; None if not limited
+:since:  v1.0.0
+        """
+
+        return self._deadline
+    #
+
+    @property
+    def is_eof(self):
+        """
+Returns true if the response body has been read completely.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return self._response.isclosed()
+    #
+
+    @property
+    def is_raw_chunked(self):
+        """
+Returns true if the chunked transfer-encoded body should be decoded by the
+caller reading from "raw_file".
+
+:return: (bool) True if raw chunked
+:since:  v1.0.0
+        """
+
+        return self._is_raw_chunked
+    #
+
+    @property
+    def raw_file(self):
+        """
+Returns the raw socket reader of the response.
+
+:return: (object) File-like object; None if closed
+:since:  v1.0.0
+        """
+
+        return self._response.fp
+    #
+
+    def apply_read_timeout(self):
+        """
+Sets the socket timeout for the next read to the read idle timeout limited
+by the time left until the deadline.
+
+:return: (float) Socket timeout in seconds; None for no timeout
+:since:  v1.0.0
+        """
+
+        if (self._deadline is None): _return = (None if (self._sock is None) else self._sock.gettimeout())
+        else:
+            _return = self._deadline.get_timeout(self._read_idle_timeout)
+            if (self._sock is not None): self._sock.settimeout(_return)
+        #
+
+        return _return
+    #
+
+    def close(self):
+        """
+Closes the body reader. The connection is not reused if the response body
+has not been read completely.
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._release_callback is not None):
+            is_reusable = self._response.isclosed()
+
+            if (not is_reusable):
+                try: self._response.close()
+                except Exception: pass
+            #
+
+            self._release(is_reusable)
+        #
+    #
+
+    def mark_eof(self):
+        """
+Marks the body as read completely after it has been decoded from
+"raw_file" and releases the connection for reuse.
+
+:since: v1.0.0
+        """
+
+        if (not self._response.isclosed()): self._response.close()
+        self._release(True)
+    #
+
+    def readinto(self, buffer):
+        """
+Reads data into the given writable buffer.
+
+:param buffer: Writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.0
+        """
+
+        try:
+            self.apply_read_timeout()
+            _return = self._response.readinto(buffer)
+        except Exception:
+            self.close()
+            raise
+        #
+
+        if (self._response.isclosed()): self._release(True)
+        return _return
+    #
+
+    def splice_to(self, fd, progress_callback = None, buffer_size = 65536):
+        """
+Moves the remaining response body from the socket to the given file
+descriptor using "os.splice()" without copying it to user space. This is
+only possible for plaintext connections and bodies of known length.
+
+:param fd: File descriptor to write to
+:param progress_callback: Callback called with the number of bytes written
+                          so far
+:param buffer_size: Maximum number of bytes moved per call
+
+:return: (int) Number of bytes written; None if splicing is not supported
+:since:  v1.0.0
+        """
+
+        response = self._response
+
+        if ((not hasattr(os, "splice"))
+            or self._sock is None
+            or isinstance(self._sock, ssl.SSLSocket)
+            or self._is_raw_chunked
+            or response.isclosed()
+            or response.chunked
+            or response.length is None
+           ): return None
+
+        buffered_data = response.fp.peek(1)
+        if (len(buffered_data) > response.length): return None
+
+        _return = 0
+
+        try:
+            if (len(buffered_data) > 0):
+                _return = self._write_to_fd(fd, response.read(len(buffered_data)))
+                if (progress_callback is not None): progress_callback(_return)
+            #
+
+            if (response.length is not None and response.length > 0):
+                _return += self._splice_socket_to_fd(fd, response.length, progress_callback, _return, buffer_size)
+                response.length = 0
+            #
+        except Exception:
+            self.close()
+            raise
+        #
+
+        self.mark_eof()
+        return _return
+    #
+
+    def _splice_socket_to_fd(self, fd, size, progress_callback, size_written, buffer_size):
+        """
+Moves the given number of bytes from the socket to the file descriptor.
+
+:param fd: File descriptor to write to
+:param size: Number of bytes to move
+:param progress_callback: Callback called with the number of bytes written
+                          so far
+:param size_written: Number of bytes already written before
+:param buffer_size: Maximum number of bytes moved per call
+
+:return: (int) Number of bytes written
+:since:  v1.0.0
+        """
+
+        # pylint: disable=no-member
+
+        _return = 0
+
+        sock_fd = self._sock.fileno()
+        ( pipe_read_fd, pipe_write_fd ) = os.pipe()
+        selector = None
+
+        try:
+            while (_return < size):
+                try: pipe_size = os.splice(sock_fd, pipe_write_fd, min(buffer_size, size - _return))
+                except BlockingIOError:
+                    if (selector is None):
+                        selector = DefaultSelector()
+                        selector.register(sock_fd, EVENT_READ)
+                    #
+
+                    if (len(selector.select(self.apply_read_timeout())) < 1): raise IOException("Timeout occurred before EOF")
+                    continue
+                #
+
+                if (pipe_size < 1): raise IOException("Socket has been closed before EOF")
+
+                while (pipe_size > 0):
+                    spliced_size = os.splice(pipe_read_fd, fd, pipe_size)
+                    pipe_size -= spliced_size
+                    _return += spliced_size
+                #
+
+                if (progress_callback is not None): progress_callback(size_written + _return)
+            #
+        finally:
+            if (selector is not None): selector.close()
+
+            os.close(pipe_read_fd)
+            os.close(pipe_write_fd)
+        #
+
+        return _return
+    #
+
+    def _read_until_deadline(self, n = None):
+        """
+Reads data with one socket read at most per call of "read1()" to check the
+deadline before each of them.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        _return = bytearray()
+
+        while ((n is None or len(_return) < n) and (not self._response.isclosed())):
+            self.apply_read_timeout()
+
+            data = self._response.read1(self.__class__.READ_BLOCK_SIZE if (n is None) else n - len(_return))
+            if (not data): break
+
+            _return += data
+        #
+
+        return bytes(_return)
+    #
+
+    def _release(self, is_reusable):
+        """
+Calls the release callback once.
+
+:param is_reusable: True if the connection can be reused
+
+:since: v1.0.0
+        """
+
+        release_callback = self._release_callback
+        self._release_callback = None
+
+        if (release_callback is not None): release_callback(is_reusable)
+    #
+
+    @staticmethod
+    def _write_to_fd(fd, data):
+        """
+Writes all of the given data to the file descriptor.
+
+:param fd: File descriptor to write to
+:param data: Data to write
+
+:return: (int) Number of bytes written
+:since:  v1.0.0
+        """
+
+        data_view = memoryview(data)
+        _return = len(data_view)
+
+        while (len(data_view) > 0): data_view = data_view[os.write(fd, data_view):]
+        return _return
+    #
+#
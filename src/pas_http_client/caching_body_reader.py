@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class CachingBodyReader(object):
+    """
+Callable body reader passing the data read from the given body reader
+through and providing the complete body to a callback at EOF.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_body_reader", "_callback", "_data", "max_size" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, body_reader, callback, max_size = None):
+        """
+Constructor __init__(CachingBodyReader)
+
+:param body_reader: Body reader to read from
+:param callback: Callback called with the complete body at EOF
+:param max_size: Maximum body size provided to the callback; None for
+                 unlimited
+
+:since: v1.0.0
+        """
+
+        self._body_reader = body_reader
+        """
+Body reader to read from
+        """
+        self._callback = callback
+        """
+Callback called with the complete body at EOF
+        """
+        self._data = bytearray()
+        """
+Data read so far
+        """
+        self.max_size = max_size
+        """
+Maximum body size provided to the callback
+        """
+    #
+
+    def __call__(self, n = None):
+        """
+python.org: Called when the instance is "called" as a function.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        _return = self._body_reader(n)
+        self._add_data(_return, n is None or len(_return) < 1)
+
+        return _return
+    #
+
+    @property
+    def is_eof(self):
+        """
+Returns true if the response body has been read completely.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return self._body_reader.is_eof
+    #
+
+    @property
+    def is_raw_chunked(self):
+        """
+Returns false as all data must be read through this reader.
+
+:return: (bool) False
+:since:  v1.0.0
+        """
+
+        return False
+    #
+
+    def _add_data(self, data, is_eof):
+        """
+Adds the given data read and calls the callback at EOF.
+
+:param data: Data read
+:param is_eof: True if EOF has been reached
+
+:since: v1.0.0
+        """
+
+        if (self._callback is not None):
+            self._data += data
+
+            if (self.max_size is not None and len(self._data) > self.max_size):
+                self._callback = None
+                self._data = None
+            elif (is_eof or self._body_reader.is_eof):
+                callback = self._callback
+                self._callback = None
+
+                callback(bytes(self._data))
+                self._data = None
+            #
+        #
+    #
+
+    def close(self):
+        """
+Closes the body reader read from.
+
+:since: v1.0.0
+        """
+
+        self._body_reader.close()
+    #
+#
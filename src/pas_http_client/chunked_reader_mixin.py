@@ -19,11 +19,11 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=invalid-name
 
-from time import time
-
 from dpt_runtime.binary import Binary
 from dpt_runtime.io_exception import IOException
 
+from .request_deadline import RequestDeadline
+
 class ChunkedReaderMixin(object):
     """
 HTTP reader handling chunked transfer-encoded data.
@@ -41,8 +41,28 @@ HTTP reader handling chunked transfer-encoded data.
     """
 Newline bytes used in raw HTTP data
     """
+    BINARY_SEMICOLON = Binary.bytes(";")
+    """
+Semicolon bytes separating chunk extensions
+    """
+    CHUNKED_READER_BUFFER_SIZE = 65536
+    """
+Size of the preallocated buffer used to read chunk data
+    """
+    CHUNKED_READER_MAX_LINE_SIZE = 65536
+    """
+Maximum size of a chunk size or trailer line
+    """
+    CHUNKED_READER_MAX_TRAILERS = 100
+    """
+Maximum number of trailer fields accepted
+    """
 
-    _mixin_slots_ = [ "_chunked_reader_buffer" ]
+    _mixin_slots_ = [ "_chunked_reader_buffer",
+                      "_chunked_reader_chunk_left",
+                      "_chunked_reader_is_eof",
+                      "_chunked_reader_trailers"
+                    ]
     """
 Additional __slots__ used for inherited classes.
     """
@@ -61,113 +81,186 @@ Constructor __init__(ChunkedReaderMixin)
 
         self._chunked_reader_buffer = None
         """
-Bytes buffer
+Preallocated buffer chunk data is read into
+        """
+        self._chunked_reader_chunk_left = None
+        """
+Bytes left to read of the current chunk; None if a chunk size line is
+expected next
+        """
+        self._chunked_reader_is_eof = False
+        """
+True if the last chunk and trailer section have been read
+        """
+        self._chunked_reader_trailers = None
+        """
+Trailer fields received after the last chunk
         """
     #
 
-    def _read_chunked_data(self, reader, callback, size = -1, timeout = None):
+    @property
+    def _is_chunked_data_eof(self):
         """
-Reads chunked data from the given reader to the given callback.
+Returns true if the last chunk and trailer section have been read.
 
-:param reader: Read callback
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return self._chunked_reader_is_eof
+    #
+
+    def _get_chunked_trailers(self):
+        """
+Returns the trailer fields received after the last chunk.
+
+:return: (dict) Trailer fields with lowercase names; None if not received
+:since:  v1.0.0
+        """
+
+        return self._chunked_reader_trailers
+    #
+
+    def _read_chunked_data(self, reader, callback, size = -1, timeout = None, deadline = None):
+        """
+Reads chunked data from the given reader to the given callback. The
+callback is called with "memoryview" slices of a reused buffer that are only
+valid until it returns. Data of a chunk not requested is left unread in the
+reader for the next call.
+
+:param reader: File-like object supporting "readinto()" and "readline()" or
+               a read callback
 :param callback: Callback for data read
-:param size: Byte size to read
+:param size: Byte size to read; -1 to read until the last chunk
 :param timeout: Timeout in seconds
+:param deadline: RequestDeadline to check instead of a timeout
 
 :since: v1.0.0
         """
 
-        is_last_chunk = False
+        if (self._chunked_reader_buffer is None): self._chunked_reader_buffer = bytearray(self.__class__.CHUNKED_READER_BUFFER_SIZE)
+
+        buffer_view = memoryview(self._chunked_reader_buffer)
+        buffer_size = len(buffer_view)
+        is_file = (hasattr(reader, "readinto") and hasattr(reader, "readline"))
         size_read = 0
-        size_unread = 5
-        timeout_time = (-1 if (timeout is None) else time() + timeout)
+        if (deadline is None and timeout is not None): deadline = RequestDeadline(timeout)
 
-        chunk_buffer = self._chunked_reader_buffer
-        chunk_size = len(chunk_buffer)
+        while ((not self._chunked_reader_is_eof) and (size < 0 or size_read < size)):
+            if (deadline is not None and deadline.is_expired): raise IOException("Timeout occurred before EOF")
 
-        self._chunked_reader_buffer = None
+            if (self._chunked_reader_chunk_left is None):
+                chunk_octets = self._read_chunked_line(reader, is_file).split(ChunkedReaderMixin.BINARY_SEMICOLON, 1)[0].strip()
+
+                try: self._chunked_reader_chunk_left = int(chunk_octets, 16)
+                except ValueError: raise IOException("Invalid chunk size received")
+
+                if (self._chunked_reader_chunk_left < 0): raise IOException("Invalid chunk size received")
 
-        while (size_unread > 0
-               and (size_read < size or chunk_size > 0)
-               and (timeout_time < 0 or time() < timeout_time)
-              ):
-            """
-Read remaining data from last chunk
-            """
-
-            part_size = (16384 if (size_unread > 16384) else size_unread)
-            part_data = reader(part_size)
-            part_size = len(part_data)
-
-            if (part_size < 1): raise IOException("Reader pointer could not be read before timeout occurred")
-            size_unread -= part_size
-
-            """
-Get size for next chunk
-            """
-
-            if (chunk_size < 1):
-                newline_position = (part_data
-                                    if (chunk_buffer is None) else
-                                    chunk_buffer + part_data
-                                   ).find(ChunkedReaderMixin.BINARY_NEWLINE)
-
-                chunk_octets = None
-
-                if (newline_position < 0):
-                    if (chunk_buffer is None): chunk_buffer = part_data
-                    else: chunk_buffer += part_data
-
-                    part_size = 0
-                    size_unread += 3
-                elif (chunk_buffer is not None):
-                    chunk_octets = (chunk_buffer + part_data)[:newline_position]
-                    part_data = (chunk_buffer + part_data)[2 + newline_position:]
-                    part_size = len(part_data)
-
-                    chunk_buffer = None
-                elif (not is_last_chunk):
-                    chunk_octets = part_data[:newline_position]
-                    part_data = part_data[2 + newline_position:]
-
-                    part_size = len(part_data)
-                else: part_size = 0
-
-                if (chunk_octets is not None):
-                    chunk_size = int(chunk_octets, 16)
-
-                    if (chunk_size == 0): is_last_chunk = True
-                    else: size_unread += chunk_size
+                if (self._chunked_reader_chunk_left == 0):
+                    self._read_chunked_trailers(reader, is_file)
+                    self._chunked_reader_is_eof = True
                 #
+
+                continue
+            #
+
+            part_size = min(self._chunked_reader_chunk_left, buffer_size)
+            if (size >= 0): part_size = min(part_size, size - size_read)
+
+            if (is_file):
+                part_view = buffer_view[:part_size]
+                part_size = reader.readinto(part_view)
+
+                if (not part_size): raise IOException("Reader pointer could not be read before EOF")
+                callback(part_view[:part_size])
+            else:
+                part_data = reader(part_size)
+                part_size = len(part_data)
+
+                if (part_size < 1): raise IOException("Reader pointer could not be read before EOF")
+                callback(memoryview(part_data))
+            #
+
+            size_read += part_size
+            self._chunked_reader_chunk_left -= part_size
+
+            if (self._chunked_reader_chunk_left < 1):
+                if (len(self._read_chunked_line(reader, is_file)) > 0): raise IOException("Chunk data is not terminated correctly")
+                self._chunked_reader_chunk_left = None
             #
+        #
+    #
+
+    def _read_chunked_line(self, reader, is_file):
+        """
+Reads a line terminated by CRLF without reading beyond it.
+
+:param reader: File-like object or read callback
+:param is_file: True if the reader is a file-like object
+
+:return: (bytes) Line read without the line terminator
+:since:  v1.0.0
+        """
 
-            if (part_size > 0):
-                chunk_size -= part_size
+        line_feed = ChunkedReaderMixin.BINARY_NEWLINE[-1:]
+        max_size = 1 + self.__class__.CHUNKED_READER_MAX_LINE_SIZE
 
-                if (size_read > size):
-                    if (self._chunked_reader_buffer is None): self._chunked_reader_buffer = part_data
-                    else: self._chunked_reader_buffer += part_data
-                elif ((size_read + part_size) > size):
-                    size_expected = size - (size_read + part_size)
+        if (is_file): _return = reader.readline(max_size)
+        else:
+            line_data = bytearray()
 
-                    self._chunked_reader_buffer = part_data[size_expected:]
-                    callback(part_data[:size_expected])
-                else: callback(part_data)
+            while (len(line_data) < max_size):
+                data = reader(1)
+                if (len(data) < 1): break
 
-                size_read += part_size
+                line_data += data
+                if (data == line_feed): break
             #
+
+            _return = bytes(line_data)
+        #
+
+        if (len(_return) >= max_size): raise IOException("Chunked data line exceeds the allowed size")
+        if (not _return.endswith(line_feed)): raise IOException("Reader pointer could not be read before EOF")
+
+        return _return.rstrip(ChunkedReaderMixin.BINARY_NEWLINE)
+    #
+
+    def _read_chunked_trailers(self, reader, is_file):
+        """
+Reads the trailer section following the last chunk.
+
+:param reader: File-like object or read callback
+:param is_file: True if the reader is a file-like object
+
+:since: v1.0.0
+        """
+
+        trailers = { }
+
+        while True:
+            trailer_line = self._read_chunked_line(reader, is_file)
+            if (len(trailer_line) < 1): break
+
+            if (len(trailers) >= self.__class__.CHUNKED_READER_MAX_TRAILERS): raise IOException("Too many trailer fields received")
+
+            trailer_data = Binary.str(trailer_line).split(":", 1)
+            if (len(trailer_data) == 2): trailers[trailer_data[0].strip().lower()] = trailer_data[1].strip()
         #
 
-        if (size_unread > 0): raise IOException("Timeout occurred before EOF")
+        self._chunked_reader_trailers = trailers
     #
 
     def _reset_chunked_buffer(self):
         """
-Resets the buffer of chunked data remaining after the last read call.
+Resets the state of chunked data remaining after the last read call.
 
 :since: v1.0.0
         """
 
-        self._chunked_reader_buffer = None
+        self._chunked_reader_chunk_left = None
+        self._chunked_reader_is_eof = False
+        self._chunked_reader_trailers = None
     #
 #
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from collections import deque
+from threading import RLock
+from time import time
+
+from dpt_runtime.io_exception import IOException
+
+class CircuitBreaker(object):
+    """
+Thread-safe circuit breaker per host. A circuit opens if the rate of failed
+or slow calls within a rolling time window exceeds the thresholds and
+rejects calls until a number of probe calls succeeded after a waiting time.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    DEFAULT_FAILURE_STATUS_CODES = ( 500, 502, 503, 504 )
+    """
+HTTP status codes counted as failures by default
+    """
+    STATE_CLOSED = "closed"
+    """
+Calls are passed through
+    """
+    STATE_HALF_OPEN = "half_open"
+    """
+A limited number of probe calls is passed through
+    """
+    STATE_OPEN = "open"
+    """
+Calls are rejected
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_circuits",
+                  "failure_rate_threshold",
+                  "failure_status_codes",
+                  "half_open_max_calls",
+                  "_lock",
+                  "minimum_calls",
+                  "open_duration",
+                  "slow_call_duration",
+                  "slow_call_rate_threshold",
+                  "window_duration"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide CircuitBreaker instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self,
+                 failure_rate_threshold = 0.5,
+                 slow_call_duration = None,
+                 slow_call_rate_threshold = 0.5,
+                 minimum_calls = 10,
+                 window_duration = 10,
+                 open_duration = 30,
+                 half_open_max_calls = 1,
+                 failure_status_codes = None
+                ):
+        """
+Constructor __init__(CircuitBreaker)
+
+:param failure_rate_threshold: Rate of failed calls opening the circuit
+:param slow_call_duration: Seconds after which a call is counted as slow;
+                           None to ignore the duration
+:param slow_call_rate_threshold: Rate of slow calls opening the circuit
+:param minimum_calls: Minimum number of calls within the window before the
+                      rates are evaluated
+:param window_duration: Seconds of the rolling window of calls evaluated
+:param open_duration: Seconds the circuit stays open before probe calls
+                      are passed through
+:param half_open_max_calls: Number of probe calls that must succeed to
+                            close the circuit again
+:param failure_status_codes: HTTP status codes counted as failures; None
+                             for the defaults
+
+:since: v1.0.0
+        """
+
+        self._circuits = { }
+        """
+Circuit state per host key
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        """
+Rate of failed calls opening the circuit
+        """
+        self.failure_status_codes = (self.__class__.DEFAULT_FAILURE_STATUS_CODES
+                                     if (failure_status_codes is None) else
+                                     tuple(failure_status_codes)
+                                    )
+        """
+HTTP status codes counted as failures
+        """
+        self.half_open_max_calls = half_open_max_calls
+        """
+Number of probe calls that must succeed to close the circuit again
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self.minimum_calls = minimum_calls
+        """
+Minimum number of calls within the window before the rates are evaluated
+        """
+        self.open_duration = open_duration
+        """
+Seconds the circuit stays open before probe calls are passed through
+        """
+        self.slow_call_duration = slow_call_duration
+        """
+Seconds after which a call is counted as slow
+        """
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        """
+Rate of slow calls opening the circuit
+        """
+        self.window_duration = window_duration
+        """
+Seconds of the rolling window of calls evaluated
+        """
+    #
+
+    def acquire(self, key):
+        """
+Checks if a call to the given host is permitted.
+
+:param key: Host key
+
+:return: (bool) True if the call is a probe of a half-open circuit
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            circuit = self._get_circuit(key)
+
+            if (circuit['state'] == CircuitBreaker.STATE_OPEN
+                and time() >= circuit['opened_time'] + self.open_duration
+               ):
+                circuit['state'] = CircuitBreaker.STATE_HALF_OPEN
+                circuit['probe_calls'] = 0
+                circuit['probe_successes'] = 0
+            #
+
+            if (circuit['state'] == CircuitBreaker.STATE_CLOSED): _return = False
+            elif (circuit['state'] == CircuitBreaker.STATE_HALF_OPEN
+                  and circuit['probe_calls'] < self.half_open_max_calls - circuit['probe_successes']
+                 ):
+                circuit['probe_calls'] += 1
+                _return = True
+            else: raise IOException("Circuit breaker for {0!r} is open".format(key))
+        #
+
+        return _return
+    #
+
+    def get_state(self, key):
+        """
+Returns the state of the circuit of the given host.
+
+:param key: Host key
+
+:return: (str) Circuit state
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return (CircuitBreaker.STATE_CLOSED if (circuit is None) else circuit['state'])
+        #
+    #
+
+    def record(self, key, duration, is_failure, is_probe = False):
+        """
+Records the result of a call to the given host.
+
+:param key: Host key
+:param duration: Duration of the call in seconds
+:param is_failure: True if the call failed
+:param is_probe: True if "acquire()" returned the call as a probe
+
+:since: v1.0.0
+        """
+
+        current_time = time()
+        is_slow = (self.slow_call_duration is not None and duration >= self.slow_call_duration)
+
+        with self._lock:
+            circuit = self._get_circuit(key)
+
+            if (is_probe):
+                if (circuit['state'] == CircuitBreaker.STATE_HALF_OPEN):
+                    circuit['probe_calls'] -= 1
+
+                    if (is_failure or is_slow): self._open(circuit, current_time)
+                    else:
+                        circuit['probe_successes'] += 1
+
+                        if (circuit['probe_successes'] >= self.half_open_max_calls):
+                            circuit['calls'].clear()
+                            circuit['state'] = CircuitBreaker.STATE_CLOSED
+                        #
+                    #
+                #
+            elif (circuit['state'] == CircuitBreaker.STATE_CLOSED):
+                calls = circuit['calls']
+                calls.append(( current_time, is_failure, is_slow ))
+
+                while (calls[0][0] < current_time - self.window_duration): calls.popleft()
+
+                if (len(calls) >= self.minimum_calls):
+                    calls_count = float(len(calls))
+
+                    if (sum(1 for call in calls if call[1]) / calls_count >= self.failure_rate_threshold
+                        or (self.slow_call_duration is not None
+                            and sum(1 for call in calls if call[2]) / calls_count >= self.slow_call_rate_threshold
+                           )
+                       ): self._open(circuit, current_time)
+                #
+            #
+        #
+    #
+
+    def release(self, key, is_probe = False):
+        """
+Releases a call to the given host without recording a result, e.g. if it
+has been cancelled by the caller.
+
+:param key: Host key
+:param is_probe: True if "acquire()" returned the call as a probe
+
+:since: v1.0.0
+        """
+
+        if (is_probe):
+            with self._lock:
+                circuit = self._get_circuit(key)
+                if (circuit['state'] == CircuitBreaker.STATE_HALF_OPEN): circuit['probe_calls'] -= 1
+            #
+        #
+    #
+
+    def reset(self, key = None):
+        """
+Closes the circuit of the given host or of all hosts.
+
+:param key: Host key; None for all hosts
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            if (key is None): self._circuits.clear()
+            else: self._circuits.pop(key, None)
+        #
+    #
+
+    def _get_circuit(self, key):
+        """
+Returns the circuit state of the given host. The lock must be held.
+
+:param key: Host key
+
+:return: (dict) Circuit state
+:since:  v1.0.0
+        """
+
+        _return = self._circuits.get(key)
+
+        if (_return is None):
+            _return = { "state": CircuitBreaker.STATE_CLOSED,
+                        "calls": deque(),
+                        "opened_time": None,
+                        "probe_calls": 0,
+                        "probe_successes": 0
+                      }
+
+            self._circuits[key] = _return
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide CircuitBreaker instance.
+
+:return: (object) CircuitBreaker instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+
+    @staticmethod
+    def _open(circuit, current_time):
+        """
+Opens the given circuit.
+
+:param circuit: Circuit state
+:param current_time: Current UNIX timestamp
+
+:since: v1.0.0
+        """
+
+        circuit['calls'].clear()
+        circuit['opened_time'] = current_time
+        circuit['state'] = CircuitBreaker.STATE_OPEN
+    #
+#
@@ -17,6 +17,15 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+# pylint: disable=import-error
+
+import socket
+
+from concurrent.futures import as_completed, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import copy
+from functools import partial
+from time import time
+
 from .raw_client import RawClient
 from .response import Response
 
@@ -35,7 +44,7 @@ HTTP client for requesting and parsing data.
 
     # pylint: disable=arguments-differ
 
-    __slots__ = [ ]
+    __slots__ = [ "_hedging_policy", "_request_coalescer" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -54,9 +63,186 @@ Constructor __init__(Client)
 :since: v1.0.0
         """
 
+        self._hedging_policy = None
+        """
+Hedging policy defining when additional requests are sent for pending
+idempotent ones; None to disable hedging
+        """
+        self._request_coalescer = None
+        """
+Request coalescer sharing identical GET and HEAD requests in flight; None
+to send each request
+        """
+
         RawClient.__init__(self, url, timeout, True, event_handler)
     #
 
+    @staticmethod
+    def _cancel_hedged_request(client, future):
+        """
+Cancels a hedged request whose response is not used. The client is marked
+as cancelled first so that the aborted request is neither retried nor
+recorded as failed. Pending requests are aborted by shutting down the
+socket of their connection and responses received are closed.
+
+:param client: Client instance executing the request
+:param future: Future of the request
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        client._is_cancelled = True
+
+        if (not future.done()):
+            sock = getattr(client.connection, "sock", None)
+
+            if (sock is not None):
+                try: sock.shutdown(socket.SHUT_RDWR)
+                except socket.error: pass
+            #
+        #
+
+        future.add_done_callback(Client._close_hedged_response)
+    #
+
+    @staticmethod
+    def _close_hedged_response(future):
+        """
+Closes the response of a hedged request not used.
+
+:param future: Future of the request
+
+:since: v1.0.0
+        """
+
+        if (future.exception() is None): future.result().close()
+    #
+
+    def _execute_batch_request(self, method, params = None, data = None, separator = ";", is_body_buffered = True):
+        """
+Executes a request of a batch with a copy of this client.
+
+:param method: HTTP method
+:param params: Query parameters as dict
+:param data: HTTP body
+:param separator: Query parameter separator
+:param is_body_buffered: True to read the response body completely
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,protected-access
+
+        client = copy(self)
+
+        params = client._build_request_parameters(params, separator)
+        _return = client.request(method, separator, params, data)
+
+        if (is_body_buffered and _return._body_reader is not None):
+            try: _return._set_body(_return.read())
+            except Exception as handled_exception:
+                _return._set_body_reader(None)
+                _return._set_exception(handled_exception)
+            #
+        #
+
+        return _return
+    #
+
+    def _execute_hedged_request(self, client, method, separator = ";", params = None):
+        """
+Executes a request of a hedged request with the given copy of this client
+and records the time until the response headers have been received.
+
+:param client: Client instance
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        start_time = time()
+        _return = client.request(method, separator, params)
+
+        if (_return.code is not None and (not client._is_cancelled)): self._hedging_policy.record(self._host_key, time() - start_time)
+
+        return _return
+    #
+
+    def _get_request_coalescing_key(self, method, separator, params):
+        """
+Returns the key identifying identical requests to be coalesced.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+
+:return: (tuple) Request coalescing key
+:since:  v1.0.0
+        """
+
+        kwargs = self._get_request_kwargs(separator, params)
+        headers = kwargs.get("headers", { })
+
+        return ( method,
+                 kwargs['url'],
+                 tuple(sorted(( name.lower(), str(headers[name]) ) for name in headers)),
+                 self._connection_pool_key,
+                 self._is_content_decoded
+               )
+    #
+
+    def _is_request_hedged(self, method, data = None):
+        """
+Returns true if the request is sent hedged. Hedging requires a connection
+pool to send requests concurrently.
+
+:param method: HTTP method
+:param data: HTTP body
+
+:return: (bool) True to send the request hedged
+:since:  v1.0.0
+        """
+
+        return (self._hedging_policy is not None
+                and self._connection_pool is not None
+                and self._hedging_policy.is_hedged(method, data)
+               )
+    #
+
+    def _new_buffered_response(self, buffered_response):
+        """
+Initializes an HTTP response object based on the given buffered response
+data shared with other callers.
+
+:param buffered_response: Tuple of the status code, headers, exception and
+                          body
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        ( code, headers, exception, body ) = buffered_response
+
+        _return = Response()
+        _return._set_code(code)
+        _return._set_headers(None if (headers is None) else headers.copy())
+
+        if (exception is not None): _return._set_exception(exception)
+        if (body is not None): _return._set_body(body)
+
+        return _return
+    #
+
     def _new_response(self, raw_response):
         """
 Initializes an HTTP response object based on the received raw data.
@@ -75,6 +261,7 @@ Initializes an HTTP response object based on the received raw data.
 
         if (isinstance(raw_response['body'], Exception)): _return._set_exception(raw_response['body'])
         if ("body_reader" in raw_response): _return._set_body_reader(raw_response['body_reader'])
+        if ("body_decoder" in raw_response): _return._set_body_decoder(raw_response['body_decoder'])
 
         return _return
     #
@@ -92,7 +279,197 @@ Call a given request method on the connected HTTP server.
 :since:  v1.0.0
         """
 
-        raw_response = RawClient.request(self, method, separator, params, data)
-        return self._new_response(raw_response)
+        if (self._request_coalescer is not None and method in RawClient.PIPELINING_METHODS and data is None):
+            buffered_response = self._request_coalescer.execute(self._get_request_coalescing_key(method, separator, params),
+                                                                partial(self._request_buffered, method, separator, params)
+                                                               )
+
+            _return = self._new_buffered_response(buffered_response)
+        elif (self._is_request_hedged(method, data)): _return = self._request_hedged(method, separator, params)
+        else:
+            raw_response = RawClient.request(self, method, separator, params, data)
+            _return = self._new_response(raw_response)
+        #
+
+        return _return
+    #
+
+    def _request_buffered(self, method, separator = ";", params = None):
+        """
+Calls the given request method and reads the response body completely.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+
+:return: (tuple) Status code, headers, exception and body
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,protected-access
+
+        response = self._new_response(RawClient.request(self, method, separator, params))
+
+        body = None
+        exception = response.exception
+
+        if (response._body_reader is not None):
+            try: body = response.read()
+            except Exception as handled_exception:
+                response.close()
+                exception = handled_exception
+            #
+        #
+
+        return ( response.code, response.headers, exception, body )
+    #
+
+    def _request_hedged(self, method, separator = ";", params = None):
+        """
+Calls the given request method and sends hedged requests with copies of
+this client if the response headers have not been received within the
+delay of the hedging policy. The first response received is returned and
+all other requests are cancelled.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        hedging_policy = self._hedging_policy
+        max_requests = 1 + hedging_policy.max_hedged_requests
+
+        delay = hedging_policy.get_delay(self._host_key)
+        executor = ThreadPoolExecutor(max_workers = max_requests)
+        request_clients = { }
+        pending_futures = set()
+        _return = None
+
+        try:
+            while (_return is None):
+                if (len(request_clients) < max_requests):
+                    if (len(request_clients) > 0 and self._log_handler is not None):
+                        self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}._request_hedged()- sending hedged {1} request", self, method)
+                    #
+
+                    client = copy(self)
+                    client._hedging_policy = None
+
+                    future = executor.submit(self._execute_hedged_request, client, method, separator, params)
+                    pending_futures.add(future)
+                    request_clients[future] = client
+                #
+
+                ( done_futures, pending_futures ) = wait(pending_futures,
+                                                         (delay if (len(request_clients) < max_requests) else None),
+                                                         FIRST_COMPLETED
+                                                        )
+
+                for future in sorted(done_futures, key = lambda future: (future.result().code is None)):
+                    response = future.result()
+
+                    if (_return is None and (response.code is not None or len(pending_futures) < 1)): _return = response
+                    else: response.close()
+                #
+            #
+        finally:
+            for future in pending_futures: self._cancel_hedged_request(request_clients[future], future)
+            executor.shutdown(False)
+        #
+
+        return _return
+    #
+
+    def request_many(self, requests, max_concurrency = 10, is_ordered = True, separator = ";", is_body_buffered = True):
+        """
+Executes the given requests concurrently using copies of this client and
+yields the responses. Exceptions are reported per response as done by
+"request()".
+
+:param requests: List of tuples containing the HTTP method, query parameters
+                 as dict and optionally the HTTP body
+:param max_concurrency: Maximum number of requests executed in parallel
+:param is_ordered: True to yield responses in the order given; False to
+                   yield them as soon as they are completed
+:param separator: Query parameter separator
+:param is_body_buffered: True to read response bodies completely before
+                         returning them and the connection to the pool
+
+:return: (object) Generator yielding tuples of the request index and the
+         Response object
+:since:  v1.0.0
+        """
+
+        executor = ThreadPoolExecutor(max_workers = max_concurrency)
+        futures = [ ]
+
+        try:
+            for request in requests:
+                method = request[0]
+                params = (request[1] if (len(request) > 1) else None)
+                data = (request[2] if (len(request) > 2) else None)
+
+                futures.append(executor.submit(self._execute_batch_request, method, params, data, separator, is_body_buffered))
+            #
+
+            future_indices = dict(( future, index ) for ( index, future ) in enumerate(futures))
+
+            for future in (futures if (is_ordered) else as_completed(futures)):
+                yield ( future_indices[future], future.result() )
+            #
+        finally:
+            for future in futures: future.cancel()
+            executor.shutdown(True)
+        #
+    #
+
+    def request_pipelined(self, requests, separator = ";"):
+        """
+Sends the given idempotent requests pipelined on one connection to the
+connected HTTP server.
+
+:param requests: List of tuples containing the HTTP method and query
+                 parameters as dict
+:param separator: Query parameter separator
+
+:return: (list) List of Response objects
+:since:  v1.0.0
+        """
+
+        return [ self._new_response(raw_response) for raw_response in RawClient.request_pipelined(self, requests, separator) ]
+    #
+
+    def set_hedging_policy(self, hedging_policy):
+        """
+Sets the hedging policy used to send additional requests for idempotent
+ones whose response headers have not been received in time. Hedging is
+only applied if a connection pool is set.
+
+:param hedging_policy: HedgingPolicy instance; None to disable hedging
+
+:since: v1.0.0
+        """
+
+        self._hedging_policy = hedging_policy
+    #
+
+    def set_request_coalescer(self, request_coalescer):
+        """
+Sets the request coalescer used to share identical GET and HEAD requests
+sent concurrently by clients using the same coalescer. Shared responses are
+read completely before they are returned.
+
+:param request_coalescer: RequestCoalescer instance; None to disable
+                          coalescing
+
+:since: v1.0.0
+        """
+
+        self._request_coalescer = request_coalescer
     #
 #
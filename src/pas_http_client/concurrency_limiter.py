@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from functools import partial
+from math import ceil
+from threading import Condition, RLock
+from time import time
+import asyncio
+
+from dpt_runtime.type_exception import TypeException
+
+class ConcurrencyLimiter(object):
+    """
+Thread-safe adaptive limit of the requests in flight per host. The limit is
+increased while requests succeed and decreased on dropped requests (AIMD)
+or as soon as the latency indicates queuing at the host (Vegas). Coroutines
+wait for a free slot without blocking their event loop.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    ALGORITHM_AIMD = "aimd"
+    """
+Additive increase and multiplicative decrease on dropped requests
+    """
+    ALGORITHM_VEGAS = "vegas"
+    """
+Adjusts the limit based on the queue size estimated from the latency
+compared to the lowest one measured
+    """
+    DEFAULT_DROP_STATUS_CODES = ( 429, 503 )
+    """
+HTTP status codes counted as dropped requests by default
+    """
+
+    __slots__ = [ "__weakref__",
+                  "algorithm",
+                  "alpha",
+                  "backoff_ratio",
+                  "beta",
+                  "_condition",
+                  "drop_status_codes",
+                  "initial_limit",
+                  "is_blocking",
+                  "_limits",
+                  "max_limit",
+                  "min_limit",
+                  "_waiters"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide ConcurrencyLimiter instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self,
+                 initial_limit = 20,
+                 min_limit = 1,
+                 max_limit = 200,
+                 algorithm = ALGORITHM_AIMD,
+                 backoff_ratio = 0.9,
+                 alpha = 3,
+                 beta = 6,
+                 drop_status_codes = None,
+                 is_blocking = True
+                ):
+        """
+Constructor __init__(ConcurrencyLimiter)
+
+:param initial_limit: Number of requests in flight allowed per host
+                      initially
+:param min_limit: Minimum limit
+:param max_limit: Maximum limit
+:param algorithm: Algorithm adjusting the limit
+:param backoff_ratio: Factor the limit is multiplied with if a request has
+                      been dropped
+:param alpha: Estimated queue size below which the Vegas algorithm
+              increases the limit
+:param beta: Estimated queue size above which the Vegas algorithm decreases
+             the limit
+:param drop_status_codes: HTTP status codes counted as dropped requests;
+                          None for the defaults
+:param is_blocking: True to wait for a free slot by default; False to fail
+                    immediately if the limit has been reached
+
+:since: v1.0.0
+        """
+
+        if (algorithm not in ( ConcurrencyLimiter.ALGORITHM_AIMD, ConcurrencyLimiter.ALGORITHM_VEGAS )):
+            raise TypeException("Concurrency limit algorithm given is invalid")
+        #
+
+        self.algorithm = algorithm
+        """
+Algorithm adjusting the limit
+        """
+        self.alpha = alpha
+        """
+Estimated queue size below which the Vegas algorithm increases the limit
+        """
+        self.backoff_ratio = backoff_ratio
+        """
+Factor the limit is multiplied with if a request has been dropped
+        """
+        self.beta = beta
+        """
+Estimated queue size above which the Vegas algorithm decreases the limit
+        """
+        self._condition = Condition()
+        """
+Condition notified if a request has been completed
+        """
+        self.drop_status_codes = (self.__class__.DEFAULT_DROP_STATUS_CODES
+                                  if (drop_status_codes is None) else
+                                  tuple(drop_status_codes)
+                                 )
+        """
+HTTP status codes counted as dropped requests
+        """
+        self.initial_limit = initial_limit
+        """
+Number of requests in flight allowed per host initially
+        """
+        self.is_blocking = is_blocking
+        """
+True to wait for a free slot by default
+        """
+        self._limits = { }
+        """
+Limit state per host key
+        """
+        self.max_limit = max_limit
+        """
+Maximum limit
+        """
+        self.min_limit = min_limit
+        """
+Minimum limit
+        """
+        self._waiters = { }
+        """
+Event loops and futures of coroutines waiting for a free slot per host key
+        """
+    #
+
+    def acquire(self, key, is_blocking = None, timeout = None):
+        """
+Takes a slot for a request in flight to the given host. Blocking calls wait
+until a slot is available or the timeout given has been reached.
+
+:param key: Host key
+:param is_blocking: True to wait for a slot; None for the default
+:param timeout: Maximum number of seconds to wait; None to wait as long as
+                needed
+
+:return: (bool) True if a slot has been taken
+:since:  v1.0.0
+        """
+
+        if (is_blocking is None): is_blocking = self.is_blocking
+
+        with self._condition:
+            state = self._get_state(key)
+
+            _return = (self._condition.wait_for(partial(self._is_slot_available, state), timeout)
+                       if (is_blocking) else
+                       self._is_slot_available(state)
+                      )
+
+            if (_return): state['in_flight_count'] += 1
+        #
+
+        return _return
+    #
+
+    async def acquire_async(self, key, is_blocking = None, timeout = None):
+        """
+Takes a slot for a request in flight to the given host without blocking the
+event loop. Blocking calls wait until a released slot is signaled or the
+timeout given has been reached.
+
+:param key: Host key
+:param is_blocking: True to wait for a slot; None for the default
+:param timeout: Maximum number of seconds to wait; None to wait as long as
+                needed
+
+:return: (bool) True if a slot has been taken
+:since:  v1.0.0
+        """
+
+        if (is_blocking is None): is_blocking = self.is_blocking
+
+        loop = asyncio.get_event_loop()
+        timeout_time = (None if (timeout is None) else time() + timeout)
+
+        _return = False
+
+        while True:
+            waiter = None
+
+            with self._condition:
+                state = self._get_state(key)
+
+                if (self._is_slot_available(state)):
+                    state['in_flight_count'] += 1
+                    _return = True
+                elif (is_blocking):
+                    waiter = loop.create_future()
+                    self._waiters.setdefault(key, [ ]).append(( loop, waiter ))
+                #
+            #
+
+            if (waiter is None): break
+
+            try:
+                if (timeout_time is None): await waiter
+                else: await asyncio.wait_for(waiter, max(0, timeout_time - time()))
+            except asyncio.TimeoutError: break
+            finally: self._remove_waiter(key, loop, waiter)
+        #
+
+        return _return
+    #
+
+    def get_in_flight_count(self, key):
+        """
+Returns the number of requests in flight to the given host.
+
+:param key: Host key
+
+:return: (int) Number of requests
+:since:  v1.0.0
+        """
+
+        with self._condition: return self._get_state(key)['in_flight_count']
+    #
+
+    def get_limit(self, key):
+        """
+Returns the current limit of requests in flight to the given host.
+
+:param key: Host key
+
+:return: (int) Number of requests
+:since:  v1.0.0
+        """
+
+        with self._condition: return int(self._get_state(key)['limit'])
+    #
+
+    def _get_state(self, key):
+        """
+Returns the limit state of the given host. The condition lock must be held.
+
+:param key: Host key
+
+:return: (dict) Limit state
+:since:  v1.0.0
+        """
+
+        _return = self._limits.get(key)
+
+        if (_return is None):
+            _return = { "limit": float(self.initial_limit), "in_flight_count": 0, "min_latency": None }
+            self._limits[key] = _return
+        #
+
+        return _return
+    #
+
+    def release(self, key, latency = None, is_dropped = False):
+        """
+Releases the slot of a completed request to the given host and adjusts the
+limit.
+
+:param key: Host key
+:param latency: Seconds until the response has been received; None if the
+                request has not been sent
+:param is_dropped: True if the request has been dropped or rejected by the
+                   host
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            state = self._get_state(key)
+
+            in_flight_count = state['in_flight_count']
+            state['in_flight_count'] = max(0, in_flight_count - 1)
+
+            if (is_dropped): self._set_limit(state, state['limit'] * self.backoff_ratio)
+            elif (latency is not None):
+                limit = state['limit']
+                step = 1.0 / limit
+
+                if (self.algorithm == ConcurrencyLimiter.ALGORITHM_VEGAS):
+                    if (state['min_latency'] is None or latency < state['min_latency']): state['min_latency'] = latency
+
+                    queue_size = (ceil(limit * (1 - state['min_latency'] / latency)) if (latency > 0) else 0)
+
+                    if (queue_size > self.beta): self._set_limit(state, limit - step)
+                    elif (queue_size < self.alpha and 2 * in_flight_count >= limit): self._set_limit(state, limit + step)
+                elif (2 * in_flight_count >= limit): self._set_limit(state, limit + step)
+            #
+
+            self._condition.notify_all()
+        #
+
+        self._wake_waiters(key)
+    #
+
+    def _remove_waiter(self, key, loop, waiter):
+        """
+Removes the given future of a coroutine no longer waiting for a free slot.
+
+:param key: Host key
+:param loop: Event loop of the future
+:param waiter: Future
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            waiters = self._waiters.get(key)
+
+            if (waiters is not None and ( loop, waiter ) in waiters):
+                waiters.remove(( loop, waiter ))
+                if (len(waiters) < 1): del(self._waiters[key])
+            #
+        #
+    #
+
+    def reset(self, key = None):
+        """
+Resets the limit of the given host or of all hosts. Requests in flight are
+still counted.
+
+:param key: Host key; None for all hosts
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            states = (list(self._limits.values()) if (key is None) else [ self._get_state(key) ])
+
+            for state in states:
+                state['limit'] = float(self.initial_limit)
+                state['min_latency'] = None
+            #
+
+            self._condition.notify_all()
+        #
+
+        self._wake_waiters(key)
+    #
+
+    def set_limit(self, key, limit):
+        """
+Sets the current limit of requests in flight to the given host.
+
+:param key: Host key
+:param limit: Number of requests
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            self._set_limit(self._get_state(key), limit)
+            self._condition.notify_all()
+        #
+
+        self._wake_waiters(key)
+    #
+
+    def _set_limit(self, state, limit):
+        """
+Sets the limit of the given state within the minimum and maximum limit.
+The condition lock must be held.
+
+:param state: Limit state
+:param limit: Number of requests
+
+:since: v1.0.0
+        """
+
+        state['limit'] = float(max(self.min_limit, min(self.max_limit, limit)))
+    #
+
+    def _wake_waiters(self, key = None):
+        """
+Wakes up all coroutines waiting for a free slot of the given host in their
+event loops. Each of them checks the limit again before taking a slot.
+
+:param key: Host key; None for all hosts
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            waiters = ([ waiter for key_waiters in self._waiters.values() for waiter in key_waiters ]
+                       if (key is None) else
+                       list(self._waiters.get(key, [ ]))
+                      )
+        #
+
+        for ( loop, waiter ) in waiters:
+            if (not loop.is_closed()): loop.call_soon_threadsafe(self._set_waiter_result, waiter)
+        #
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide ConcurrencyLimiter instance.
+
+:return: (object) ConcurrencyLimiter instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+
+    @staticmethod
+    def _is_slot_available(state):
+        """
+Returns true if the given limit state allows another request in flight.
+
+:param state: Limit state
+
+:return: (bool) True if available
+:since:  v1.0.0
+        """
+
+        return (state['in_flight_count'] < int(state['limit']))
+    #
+
+    @staticmethod
+    def _set_waiter_result(waiter):
+        """
+Marks the given future of a waiting coroutine as done.
+
+:param waiter: Future
+
+:since: v1.0.0
+        """
+
+        if (not waiter.done()): waiter.set_result(None)
+    #
+#
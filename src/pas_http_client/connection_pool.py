@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from collections import OrderedDict
+from selectors import DefaultSelector, EVENT_READ
+from threading import Condition, RLock
+from time import time
+
+from dpt_runtime.io_exception import IOException
+
+class ConnectionPool(object):
+    """
+Thread-safe pool of idle HTTP connections keyed by the connection
+parameters used to create them.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_active_counts",
+                  "_condition",
+                  "idle_timeout",
+                  "_idle_connections",
+                  "_idle_ids",
+                  "_lock",
+                  "max_connections_per_host",
+                  "max_idle_connections"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide ConnectionPool instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self, max_connections_per_host = 10, idle_timeout = 60, max_idle_connections = 100):
+        """
+Constructor __init__(ConnectionPool)
+
+:param max_connections_per_host: Maximum number of borrowed connections per
+                                 pool key
+:param idle_timeout: Seconds an idle connection is kept before it is closed
+:param max_idle_connections: Maximum number of idle connections kept in
+                             total; the least recently used ones are closed
+                             first.
+
+:since: v1.0.0
+        """
+
+        self._active_counts = { }
+        """
+Number of borrowed connections per pool key
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self._condition = Condition(self._lock)
+        """
+Condition notified whenever a connection has been returned
+        """
+        self.idle_timeout = idle_timeout
+        """
+Seconds an idle connection is kept before it is closed
+        """
+        self._idle_connections = OrderedDict()
+        """
+Idle connections in least recently used order
+        """
+        self._idle_ids = { }
+        """
+List of idle connection IDs per pool key
+        """
+        self.max_connections_per_host = max_connections_per_host
+        """
+Maximum number of borrowed connections per pool key
+        """
+        self.max_idle_connections = max_idle_connections
+        """
+Maximum number of idle connections kept in total
+        """
+    #
+
+    @property
+    def idle_count(self):
+        """
+Returns the number of idle connections currently pooled.
+
+:return: (int) Number of idle connections
+:since:  v1.0.0
+        """
+
+        with self._lock: return len(self._idle_connections)
+    #
+
+    def borrow(self, key, factory, timeout = None):
+        """
+Returns an idle connection for the given pool key or a new one created by
+calling the given factory.
+
+:param key: Pool key
+:param factory: Callable returning a new connection
+:param timeout: Seconds to wait for a free connection slot
+
+:return: (object) Connection
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        timeout_time = (None if (timeout is None) else time() + timeout)
+
+        while (_return is None):
+            with self._condition:
+                expired_connections = self._pop_expired_connections()
+                connection = self._pop_idle_connection(key)
+
+                if (connection is None):
+                    while (self._active_counts.get(key, 0) >= self.max_connections_per_host):
+                        if (timeout_time is None): self._condition.wait()
+                        else:
+                            timeout = timeout_time - time()
+                            if (timeout <= 0): raise IOException("Timeout occurred while waiting for a pooled connection")
+
+                            self._condition.wait(timeout)
+                        #
+
+                        connection = self._pop_idle_connection(key)
+                        if (connection is not None): break
+                    #
+                #
+
+                self._active_counts[key] = 1 + self._active_counts.get(key, 0)
+            #
+
+            for expired_connection in expired_connections: self._close_connection(expired_connection)
+
+            if (connection is None):
+                try: _return = factory()
+                except Exception:
+                    self._decrease_active_count(key)
+                    raise
+                #
+            elif (self._is_connection_stale(connection)):
+                self._close_connection(connection)
+                self._decrease_active_count(key)
+            else: _return = connection
+        #
+
+        return _return
+    #
+
+    def clear(self):
+        """
+Closes all idle connections.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            connections = [ entry[1] for entry in self._idle_connections.values() ]
+
+            self._idle_connections.clear()
+            self._idle_ids.clear()
+        #
+
+        for connection in connections: self._close_connection(connection)
+    #
+
+    def _decrease_active_count(self, key):
+        """
+Decreases the number of borrowed connections for the given pool key and
+notifies waiting threads. All of them are notified as they may wait for
+different pool keys.
+
+:param key: Pool key
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            active_count = self._active_counts.get(key, 0) - 1
+
+            if (active_count > 0): self._active_counts[key] = active_count
+            elif (key in self._active_counts): del(self._active_counts[key])
+
+            self._condition.notify_all()
+        #
+    #
+
+    def discard(self, key, connection):
+        """
+Closes a borrowed connection instead of returning it to the pool.
+
+:param key: Pool key
+:param connection: Borrowed connection
+
+:since: v1.0.0
+        """
+
+        self._close_connection(connection)
+        self._decrease_active_count(key)
+    #
+
+    def _pop_expired_connections(self):
+        """
+Removes idle connections exceeding the idle timeout. Must be called with
+the lock held.
+
+:return: (list) Expired connections to be closed
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        if (self.idle_timeout is not None):
+            expiry_time = time() - self.idle_timeout
+
+            while (len(self._idle_connections) > 0):
+                connection_id = next(iter(self._idle_connections))
+                if (self._idle_connections[connection_id][2] > expiry_time): break
+
+                _return.append(self._remove_idle_connection(connection_id))
+            #
+        #
+
+        return _return
+    #
+
+    def _pop_idle_connection(self, key):
+        """
+Removes and returns the most recently used idle connection for the given
+pool key. Must be called with the lock held.
+
+:param key: Pool key
+
+:return: (object) Connection; None if not available
+:since:  v1.0.0
+        """
+
+        idle_ids = self._idle_ids.get(key)
+        return (None if (idle_ids is None) else self._remove_idle_connection(idle_ids[-1]))
+    #
+
+    def release(self, key, connection, is_reusable = True):
+        """
+Returns a borrowed connection to the pool.
+
+:param key: Pool key
+:param connection: Borrowed connection
+:param is_reusable: False if the connection should be closed
+
+:since: v1.0.0
+        """
+
+        if (is_reusable and getattr(connection, "sock", None) is None): is_reusable = False
+
+        evicted_connections = [ ]
+
+        if (is_reusable):
+            with self._lock:
+                connection_id = id(connection)
+
+                self._idle_connections[connection_id] = ( key, connection, time() )
+                self._idle_ids.setdefault(key, [ ]).append(connection_id)
+
+                while (len(self._idle_connections) > self.max_idle_connections):
+                    evicted_connections.append(self._remove_idle_connection(next(iter(self._idle_connections))))
+                #
+            #
+        else: evicted_connections.append(connection)
+
+        for evicted_connection in evicted_connections: self._close_connection(evicted_connection)
+        self._decrease_active_count(key)
+    #
+
+    def _remove_idle_connection(self, connection_id):
+        """
+Removes the idle connection with the given ID. Must be called with the lock
+held.
+
+:param connection_id: Idle connection ID
+
+:return: (object) Connection
+:since:  v1.0.0
+        """
+
+        ( key, _return, _ ) = self._idle_connections.pop(connection_id)
+
+        idle_ids = self._idle_ids[key]
+        idle_ids.remove(connection_id)
+        if (len(idle_ids) < 1): del(self._idle_ids[key])
+
+        return _return
+    #
+
+    @staticmethod
+    def _close_connection(connection):
+        """
+Closes the given connection ignoring errors.
+
+:param connection: Connection
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        try: connection.close()
+        except Exception: pass
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide ConnectionPool instance.
+
+:return: (object) ConnectionPool instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+
+    @staticmethod
+    def _is_connection_stale(connection):
+        """
+Returns true if the idle connection given has been closed by the peer or
+received unexpected data.
+
+:param connection: Idle connection
+
+:return: (bool) True if stale
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        sock = getattr(connection, "sock", None)
+        if (sock is None): return True
+
+        try:
+            selector = DefaultSelector()
+
+            try:
+                selector.register(sock, EVENT_READ)
+                return (len(selector.select(0)) > 0)
+            finally: selector.close()
+        except Exception: return True
+    #
+#
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+
+class DecodingBodyReader(object):
+    """
+Callable body reader decoding content-coded data read from a source reader
+incrementally. Decoded data is limited per call to keep buffers bounded.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__",
+                  "buffer_size",
+                  "_decoded_size",
+                  "_decoder",
+                  "_encoded_size",
+                  "_is_eof",
+                  "max_ratio",
+                  "max_size",
+                  "_source"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, source, decoder, max_size = None, max_ratio = None, buffer_size = 65536):
+        """
+Constructor __init__(DecodingBodyReader)
+
+:param source: Read callback returning encoded data
+:param decoder: Content decoder instance
+:param max_size: Maximum decoded size accepted; None for unlimited
+:param max_ratio: Maximum ratio of decoded to encoded size accepted after
+                  more than 1 MiB has been decoded; None for unlimited
+:param buffer_size: Number of encoded bytes read at once
+
+:since: v1.0.0
+        """
+
+        self.buffer_size = buffer_size
+        """
+Number of encoded bytes read at once
+        """
+        self._decoded_size = 0
+        """
+Number of bytes decoded
+        """
+        self._decoder = decoder
+        """
+Content decoder instance
+        """
+        self._encoded_size = 0
+        """
+Number of encoded bytes read
+        """
+        self._is_eof = False
+        """
+True if all data has been decoded
+        """
+        self.max_ratio = max_ratio
+        """
+Maximum ratio of decoded to encoded size accepted
+        """
+        self.max_size = max_size
+        """
+Maximum decoded size accepted
+        """
+        self._source = source
+        """
+Read callback returning encoded data
+        """
+    #
+
+    def __call__(self, n = None):
+        """
+python.org: Called when the instance is "called" as a function.
+
+:param n: How many bytes to read from the current position (None means
+          until EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        data = bytearray()
+
+        while ((not self._is_eof) and (n is None or len(data) < n)):
+            encoded_data = (self._source(self.buffer_size) if (not self._decoder.is_pending) else None)
+            data += self._decode(encoded_data, (self.buffer_size if (n is None) else n - len(data)))
+        #
+
+        return bytes(data)
+    #
+
+    @property
+    def is_eof(self):
+        """
+Returns true if all data has been decoded.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return self._is_eof
+    #
+
+    def close(self):
+        """
+Closes the source reader if supported.
+
+:since: v1.0.0
+        """
+
+        close_callback = getattr(self._source, "close", None)
+        if (close_callback is not None): close_callback()
+    #
+
+    def _decode(self, encoded_data, max_length):
+        """
+Decodes the given data and checks the configured limits.
+
+:param encoded_data: Encoded data; None to continue with pending input and
+                     empty at EOF of the source
+:param max_length: Maximum number of bytes returned
+
+:return: (bytes) Decoded data
+:since:  v1.0.0
+        """
+
+        if (encoded_data is None): _return = self._decoder.decode(Binary.BYTES_TYPE(), max_length)
+        elif (len(encoded_data) < 1):
+            _return = self._decoder.flush()
+            self._is_eof = True
+        else:
+            self._encoded_size += len(encoded_data)
+            _return = self._decoder.decode(encoded_data, max_length)
+        #
+
+        self._decoded_size += len(_return)
+
+        if (self.max_size is not None and self._decoded_size > self.max_size):
+            self.close()
+            raise IOException("Decoded response body exceeds the allowed size")
+        #
+
+        if (self.max_ratio is not None
+            and self._decoded_size > 1048576
+            and self._decoded_size > self.max_ratio * self._encoded_size
+           ):
+            self.close()
+            raise IOException("Decoded response body exceeds the allowed compression ratio")
+        #
+
+        return _return
+    #
+#
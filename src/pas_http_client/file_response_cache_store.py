@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+import json
+import mmap
+import os
+
+from collections import OrderedDict
+from hashlib import sha256
+from tempfile import mkstemp
+from threading import RLock
+
+from dpt_runtime.binary import Binary
+
+from .abstract_response_cache_store import AbstractResponseCacheStore
+from .response_cache_entry import ResponseCacheEntry
+
+class FileResponseCacheStore(AbstractResponseCacheStore):
+    """
+Thread-safe on-disk storage for response cache entries. Bodies are stored
+in separate files and memory-mapped read-only if requested. The least
+recently used entries are removed if the size limit is exceeded.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "directory_path", "_entry_sizes", "_lock", "max_size", "_size" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, directory_path, max_size = 1073741824):
+        """
+Constructor __init__(FileResponseCacheStore)
+
+:param directory_path: Directory entries are stored in
+:param max_size: Maximum number of bytes used by all entries
+
+:since: v1.0.0
+        """
+
+        self.directory_path = directory_path
+        """
+Directory entries are stored in
+        """
+        self._entry_sizes = OrderedDict()
+        """
+Entry sizes per file name in least recently used order
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self.max_size = max_size
+        """
+Maximum number of bytes used by all entries
+        """
+        self._size = 0
+        """
+Number of bytes used by all entries
+        """
+
+        if (not os.path.isdir(directory_path)): os.makedirs(directory_path)
+        self._load_entry_sizes()
+    #
+
+    @property
+    def size(self):
+        """
+Returns the number of bytes used by all entries.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        with self._lock: return self._size
+    #
+
+    def clear(self):
+        """
+Removes all entries.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            for file_name in list(self._entry_sizes): self._delete_files(file_name)
+        #
+    #
+
+    def delete(self, key):
+        """
+Removes the entry for the given key.
+
+:param key: Cache key
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._delete_files(self._get_file_name(key))
+    #
+
+    def _delete_files(self, file_name):
+        """
+Removes the files of the entry with the given file name. Must be called
+with the lock held.
+
+:param file_name: Entry file name without extension
+
+:since: v1.0.0
+        """
+
+        if (file_name in self._entry_sizes): self._size -= self._entry_sizes.pop(file_name)
+
+        for extension in ( ".json", ".body" ):
+            try: os.unlink(os.path.join(self.directory_path, file_name + extension))
+            except OSError: pass
+        #
+    #
+
+    def get(self, key):
+        """
+Returns the entry for the given key. The body is memory-mapped read-only.
+
+:param key: Cache key
+
+:return: (object) ResponseCacheEntry instance; None if not stored
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        file_name = self._get_file_name(key)
+        file_path_name = os.path.join(self.directory_path, file_name)
+
+        with self._lock:
+            if (file_name not in self._entry_sizes): return None
+
+            try:
+                with open(file_path_name + ".json", "r", encoding = "utf-8") as _file: data = json.load(_file)
+                if (data.get("key") != key): return None
+
+                with open(file_path_name + ".body", "rb") as _file:
+                    body = (Binary.BYTES_TYPE()
+                            if (os.fstat(_file.fileno()).st_size < 1) else
+                            mmap.mmap(_file.fileno(), 0, access = mmap.ACCESS_READ)
+                           )
+                #
+
+                os.utime(file_path_name + ".json", None)
+            except Exception:
+                self._delete_files(file_name)
+                return None
+            #
+
+            self._entry_sizes[file_name] = self._entry_sizes.pop(file_name)
+        #
+
+        return ResponseCacheEntry(data['code'],
+                                  data['reason'],
+                                  data['headers'],
+                                  body,
+                                  data['request_headers'],
+                                  data['request_time'],
+                                  data['response_time']
+                                 )
+    #
+
+    def _load_entry_sizes(self):
+        """
+Loads the sizes of all entries stored in the directory.
+
+:since: v1.0.0
+        """
+
+        entries = [ ]
+
+        for file_name in os.listdir(self.directory_path):
+            if (file_name.endswith(".json")):
+                file_path_name = os.path.join(self.directory_path, file_name[:-5])
+
+                try:
+                    metadata_stat = os.stat(file_path_name + ".json")
+                    entries.append(( metadata_stat.st_mtime, file_name[:-5], metadata_stat.st_size + os.stat(file_path_name + ".body").st_size ))
+                except OSError: pass
+            #
+        #
+
+        entries.sort()
+
+        with self._lock:
+            for ( _, file_name, entry_size ) in entries:
+                self._entry_sizes[file_name] = entry_size
+                self._size += entry_size
+            #
+        #
+    #
+
+    def set(self, key, entry):
+        """
+Stores the entry for the given key replacing an existing one.
+
+:param key: Cache key
+:param entry: ResponseCacheEntry instance
+
+:since: v1.0.0
+        """
+
+        file_name = self._get_file_name(key)
+        file_path_name = os.path.join(self.directory_path, file_name)
+
+        metadata = Binary.utf8_bytes(json.dumps({ "key": key,
+                                                  "code": entry.code,
+                                                  "reason": entry.reason,
+                                                  "headers": entry.headers,
+                                                  "request_headers": entry.request_headers,
+                                                  "request_time": entry.request_time,
+                                                  "response_time": entry.response_time
+                                                }))
+
+        entry_size = len(metadata) + len(entry.body)
+        if (entry_size > self.max_size): return
+
+        body_file_path_name = self._write_temporary_file(entry.body)
+
+        try: metadata_file_path_name = self._write_temporary_file(metadata)
+        except Exception:
+            os.unlink(body_file_path_name)
+            raise
+        #
+
+        with self._lock:
+            self._delete_files(file_name)
+
+            os.rename(body_file_path_name, file_path_name + ".body")
+            os.rename(metadata_file_path_name, file_path_name + ".json")
+
+            self._entry_sizes[file_name] = entry_size
+            self._size += entry_size
+
+            while (self._size > self.max_size): self._delete_files(next(iter(self._entry_sizes)))
+        #
+    #
+
+    def _write_temporary_file(self, data):
+        """
+Writes the given data to a new temporary file in the directory.
+
+:param data: Data to write
+
+:return: (str) Path and file name of the temporary file
+:since:  v1.0.0
+        """
+
+        ( fd, _return ) = mkstemp(".tmp", "", self.directory_path)
+
+        try:
+            with os.fdopen(fd, "wb") as _file: _file.write(data)
+        except Exception:
+            os.unlink(_return)
+            raise
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_file_name(key):
+        """
+Returns the file name without extension used for the given key.
+
+:param key: Cache key
+
+:return: (str) File name
+:since:  v1.0.0
+        """
+
+        return sha256(Binary.utf8_bytes(key)).hexdigest()
+    #
+#
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+import zlib
+
+from dpt_runtime.binary import Binary
+
+class GzipBodyEncoder(object):
+    """
+Streaming "gzip" encoder for request bodies. The body given is only read
+and compressed while it is iterated.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    BLOCK_SIZE = 65536
+    """
+Number of bytes read and compressed at once
+    """
+
+    __slots__ = [ "__weakref__", "_data", "level" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, data, level = 6):
+        """
+Constructor __init__(GzipBodyEncoder)
+
+:param data: Body as bytes, file object, memoryview or iterable
+:param level: zlib compression level
+
+:since: v1.0.0
+        """
+
+        self._data = data
+        """
+Body to be compressed
+        """
+        self.level = level
+        """
+zlib compression level
+        """
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Generator yielding the compressed body
+:since:  v1.0.0
+        """
+
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+        for data in self._get_data_iterator():
+            data = compressor.compress(Binary.utf8_bytes(data))
+            if (len(data) > 0): yield data
+        #
+
+        yield compressor.flush()
+    #
+
+    def _get_data_iterator(self):
+        """
+Returns an iterator over the uncompressed body in parts.
+
+:return: (object) Iterator yielding the body
+:since:  v1.0.0
+        """
+
+        block_size = self.__class__.BLOCK_SIZE
+
+        if (isinstance(self._data, ( Binary.BYTES_TYPE, bytearray ))): _return = iter([ self._data ])
+        elif (isinstance(self._data, memoryview)):
+            data_view = self._data.cast("B")
+            _return = ( data_view[position:position + block_size] for position in range(0, len(data_view), block_size) )
+        elif (hasattr(self._data, "read")): _return = iter(lambda: self._data.read(block_size), self._data.read(0))
+        else: _return = iter(self._data)
+
+        return _return
+    #
+
+    @staticmethod
+    def compress(data, level = 6):
+        """
+Returns the given body compressed completely.
+
+:param data: Body as bytes, file object, memoryview or iterable
+:param level: zlib compression level
+
+:return: (bytes) Compressed body
+:since:  v1.0.0
+        """
+
+        return Binary.BYTES_TYPE().join(GzipBodyEncoder(data, level))
+    #
+#
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from collections import deque
+from threading import Lock
+
+class HedgingPolicy(object):
+    """
+Policy defining when a hedged request is sent in addition to a pending
+idempotent one. The delay is the given percentile of the time until the
+response headers have been received for the host.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_latencies",
+                  "_lock",
+                  "max_delay",
+                  "max_hedged_requests",
+                  "methods",
+                  "min_delay",
+                  "minimum_samples",
+                  "percentile",
+                  "window_size"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, percentile = 95, min_delay = 0.005, max_delay = 1, max_hedged_requests = 1, minimum_samples = 20, window_size = 100, methods = None):
+        """
+Constructor __init__(HedgingPolicy)
+
+:param percentile: Percentile of the measured latencies used as delay
+:param min_delay: Minimum delay in seconds before a hedged request is sent
+:param max_delay: Maximum delay in seconds; used as long as less than the
+                  minimum number of latencies has been measured
+:param max_hedged_requests: Maximum number of hedged requests sent in
+                            addition to the original one
+:param minimum_samples: Minimum number of latencies measured before the
+                        percentile is used
+:param window_size: Number of latencies measured per host the percentile is
+                    calculated of
+:param methods: HTTP methods to hedge; defaults to "GET" and "HEAD"
+
+:since: v1.0.0
+        """
+
+        self._latencies = { }
+        """
+Latencies measured per host key
+        """
+        self._lock = Lock()
+        """
+Lock protecting the latencies
+        """
+        self.max_delay = max_delay
+        """
+Maximum delay in seconds before a hedged request is sent
+        """
+        self.max_hedged_requests = max_hedged_requests
+        """
+Maximum number of hedged requests sent in addition to the original one
+        """
+        self.methods = (( "GET", "HEAD" ) if (methods is None) else tuple(methods))
+        """
+HTTP methods to hedge
+        """
+        self.min_delay = min_delay
+        """
+Minimum delay in seconds before a hedged request is sent
+        """
+        self.minimum_samples = minimum_samples
+        """
+Minimum number of latencies measured before the percentile is used
+        """
+        self.percentile = percentile
+        """
+Percentile of the measured latencies used as delay
+        """
+        self.window_size = window_size
+        """
+Number of latencies measured per host the percentile is calculated of
+        """
+    #
+
+    def clear(self):
+        """
+Resets the latencies measured for all hosts.
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._latencies.clear()
+    #
+
+    def get_delay(self, key):
+        """
+Returns the delay after which a hedged request is sent to the given host.
+
+:param key: Host key
+
+:return: (float) Delay in seconds
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            latencies = self._latencies.get(key)
+            latencies = ([ ] if (latencies is None) else sorted(latencies))
+        #
+
+        if (len(latencies) < max(1, self.minimum_samples)): _return = self.max_delay
+        else:
+            _return = latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile / 100.0))]
+            if (self.max_delay is not None): _return = min(_return, self.max_delay)
+        #
+
+        return (_return if (self.min_delay is None or _return is None) else max(_return, self.min_delay))
+    #
+
+    def is_hedged(self, method, data = None):
+        """
+Returns true if requests of the given method may be hedged.
+
+:param method: HTTP method
+:param data: HTTP body
+
+:return: (bool) True to hedge the request
+:since:  v1.0.0
+        """
+
+        return (data is None and self.max_hedged_requests > 0 and method in self.methods)
+    #
+
+    def record(self, key, latency):
+        """
+Records the time until the response headers of a request to the given host
+have been received.
+
+:param key: Host key
+:param latency: Latency in seconds
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            latencies = self._latencies.get(key)
+
+            if (latencies is None or latencies.maxlen != self.window_size):
+                latencies = deque(([ ] if (latencies is None) else latencies), self.window_size)
+                self._latencies[key] = latencies
+            #
+
+            latencies.append(latency)
+        #
+    #
+#
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+from copy import copy
+from time import time
+
+from dpt_runtime.type_exception import TypeException
+
+from .client import Client
+from .connection_pool import ConnectionPool
+from .load_balancer import LoadBalancer
+
+class LoadBalancedClient(Client):
+    """
+HTTP client distributing requests across multiple upstream base URLs. The
+path and query of the client URL are appended to the base URL of the
+upstream selected. Each upstream uses its own connection pool instead of
+the one set for the client.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=arguments-differ,protected-access
+
+    __slots__ = [ "_hedged_upstream_indices", "_load_balancer", "_upstream_connection_pools", "_upstream_urls" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, urls, timeout = 6, event_handler = None, strategy = LoadBalancer.STRATEGY_ROUND_ROBIN, max_connections_per_upstream = 10):
+        """
+Constructor __init__(LoadBalancedClient)
+
+:param urls: List of upstream base URLs
+:param timeout: Connection timeout in seconds
+:param event_handler: EventHandler to use
+:param strategy: Load balancing strategy of "LoadBalancer"
+:param max_connections_per_upstream: Maximum number of connections borrowed
+                                     per upstream
+
+:since: v1.0.0
+        """
+
+        urls = list(urls)
+        if (len(urls) < 1): raise TypeException("No upstream URL given")
+
+        self._hedged_upstream_indices = None
+        """
+Upstream indices used by the requests sent for the same hedged request;
+None if not sending a hedged request
+        """
+        self._load_balancer = LoadBalancer(len(urls), strategy)
+        """
+Load balancer selecting the upstream of each request
+        """
+        self._upstream_connection_pools = [ ConnectionPool(max_connections_per_upstream) for _ in urls ]
+        """
+Connection pool per upstream
+        """
+        self._upstream_urls = urls
+        """
+List of upstream base URLs
+        """
+
+        Client.__init__(self, urls[0], timeout, event_handler)
+        self.path = "/"
+    #
+
+    @property
+    def load_balancer(self):
+        """
+Returns the load balancer selecting the upstream of each request.
+
+:return: (object) LoadBalancer instance
+:since:  v1.0.0
+        """
+
+        return self._load_balancer
+    #
+
+    @property
+    def upstream_urls(self):
+        """
+Returns the upstream base URLs.
+
+:return: (list) List of URLs
+:since:  v1.0.0
+        """
+
+        return list(self._upstream_urls)
+    #
+
+    def _get_upstream_client(self, index):
+        """
+Returns a copy of this client configured for the given upstream. Copies
+sending a request of a hedged request are configured directly.
+
+:param index: Upstream index
+
+:return: (object) LoadBalancedClient instance
+:since:  v1.0.0
+        """
+
+        path = self.path
+
+        _return = (copy(self) if (self._hedged_upstream_indices is None) else self)
+        _return.url = self._upstream_urls[index]
+        _return.path = self._join_upstream_path(_return.path, path)
+
+        _return.connection = None
+        _return._connection_pool = self._upstream_connection_pools[index]
+
+        return _return
+    #
+
+    @staticmethod
+    def _join_upstream_path(base_path, path):
+        """
+Returns the given client path and query appended to the path and query of
+an upstream base URL.
+
+:param base_path: Path and query of the upstream base URL
+:param path: Path and query of the client URL
+
+:return: (str) Path and query to request
+:since:  v1.0.0
+        """
+
+        ( base_path, _, base_query ) = base_path.partition("?")
+        ( path, _, query ) = path.partition("?")
+
+        _return = base_path.rstrip("/") + (path if (path.startswith("/")) else "/" + path)
+
+        query = "&".join(value for value in ( base_query, query ) if (value != ""))
+        if (query != ""): _return += "?" + query
+
+        return _return
+    #
+
+    def request(self, method, separator = ";", params = None, data = None):
+        """
+Call a given request method on the upstream selected by the load balancer.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+:param data: HTTP body
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        return (self._request_hedged(method, separator, params)
+                if (self._is_request_hedged(method, data)) else
+                self._request_upstream(method, separator, params, data)
+               )
+    #
+
+    def _request_hedged(self, method, separator = ";", params = None):
+        """
+Calls the given request method and sends hedged requests to other upstreams
+if the response headers have not been received within the delay of the
+hedging policy.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        client = copy(self)
+        client._hedged_upstream_indices = [ ]
+
+        return Client._request_hedged(client, method, separator, params)
+    #
+
+    def request_pipelined(self, requests, separator = ";"):
+        """
+Sends the given idempotent requests pipelined on one connection to the
+upstream selected by the load balancer.
+
+:param requests: List of tuples containing the HTTP method and query
+                 parameters as dict
+:param separator: Query parameter separator
+
+:return: (list) List of Response objects
+:since:  v1.0.0
+        """
+
+        index = self._load_balancer.acquire()
+        start_time = time()
+
+        try: _return = Client.request_pipelined(self._get_upstream_client(index), requests, separator)
+        except Exception:
+            self._load_balancer.release(index, time() - start_time, True)
+            raise
+        #
+
+        self._load_balancer.release(index, time() - start_time, (len(_return) < len(requests)))
+        return _return
+    #
+
+    def _request_upstream(self, method, separator = ";", params = None, data = None):
+        """
+Calls the given request method on the upstream selected by the load
+balancer. Upstreams used by other requests of the same hedged request are
+only selected if no other one is available. The time until the response
+headers have been received is recorded as latency unless the request has
+been cancelled.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+:param data: HTTP body
+
+:return: (object) Response object
+:since:  v1.0.0
+        """
+
+        index = self._load_balancer.acquire(self._hedged_upstream_indices)
+        if (self._hedged_upstream_indices is not None): self._hedged_upstream_indices.append(index)
+
+        start_time = time()
+
+        try: _return = Client.request(self._get_upstream_client(index), method, separator, params, data)
+        except Exception:
+            self._load_balancer.release(index, time() - start_time, True)
+            raise
+        #
+
+        if (self._is_cancelled): self._load_balancer.release(index)
+        else: self._load_balancer.release(index, time() - start_time, (_return.code is None or _return.code >= 500))
+
+        return _return
+    #
+#
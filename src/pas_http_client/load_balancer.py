@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from random import sample
+from threading import Lock
+
+from dpt_runtime.type_exception import TypeException
+
+class LoadBalancer(object):
+    """
+Thread-safe selection of upstreams by round-robin, least outstanding
+requests or the "power of two choices" based on the outstanding requests
+and the measured latencies.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    STRATEGY_LEAST_OUTSTANDING = "least_outstanding"
+    """
+Selects the upstream with the least requests in flight
+    """
+    STRATEGY_POWER_OF_TWO_CHOICES = "power_of_two_choices"
+    """
+Selects the better one of two random upstreams weighting the latency with
+the requests in flight
+    """
+    STRATEGY_ROUND_ROBIN = "round_robin"
+    """
+Selects the upstreams in turn
+    """
+
+    __slots__ = [ "__weakref__",
+                  "failure_penalty",
+                  "_latencies",
+                  "latency_weight",
+                  "_lock",
+                  "_next_index",
+                  "_outstanding_counts",
+                  "strategy"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, upstream_count, strategy = STRATEGY_ROUND_ROBIN, latency_weight = 0.3, failure_penalty = 1):
+        """
+Constructor __init__(LoadBalancer)
+
+:param upstream_count: Number of upstreams
+:param strategy: Selection strategy
+:param latency_weight: Weight of a new latency measurement in the
+                       exponentially weighted moving average
+:param failure_penalty: Minimum latency in seconds recorded for failed
+                        requests
+
+:since: v1.0.0
+        """
+
+        if (upstream_count < 1): raise TypeException("At least one upstream is required")
+
+        if (strategy not in ( LoadBalancer.STRATEGY_LEAST_OUTSTANDING,
+                              LoadBalancer.STRATEGY_POWER_OF_TWO_CHOICES,
+                              LoadBalancer.STRATEGY_ROUND_ROBIN
+                            )
+           ): raise TypeException("Load balancing strategy given is invalid")
+
+        self.failure_penalty = failure_penalty
+        """
+Minimum latency in seconds recorded for failed requests
+        """
+        self._latencies = [ None ] * upstream_count
+        """
+Exponentially weighted moving average of the latency per upstream
+        """
+        self.latency_weight = latency_weight
+        """
+Weight of a new latency measurement in the moving average
+        """
+        self._lock = Lock()
+        """
+Thread safety lock
+        """
+        self._next_index = 0
+        """
+Upstream index the next round-robin selection starts at
+        """
+        self._outstanding_counts = [ 0 ] * upstream_count
+        """
+Number of requests in flight per upstream
+        """
+        self.strategy = strategy
+        """
+Selection strategy
+        """
+    #
+
+    @property
+    def upstream_count(self):
+        """
+Returns the number of upstreams.
+
+:return: (int) Number of upstreams
+:since:  v1.0.0
+        """
+
+        return len(self._outstanding_counts)
+    #
+
+    def acquire(self, excluded_indices = None):
+        """
+Selects an upstream and counts a request in flight for it.
+
+:param excluded_indices: Upstream indices not to select unless no other one
+                         is available
+
+:return: (int) Upstream index
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            indices = self._get_round_robin_indices(excluded_indices)
+
+            if (self.strategy == LoadBalancer.STRATEGY_LEAST_OUTSTANDING):
+                _return = min(indices, key = self._outstanding_counts.__getitem__)
+            elif (self.strategy == LoadBalancer.STRATEGY_POWER_OF_TWO_CHOICES and len(indices) > 1):
+                _return = min(sample(indices, 2), key = self._get_load)
+            else: _return = indices[0]
+
+            self._next_index = (indices[0] + 1) % len(self._outstanding_counts)
+            self._outstanding_counts[_return] += 1
+        #
+
+        return _return
+    #
+
+    def get_latency(self, index):
+        """
+Returns the moving average of the latency of the given upstream.
+
+:param index: Upstream index
+
+:return: (float) Latency in seconds; None if not measured yet
+:since:  v1.0.0
+        """
+
+        with self._lock: return self._latencies[index]
+    #
+
+    def get_outstanding_count(self, index):
+        """
+Returns the number of requests in flight for the given upstream.
+
+:param index: Upstream index
+
+:return: (int) Number of requests
+:since:  v1.0.0
+        """
+
+        with self._lock: return self._outstanding_counts[index]
+    #
+
+    def _get_load(self, index):
+        """
+Returns the expected load of the given upstream. The lock must be held.
+
+:param index: Upstream index
+
+:return: (float) Load value
+:since:  v1.0.0
+        """
+
+        latency = self._latencies[index]
+        return (0 if (latency is None) else latency * (self._outstanding_counts[index] + 1))
+    #
+
+    def _get_round_robin_indices(self, excluded_indices):
+        """
+Returns the upstream indices starting at the next round-robin one without
+the excluded ones. The lock must be held.
+
+:param excluded_indices: Upstream indices not to return unless no other one
+                         is available
+
+:return: (list) Upstream indices
+:since:  v1.0.0
+        """
+
+        upstream_count = len(self._outstanding_counts)
+        _return = [ (self._next_index + offset) % upstream_count for offset in range(upstream_count) ]
+
+        if (excluded_indices is not None):
+            indices = [ index for index in _return if (index not in excluded_indices) ]
+            if (len(indices) > 0): _return = indices
+        #
+
+        return _return
+    #
+
+    def release(self, index, latency = None, is_failure = False):
+        """
+Counts a request of the given upstream as completed and records its
+latency.
+
+:param index: Upstream index
+:param latency: Latency in seconds measured; None if not measured
+:param is_failure: True if the request failed
+
+:since: v1.0.0
+        """
+
+        if (latency is not None and is_failure): latency = max(latency, self.failure_penalty)
+
+        with self._lock:
+            self._outstanding_counts[index] -= 1
+
+            if (latency is not None):
+                average_latency = self._latencies[index]
+
+                self._latencies[index] = (latency
+                                          if (average_latency is None) else
+                                          average_latency + self.latency_weight * (latency - average_latency)
+                                         )
+            #
+        #
+    #
+#
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+from threading import RLock
+
+from .abstract_response_cache_store import AbstractResponseCacheStore
+
+class MemoryResponseCacheStore(AbstractResponseCacheStore):
+    """
+Thread-safe in-memory storage for response cache entries. The least
+recently used entries are removed if the size limit is exceeded.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_entries", "_lock", "max_size", "_size" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_size = 67108864):
+        """
+Constructor __init__(MemoryResponseCacheStore)
+
+:param max_size: Maximum number of bytes used by all entries
+
+:since: v1.0.0
+        """
+
+        self._entries = OrderedDict()
+        """
+Entries and their sizes in least recently used order
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self.max_size = max_size
+        """
+Maximum number of bytes used by all entries
+        """
+        self._size = 0
+        """
+Number of bytes used by all entries
+        """
+    #
+
+    @property
+    def size(self):
+        """
+Returns the number of bytes used by all entries.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        with self._lock: return self._size
+    #
+
+    def clear(self):
+        """
+Removes all entries.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        #
+    #
+
+    def delete(self, key):
+        """
+Removes the entry for the given key.
+
+:param key: Cache key
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            if (key in self._entries): self._size -= self._entries.pop(key)[1]
+        #
+    #
+
+    def get(self, key):
+        """
+Returns the entry for the given key.
+
+:param key: Cache key
+
+:return: (object) ResponseCacheEntry instance; None if not stored
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            _return = self._entries.get(key)
+
+            if (_return is not None):
+                del(self._entries[key])
+                self._entries[key] = _return
+            #
+        #
+
+        return (None if (_return is None) else _return[0])
+    #
+
+    def set(self, key, entry):
+        """
+Stores the entry for the given key replacing an existing one.
+
+:param key: Cache key
+:param entry: ResponseCacheEntry instance
+
+:since: v1.0.0
+        """
+
+        entry_size = entry.size
+
+        with self._lock:
+            self.delete(key)
+
+            if (entry_size <= self.max_size):
+                self._entries[key] = ( entry, entry_size )
+                self._size += entry_size
+
+                while (self._size > self.max_size): self._size -= self._entries.pop(next(iter(self._entries)))[1]
+            #
+        #
+    #
+#
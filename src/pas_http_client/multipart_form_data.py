@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from binascii import hexlify
+from os import fstat, stat, urandom
+from os.path import basename
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.type_exception import TypeException
+
+class MultipartFormData(object):
+    """
+Streaming "multipart/form-data" encoder. Fields and files are only read
+while the body is iterated.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    BLOCK_SIZE = 65536
+    """
+Number of bytes read from files at once
+    """
+
+    __slots__ = [ "__weakref__", "boundary", "_parts" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, boundary = None):
+        """
+Constructor __init__(MultipartFormData)
+
+:param boundary: Boundary to use; None to generate a random one
+
+:since: v1.0.0
+        """
+
+        self.boundary = (Binary.str(hexlify(urandom(16))) if (boundary is None) else boundary)
+        """
+Boundary separating the parts
+        """
+        self._parts = [ ]
+        """
+List of part definitions
+        """
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Generator yielding the encoded body
+:since:  v1.0.0
+        """
+
+        for part in self._parts:
+            yield self._get_part_header(part)
+
+            if (part['value'] is not None): yield part['value']
+            else:
+                _file = (open(part['file_name'], "rb") if (part['file'] is None) else part['file'])
+
+                try:
+                    if (part['file_position'] is not None): _file.seek(part['file_position'])
+
+                    while True:
+                        data = _file.read(self.__class__.BLOCK_SIZE)
+                        if (not data): break
+
+                        yield data
+                    #
+                finally:
+                    if (part['file'] is None): _file.close()
+                #
+            #
+
+            yield Binary.bytes("\r\n")
+        #
+
+        yield Binary.utf8_bytes("--{0}--\r\n".format(self.boundary))
+    #
+
+    @property
+    def content_type(self):
+        """
+Returns the value of the "Content-Type" header for this body.
+
+:return: (str) Content type including the boundary
+:since:  v1.0.0
+        """
+
+        return "multipart/form-data; boundary={0}".format(self.boundary)
+    #
+
+    @property
+    def length(self):
+        """
+Returns the total length of the encoded body if the sizes of all files are
+known.
+
+:return: (int) Body length; None if unknown
+:since:  v1.0.0
+        """
+
+        _return = len(Binary.utf8_bytes("--{0}--\r\n".format(self.boundary)))
+
+        for part in self._parts:
+            part_size = (len(part['value']) if (part['value'] is not None) else part['size'])
+            if (part_size is None): return None
+
+            _return += len(self._get_part_header(part)) + part_size + 2
+        #
+
+        return _return
+    #
+
+    def add_field(self, name, value, content_type = None):
+        """
+Adds a form field. Bytes-like values are sent as given, other ones are
+converted to UTF-8 encoded strings.
+
+:param name: Field name
+:param value: Field value
+:param content_type: Content type of the value; None to omit it
+
+:since: v1.0.0
+        """
+
+        if (isinstance(value, ( bytearray, memoryview ))): value = Binary.BYTES_TYPE(value)
+        elif (not isinstance(value, ( str, Binary.BYTES_TYPE ))): value = str(value)
+
+        self._parts.append({ "name": name,
+                             "value": Binary.utf8_bytes(value),
+                             "file": None,
+                             "file_name": None,
+                             "file_position": None,
+                             "content_type": content_type,
+                             "size": None
+                           })
+    #
+
+    def add_file(self, name, file_object_or_path, file_name = None, content_type = "application/octet-stream"):
+        """
+Adds a file. Files given by path are opened while the body is iterated.
+File objects must be opened in binary mode.
+
+:param name: Field name
+:param file_object_or_path: Binary file object or path and file name
+:param file_name: File name sent; None to use the one of the path
+:param content_type: Content type of the file
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (hasattr(file_object_or_path, "read")):
+            _file = file_object_or_path
+            path = None
+
+            if (not isinstance(_file.read(0), Binary.BYTES_TYPE)): raise TypeException("File given is not opened in binary mode")
+
+            try:
+                file_position = _file.tell()
+
+                try: size = fstat(_file.fileno()).st_size - file_position
+                except Exception: size = _file.seek(0, 2) - file_position
+
+                _file.seek(file_position)
+            except Exception: ( file_position, size ) = ( None, None )
+
+            if (file_name is None): file_name = basename(getattr(_file, "name", name))
+        elif (type(file_object_or_path) is str):
+            _file = None
+            file_position = None
+            path = file_object_or_path
+            size = stat(path).st_size
+
+            if (file_name is None): file_name = basename(path)
+        else: raise TypeException("File given is invalid")
+
+        self._parts.append({ "name": name,
+                             "value": None,
+                             "file": _file,
+                             "file_name": path,
+                             "file_position": file_position,
+                             "content_type": content_type,
+                             "size": size,
+                             "upload_file_name": file_name
+                           })
+    #
+
+    def _get_part_header(self, part):
+        """
+Returns the encoded boundary and headers of the given part.
+
+:param part: Part definition
+
+:return: (bytes) Part header
+:since:  v1.0.0
+        """
+
+        _return = "--{0}\r\nContent-Disposition: form-data; name=\"{1}\"".format(self.boundary, self._quote(part['name']))
+
+        if ("upload_file_name" in part): _return += "; filename=\"{0}\"".format(self._quote(part['upload_file_name']))
+        if (part['content_type'] is not None): _return += "\r\nContent-Type: {0}".format(part['content_type'])
+
+        _return += "\r\n\r\n"
+
+        return Binary.utf8_bytes(_return)
+    #
+
+    @staticmethod
+    def _quote(value):
+        """
+Returns the given value escaped for a quoted "Content-Disposition"
+parameter.
+
+:param value: Parameter value
+
+:return: (str) Escaped value
+:since:  v1.0.0
+        """
+
+        return Binary.str(value).replace("\"", "%22").replace("\r", "%0D").replace("\n", "%0A")
+    #
+#
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class PipelineSocket(object):
+    """
+Socket wrapper returning the same buffered reader for all responses
+received on a pipelined connection. Closing the reader is ignored to keep
+data buffered for subsequent responses.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_file" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, _file):
+        """
+Constructor __init__(PipelineSocket)
+
+:param _file: Buffered reader of the socket
+
+:since: v1.0.0
+        """
+
+        self._file = _file
+        """
+Buffered reader of the socket
+        """
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute of the buffered reader
+:since:  v1.0.0
+        """
+
+        return getattr(self._file, name)
+    #
+
+    def close(self):
+        """
+Ignores the request to close the shared buffered reader.
+
+:since: v1.0.0
+        """
+    #
+
+    def makefile(self, *args, **kwargs):
+        """
+Returns this wrapper as the file object of the socket.
+
+:return: (object) PipelineSocket instance
+:since:  v1.0.0
+        """
+
+        # pylint: disable=unused-argument
+
+        return self
+    #
+#
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from threading import Lock, RLock
+from time import sleep, time
+
+class RateLimiter(object):
+    """
+Thread-safe token bucket per host limiting the rate of requests sent. Tokens
+are reserved in order so that waiting callers are served first come, first
+served.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_buckets", "burst", "is_blocking", "_lock", "rate", "_rates" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide RateLimiter instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self, rate = 10, burst = None, is_blocking = True):
+        """
+Constructor __init__(RateLimiter)
+
+:param rate: Number of requests per second allowed per host by default
+:param burst: Maximum number of tokens per host; defaults to the rate
+:param is_blocking: True to wait for a token by default; False to fail
+                    immediately if none is available
+
+:since: v1.0.0
+        """
+
+        self._buckets = { }
+        """
+Tokens available and the time they have been calculated at per host key
+        """
+        self.burst = burst
+        """
+Maximum number of tokens per host; None for the rate
+        """
+        self.is_blocking = is_blocking
+        """
+True to wait for a token by default
+        """
+        self._lock = Lock()
+        """
+Lock protecting the buckets
+        """
+        self.rate = rate
+        """
+Number of requests per second allowed per host by default
+        """
+        self._rates = { }
+        """
+Rate and burst configured per host key
+        """
+    #
+
+    def acquire(self, key, is_blocking = None, timeout = None):
+        """
+Takes a token for a request to the given host. Blocking calls wait until a
+token is available unless the wait exceeds the timeout given.
+
+:param key: Host key
+:param is_blocking: True to wait for a token; None for the default
+:param timeout: Maximum number of seconds to wait; None to wait as long as
+                needed
+
+:return: (bool) True if a token has been taken
+:since:  v1.0.0
+        """
+
+        if (is_blocking is None): is_blocking = self.is_blocking
+
+        delay = self.reserve(key, (timeout if (is_blocking) else 0))
+        if (delay is not None and delay > 0): sleep(delay)
+
+        return (delay is not None)
+    #
+
+    def clear(self):
+        """
+Resets the buckets of all hosts.
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._buckets.clear()
+    #
+
+    def _get_rate(self, key):
+        """
+Returns the rate and burst for the given host.
+
+:param key: Host key
+
+:return: (tuple) Requests per second and maximum number of tokens
+:since:  v1.0.0
+        """
+
+        ( rate, burst ) = self._rates.get(key, ( self.rate, self.burst ))
+        return ( rate, (max(1, rate) if (burst is None) else burst) )
+    #
+
+    def get_tokens(self, key):
+        """
+Returns the number of tokens currently available for the given host.
+Negative values are tokens reserved by waiting callers.
+
+:param key: Host key
+
+:return: (float) Number of tokens
+:since:  v1.0.0
+        """
+
+        with self._lock: return self._get_tokens(key, time())
+    #
+
+    def _get_tokens(self, key, current_time):
+        """
+Returns the number of tokens available for the given host at the given
+time. The lock must be held.
+
+:param key: Host key
+:param current_time: UNIX timestamp
+
+:return: (float) Number of tokens
+:since:  v1.0.0
+        """
+
+        ( rate, burst ) = self._get_rate(key)
+        bucket = self._buckets.get(key)
+
+        return (burst if (bucket is None) else min(burst, bucket[0] + rate * (current_time - bucket[1])))
+    #
+
+    def reserve(self, key, max_wait = None):
+        """
+Reserves a token for a request to the given host and returns the time to
+wait before sending it. No token is reserved if the wait exceeds the
+maximum given.
+
+:param key: Host key
+:param max_wait: Maximum number of seconds to wait; None to reserve a token
+                 regardless of the wait
+
+:return: (float) Seconds to wait; None if no token has been reserved
+:since:  v1.0.0
+        """
+
+        ( rate, _ ) = self._get_rate(key)
+
+        with self._lock:
+            current_time = time()
+            tokens = self._get_tokens(key, current_time)
+
+            if (tokens >= 1): _return = 0
+            else: _return = ((1 - tokens) / rate if (rate > 0) else None)
+
+            if (_return is not None and max_wait is not None and _return > max_wait): _return = None
+            if (_return is not None): tokens -= 1
+
+            self._buckets[key] = ( tokens, current_time )
+        #
+
+        return _return
+    #
+
+    def set_rate(self, key, rate, burst = None):
+        """
+Sets the rate for the given host overriding the default one.
+
+:param key: Host key
+:param rate: Number of requests per second allowed
+:param burst: Maximum number of tokens; defaults to the rate
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            current_time = time()
+
+            self._buckets[key] = ( self._get_tokens(key, current_time), current_time )
+            self._rates[key] = ( rate, burst )
+        #
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide RateLimiter instance.
+
+:return: (object) RateLimiter instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+#
@@ -19,21 +19,42 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=import-error,invalid-name,no-name-in-module
 
+import socket
 import ssl
 
+from functools import partial
+from io import BytesIO
+from time import sleep, time
+
 try:
     import http.client as http_client
-    from urllib.parse import quote_plus, urlencode, urlsplit
+    from urllib.parse import quote_plus, urlsplit
 except ImportError:
     import httplib as http_client
-    from urllib import quote_plus, urlencode
+    from urllib import quote_plus
     from urlparse import urlsplit
 #
 
 from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
 from dpt_runtime.type_exception import TypeException
 
 from .abstract_raw_client import AbstractRawClient
+from .body_reader import BodyReader
+from .caching_body_reader import CachingBodyReader
+from .circuit_breaker import CircuitBreaker
+from .connection_pool import ConnectionPool
+from .decoding_body_reader import DecodingBodyReader
+from .gzip_body_encoder import GzipBodyEncoder
+from .http_connection_factory import HttpConnectionFactory
+from .https_connection_factory import HttpsConnectionFactory
+from .multipart_form_data import MultipartFormData
+from .pipeline_socket import PipelineSocket
+from .request_deadline import RequestDeadline
+from .response_cache import ResponseCache
+from .tls_context_cache import TlsContextCache
+from .tls_session_connection import TlsSessionConnection
+from .zlib_content_decoder import ZlibContentDecoder
 
 class RawClient(AbstractRawClient):
     """
@@ -48,11 +69,57 @@ Minimal HTTP client abstraction layer returning raw HTTP responses.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "_pem_cert_file_name", "_pem_key_file_name" ]
+    __slots__ = [ "_address_resolver",
+                  "_circuit_breaker",
+                  "_concurrency_limiter",
+                  "_connect_timeout",
+                  "_connection_factory",
+                  "_connection_pool",
+                  "_first_byte_timeout",
+                  "_is_cancelled",
+                  "_is_content_decoded",
+                  "_max_decoded_ratio",
+                  "_max_decoded_size",
+                  "_pem_cert_file_name",
+                  "_pem_key_file_name",
+                  "_rate_limiter",
+                  "_raw_chunked_reading",
+                  "_read_idle_timeout",
+                  "_request_compression_level",
+                  "_request_compression_min_size",
+                  "_response_cache",
+                  "_retry_policy",
+                  "_socket_options",
+                  "_tls_ca_file_name",
+                  "_tls_handshake_timeout",
+                  "_tls_verified",
+                  "_total_timeout"
+                ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    PIPELINING_METHODS = ( "GET", "HEAD" )
+    """
+Idempotent HTTP methods allowed for pipelined requests
+    """
+
+    _connection_factories = { "http": HttpConnectionFactory(), "https": HttpsConnectionFactory() }
+    """
+Connection factories registered per URL scheme
+    """
+    _caching_body_reader_class = CachingBodyReader
+    """
+Body reader class used to store responses in the response cache
+    """
+    _content_decoders = { "deflate": ZlibContentDecoder, "gzip": ZlibContentDecoder, "x-gzip": ZlibContentDecoder }
+    """
+Content decoder classes registered per content-coding
+    """
+    _decoding_body_reader_class = DecodingBodyReader
+    """
+Body reader class used to decode content-coded bodies
+    """
 
     def __init__(self, url, timeout = 30, return_reader = False, log_handler = None):
         """
@@ -67,6 +134,55 @@ Constructor __init__(RawClient)
 :since: v1.0.0
         """
 
+        self._address_resolver = None
+        """
+Address resolver used to connect; None to let "http.client" resolve host
+names for each connection
+        """
+        self._circuit_breaker = None
+        """
+Circuit breaker rejecting requests to failing hosts; None to disable it
+        """
+        self._concurrency_limiter = None
+        """
+Concurrency limiter adapting the number of requests in flight per host;
+None for no limit
+        """
+        self._connect_timeout = None
+        """
+Timeout in seconds for connecting; None to use the socket timeout
+        """
+        self._connection_factory = None
+        """
+Connection factory overriding the one registered for the URL scheme
+        """
+        self._connection_pool = ConnectionPool.get_instance()
+        """
+Connection pool used to borrow connections; None to use one connection per
+client instance
+        """
+        self._first_byte_timeout = None
+        """
+Timeout in seconds to wait for the response after the request has been
+sent; None to use the socket timeout
+        """
+        self._is_cancelled = False
+        """
+True if the request sent by this client instance has been cancelled as its
+result is not used
+        """
+        self._is_content_decoded = False
+        """
+True to request and decode content-coded response bodies
+        """
+        self._max_decoded_ratio = None
+        """
+Maximum ratio of decoded to encoded body size accepted
+        """
+        self._max_decoded_size = None
+        """
+Maximum decoded body size accepted
+        """
         self._pem_cert_file_name = None
         """
 Path and file name of the PEM-encoded certificate file
@@ -75,14 +191,156 @@ Path and file name of the PEM-encoded certificate file
         """
 Path and file name of the private key
         """
+        self._rate_limiter = None
+        """
+Rate limiter for requests per host; None for no limit
+        """
+        self._raw_chunked_reading = False
+        """
+True to decode chunked transfer-encoded bodies with the library decoder
+reading from the raw socket
+        """
+        self._read_idle_timeout = None
+        """
+Timeout in seconds for sending and each read of the response body; None to
+use the socket timeout
+        """
+        self._request_compression_level = None
+        """
+zlib compression level for request bodies; None to send them uncompressed
+        """
+        self._request_compression_min_size = 1024
+        """
+Minimum size of request bodies of known length to be compressed
+        """
+        self._response_cache = None
+        """
+Response cache used for requests; None to disable caching
+        """
+        self._retry_policy = None
+        """
+Retry policy for failed requests; None to never retry
+        """
+        self._socket_options = None
+        """
+Socket options applied to new connections; None for the defaults
+        """
+        self._tls_ca_file_name = None
+        """
+Path and file name of the CA certificates to verify the peer with
+        """
+        self._tls_handshake_timeout = None
+        """
+Timeout in seconds for the SSL/TLS handshake; None to use the socket timeout
+        """
+        self._tls_verified = True
+        """
+False to disable peer certificate and host name verification
+        """
+        self._total_timeout = None
+        """
+Timeout in seconds for the request including reading the response body;
+None for no deadline
+        """
 
         AbstractRawClient.__init__(self, url, timeout, return_reader, log_handler)
     #
 
+    @property
+    def connection_factory(self):
+        """
+Returns the connection factory used for new connections.
+
+:return: (object) Connection factory
+:since:  v1.0.0
+        """
+
+        _return = self._connection_factory
+        if (_return is None): _return = self.__class__._connection_factories.get(self.scheme)
+
+        if (_return is None): raise TypeException("URL scheme '{0}' is not supported".format(self.scheme))
+        return _return
+    #
+
+    @property
+    def _connection_host(self):
+        """
+Returns the host name or address to connect to. IPv6 link local addresses
+are combined with the configured interface.
+
+:return: (str) Host name or address
+:since:  v1.0.0
+        """
+
+        if (":" in self.host):
+            _return = self.host[1:-1]
+
+            if (_return[:6] == "fe80::"
+                and self.ipv6_link_local_interface is not None
+               ): _return = "{0}%{1}".format(self.host[1:-1], self.ipv6_link_local_interface)
+        else: _return = self.host
+
+        return _return
+    #
+
+    @property
+    def _connection_pool_key(self):
+        """
+Returns the key identifying connections compatible with the current
+configuration in the connection pool.
+
+:return: (tuple) Connection pool key
+:since:  v1.0.0
+        """
+
+        return ( self.scheme,
+                 self.host,
+                 self.port,
+                 self._pem_cert_file_name,
+                 self._pem_key_file_name,
+                 self._tls_ca_file_name,
+                 self._tls_verified,
+                 self.ipv6_link_local_interface,
+                 self.connection_factory,
+                 self._socket_options
+               )
+    #
+
+    @property
+    def _host_header(self):
+        """
+Returns the value of the "Host" header for requests.
+
+:return: (str) Host header value
+:since:  v1.0.0
+        """
+
+        _return = self.host
+
+        if ((self.scheme != "https" or self.port != http_client.HTTPS_PORT)
+            and (self.scheme != "http" or self.port != http_client.HTTP_PORT)
+           ): _return += ":{0:d}".format(self.port)
+
+        return _return
+    #
+
+    @property
+    def _host_key(self):
+        """
+Returns the key identifying the host in retry budgets and circuit breakers.
+
+:return: (tuple) Host key
+:since:  v1.0.0
+        """
+
+        return ( self.scheme, self.host, self.port )
+    #
+
     @property
     def _tls_kwargs(self):
         """
-Returns arguments to be used for creating an SSL/TLS connection.
+Returns arguments to be used for creating an SSL/TLS connection. Contexts
+are shared with other clients using the same TLS settings.
 
 :return: (dict) Connection arguments
 :since:  v1.0.0
@@ -91,14 +349,11 @@ Returns arguments to be used for creating an SSL/TLS connection.
         _return = { }
 
         if (hasattr(ssl, "create_default_context")):
-            ssl_context = ssl.create_default_context()
-
-            if (self._pem_cert_file_name is not None):
-                if (self._pem_key_file_name is not None): ssl_context.load_cert_chain(self._pem_cert_file_name, self._pem_key_file_name)
-                else: ssl_context.load_cert_chain(self._pem_cert_file_name)
-            #
-
-            _return['context'] = ssl_context
+            _return['context'] = TlsContextCache.get_instance().get_context(self._pem_cert_file_name,
+                                                                            self._pem_key_file_name,
+                                                                            self._tls_ca_file_name,
+                                                                            self._tls_verified
+                                                                           )
         elif (self._pem_cert_file_name is not None):
             if (self._pem_key_file_name is not None): _return['key_file'] = self._pem_key_file_name
             _return['cert_file'] = self._pem_cert_file_name
@@ -136,6 +391,33 @@ Returns the URL used for all subsequent requests.
         return _return
     #
 
+    def _acquire_request_limits(self, deadline, request_count = 1):
+        """
+Acquires a token of the rate limiter per request and a slot of the
+concurrency limiter before a connection is used. Blocking limiters wait
+until the request deadline at most.
+
+:param deadline: RequestDeadline limiting the time to wait
+:param request_count: Number of requests sent on the connection
+
+:since: v1.0.0
+        """
+
+        host_key = self._host_key
+
+        if (self._rate_limiter is not None):
+            for _ in range(request_count):
+                if (not self._rate_limiter.acquire(host_key, timeout = deadline.get_timeout(None))):
+                    raise IOException("Rate limit for {0!r} exceeded".format(host_key))
+                #
+            #
+        #
+
+        if (self._concurrency_limiter is not None
+            and (not self._concurrency_limiter.acquire(host_key, timeout = deadline.get_timeout(None)))
+           ): raise IOException("Concurrency limit for {0!r} reached".format(host_key))
+    #
+
     def _configure(self, url):
         """
 Configures the HTTP connection parameters for later use.
@@ -163,192 +445,1102 @@ Configures the HTTP connection parameters for later use.
         if (url_elements.query != ""): self.path = "{0}?{1}".format(self.path, url_elements.query)
     #
 
-    def _get_connection(self):
+    def _connect(self, connection, deadline):
         """
-Returns a connection to the HTTP server.
+Connects the given "http.client" connection applying the connect and
+SSL/TLS handshake timeouts as well as the socket options.
 
-:return: (mixed) Response data; Exception on error
-:since:  v1.0.0
+:param connection: HTTP connection
+:param deadline: RequestDeadline limiting the time to connect
+
+:since: v1.0.0
         """
 
-        # pylint: disable=star-args
+        connection.timeout = deadline.get_timeout(self._get_phase_timeout(self._connect_timeout))
 
-        if (self.connection is None):
-            if (":" in self.host):
-                host = self.host[1:-1]
+        if (isinstance(connection, TlsSessionConnection)):
+            connection.tls_handshake_timeout = deadline.get_timeout(self._get_phase_timeout(self._tls_handshake_timeout))
+        #
 
-                if (host[:6] == "fe80::"
-                    and self.ipv6_link_local_interface is not None
-                   ): host = "{0}%{1}".format(self.host[1:-1], self.ipv6_link_local_interface)
-            else: host = self.host
+        try: connection.connect()
+        finally: connection.timeout = self.timeout
 
-            kwargs = (self._tls_kwargs if (self.scheme == "https") else { })
+        if (self._socket_options is not None): self._socket_options.apply(connection.sock, True)
+    #
 
-            try: self.connection = http_client.HTTPSConnection(host, self.port, timeout = self.timeout, **kwargs)
-            except TypeError: self.connection = http_client.HTTPSConnection(host, self.port, **kwargs)
-        #
+    def _compress_request_body(self, kwargs):
+        """
+Compresses the body of the given "_request()" keyword arguments with "gzip"
+if it is not content-coded already and not smaller than the configured
+minimum size. Streamed bodies are compressed while they are sent.
+
+:param kwargs: Keyword arguments for "_request()"
+
+:since: v1.0.0
+        """
+
+        body = kwargs['body']
+        headers = kwargs.setdefault("headers", { })
+        header_names = dict(( name.lower(), name ) for name in headers)
+
+        if ("content-encoding" not in header_names and (not hasattr(body, "__aiter__"))):
+            body_length = (len(body) if (isinstance(body, Binary.BYTES_TYPE)) else self._get_body_length(body))
+
+            if (body_length is None or body_length >= self._request_compression_min_size):
+                if ("content-length" in header_names): del(headers[header_names['content-length']])
 
-        return self.connection
+                if (isinstance(body, Binary.BYTES_TYPE)): kwargs['body'] = GzipBodyEncoder.compress(body, self._request_compression_level)
+                else:
+                    kwargs['body'] = GzipBodyEncoder(body, self._request_compression_level)
+                    kwargs['encode_chunked'] = True
+
+                    headers['transfer-encoding'] = "chunked"
+                #
+
+                headers['content-encoding'] = "gzip"
+            #
+        #
     #
 
-    def _request(self, method, **kwargs):
+    def _get_body_decoder(self, method, content_encoding):
         """
-Sends the request to the connected HTTP server and returns the result.
+Returns the factory for the reader decoding the content-coded body of a
+response.
 
 :param method: HTTP method
+:param content_encoding: Value of the "Content-Encoding" response header
 
-:return: (dict) Response data; 'body' may contain the catched Exception
+:return: (object) Decoding body reader factory; None if not content-coded
 :since:  v1.0.0
         """
 
-        # pylint: disable=star-args
-
-        connection = self._get_connection()
-        connection.request(method, **kwargs)
-        response = connection.getresponse()
+        _return = None
 
-        _return = { "code": response.status, "headers": { }, "body": None }
-        for header in response.getheaders(): _return['headers'][header[0].lower().replace("-", "_")] = header[1]
+        if (self._is_content_decoded and method != "HEAD" and content_encoding is not None):
+            content_encoding = content_encoding.strip().lower()
+            content_decoder_class = self.__class__._content_decoders.get(content_encoding)
 
-        if (self._return_reader): _return['body_reader'] = response.read
-
-        if (response.status < 100 or response.status >= 400):
-            _return['body'] = http_client.HTTPException("{0} {1}".format(str(response.status), str(response.reason)), response.status)
-            if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -RawClient._request()- reporting: {0:d} for '{1}'", response.status, response.read())
-        elif (method != "HEAD" and (not self._return_reader)): _return['body'] = response.read()
+            if (content_decoder_class is not None):
+                _return = partial(self.__class__._decoding_body_reader_class,
+                                  decoder = content_decoder_class(content_encoding),
+                                  max_size = self._max_decoded_size,
+                                  max_ratio = self._max_decoded_ratio
+                                 )
+            #
+        #
 
         return _return
     #
 
-    def request_delete(self, params = None, separator = ";", data = None):
+    def _get_cached_raw_response(self, method, kwargs):
         """
-Do a DELETE request on the connected HTTP server.
+Returns the raw response dict for a fresh response stored in the response
+cache for the given request. Conditional request headers are added to the
+keyword arguments given if a stale response can be revalidated.
 
-:param params: Query parameters as dict
-:param separator: Query parameter separator
-:param data: HTTP body
+:param method: HTTP method
+:param kwargs: Keyword arguments for "_request()"
 
-:return: (mixed) Response data; Exception on error
+:return: (tuple) Response data if fresh and the ResponseCacheEntry instance
+         to be revalidated if stale
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("DELETE", separator, params, data)
+        _return = ( None, None )
+        response_cache = self._response_cache
+
+        if (response_cache is not None and method in ( "GET", "HEAD" )):
+            request_headers = kwargs.get("headers")
+            cache_entry = response_cache.get_entry(method, self._get_response_cache_url(kwargs['url']), request_headers)
+
+            if (cache_entry is None): pass
+            elif (response_cache.is_fresh(cache_entry, request_headers)): _return = ( self._new_cached_raw_response(method, cache_entry), None )
+            else:
+                conditional_headers = response_cache.get_conditional_headers(cache_entry)
+                request_header_names = ([ ] if (request_headers is None) else [ name.lower() for name in request_headers ])
+
+                if (len(conditional_headers) > 0
+                    and "if-none-match" not in request_header_names
+                    and "if-modified-since" not in request_header_names
+                   ):
+                    kwargs['headers'] = ({ } if (request_headers is None) else request_headers.copy())
+                    kwargs['headers'].update(conditional_headers)
+
+                    _return = ( None, cache_entry )
+                #
+            #
+        #
+
+        return _return
     #
 
-    def request_get(self, params = None, separator = ";"):
+    def _get_caching_body_reader(self, method, kwargs, response, headers, body_reader, request_time):
         """
-Do a GET request on the connected HTTP server.
+Returns a body reader storing the response in the response cache if it is
+storable. Stored responses are invalidated by successful unsafe requests.
 
-:param params: Query parameters as dict
-:param separator: Query parameter separator
+:param method: HTTP method
+:param kwargs: Keyword arguments for "_request()"
+:param response: HTTP response object
+:param headers: Response headers dict
+:param body_reader: Body reader of the response
+:param request_time: UNIX timestamp the request has been sent
 
-:return: (mixed) Response data; Exception on error
+:return: (object) Body reader
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("GET", separator, params)
+        _return = body_reader
+        response_cache = self._response_cache
+
+        if (response_cache is not None):
+            cache_url = self._get_response_cache_url(kwargs['url'])
+            request_headers = kwargs.get("headers")
+
+            if (method in ResponseCache.UNSAFE_METHODS):
+                if (200 <= response.status < 400): response_cache.invalidate(cache_url)
+            elif (response_cache.is_storable(method, response.status, headers, request_headers)):
+                _return = self.__class__._caching_body_reader_class(body_reader,
+                                                                    partial(response_cache.set,
+                                                                            cache_url,
+                                                                            response.status,
+                                                                            response.reason,
+                                                                            headers,
+                                                                            request_headers = request_headers,
+                                                                            request_time = request_time,
+                                                                            response_time = time()
+                                                                           ),
+                                                                    response_cache.max_entry_size
+                                                                   )
+            #
+        #
+
+        return _return
     #
 
-    def request_head(self, params = None, separator = ";"):
+    def _get_revalidated_raw_response(self, method, kwargs, cache_entry, response, headers, request_time):
         """
-Do a HEAD request on the connected HTTP server.
+Returns the raw response dict for the stale response revalidated if the
+server responded with "304 Not Modified".
 
-:param params: Query parameters as dict
-:param separator: Query parameter separator
+:param method: HTTP method
+:param kwargs: Keyword arguments for "_request()"
+:param cache_entry: ResponseCacheEntry instance revalidated
+:param response: HTTP response object
+:param headers: Response headers dict
+:param request_time: UNIX timestamp the request has been sent
 
-:return: (mixed) Response data; Exception on error
+:return: (dict) Response data; None if not revalidated
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("HEAD", separator, params)
+        _return = None
+
+        if (cache_entry is not None and response.status == 304):
+            cache_entry = self._response_cache.update(self._get_response_cache_url(kwargs['url']),
+                                                      cache_entry,
+                                                      headers,
+                                                      kwargs.get("headers"),
+                                                      request_time,
+                                                      time()
+                                                     )
+
+            _return = self._new_cached_raw_response(method, cache_entry)
+        #
+
+        return _return
     #
 
-    def request_patch(self, data = None, params = None, separator = ";"):
+    def _get_connection(self, deadline = None):
         """
-Do a PATCH request on the connected HTTP server.
+Returns a connection to the HTTP server. Connections are borrowed from the
+connection pool if one is set and connected before being returned.
 
-:param data: HTTP body
-:param params: Query parameters as dict
-:param separator: Query parameter separator
+:param deadline: RequestDeadline limiting the time to wait and connect
 
 :return: (mixed) Response data; Exception on error
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("PATCH", separator, params, data)
+        if (deadline is None): deadline = RequestDeadline()
+
+        connection_pool = self._connection_pool
+        connection_pool_key = self._connection_pool_key
+
+        if (connection_pool is None):
+            if (self.connection is None): self.connection = self._new_connection()
+        else: self.connection = connection_pool.borrow(connection_pool_key, self._new_connection, deadline.get_timeout(self.timeout))
+
+        connection = self.connection
+
+        if (hasattr(connection, "_create_connection") and connection.sock is None):
+            try: self._connect(connection, deadline)
+            except Exception:
+                self._release_connection(connection_pool, connection_pool_key, connection, False)
+                raise
+            #
+        #
+
+        return connection
     #
 
-    def request_post(self, data = None, params = None, separator = ";"):
+    def _get_phase_timeout(self, timeout):
         """
-Do a POST request on the connected HTTP server.
+Returns the given timeout of a request phase or the socket timeout if not
+set.
 
-:param data: HTTP body
-:param params: Query parameters as dict
-:param separator: Query parameter separator
+:param timeout: Timeout in seconds of the phase; None if not set
 
-:return: (mixed) Response data; Exception on error
+:return: (float) Timeout in seconds
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("POST", separator, params, data)
+        return (self.timeout if (timeout is None) else timeout)
     #
 
-    def request_put(self, data = None, params = None, separator = ";"):
+    def _get_retry_delay(self, method, retry_count, raw_response, exception, deadline = None):
         """
-Do a PUT request on the connected HTTP server.
+Returns the delay before sending the request again. Requests are not retried
+if the delay exceeds the time left until the deadline. Retries not caused by
+a dropped connection withdraw a token from the retry budget of the host.
 
-:param data: HTTP body
-:param params: Query parameters as dict
-:param separator: Query parameter separator
+:param method: HTTP method
+:param retry_count: Number of the retry starting with 1
+:param raw_response: Response data; None if an exception has been raised
+:param exception: Exception raised; None otherwise
+:param deadline: Deadline of the request; None for no deadline
 
-:return: (mixed) Response data; Exception on error
+:return: (float) Delay in seconds; None if the request is not retried
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("PUT", separator, params, data)
+        retry_policy = self._retry_policy
+
+        _return = (retry_policy.get_retry_delay(method, retry_count, exception = exception)
+                   if (raw_response is None) else
+                   retry_policy.get_retry_delay(method, retry_count, raw_response['code'], raw_response['headers'])
+                  )
+
+        remaining_time = (None if (deadline is None) else deadline.remaining_time)
+        if (_return is not None and remaining_time is not None and _return >= remaining_time): _return = None
+
+        if (_return is not None
+            and retry_policy.budget is not None
+            and (exception is None or retry_count > 1 or (not retry_policy.is_connection_dropped(exception)))
+            and (not retry_policy.budget.withdraw(self._host_key))
+           ): _return = None
+
+        return _return
     #
 
-    def request_options(self, params = None, separator = ";", data = None):
+    def _get_request_kwargs(self, separator = ";", params = None, data = None):
         """
-Do a OPTIONS request on the connected HTTP server.
+Returns the keyword arguments for "_request()" based on the given request
+parameters. The registered content-codings are accepted if decoding is
+enabled and the body is compressed if request compression is enabled.
 
-:param params: Query parameters as dict
 :param separator: Query parameter separator
+:param params: Parsed query parameters as str
 :param data: HTTP body
 
-:return: (mixed) Response data; Exception on error
+:return: (dict) Keyword arguments
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("OPTIONS", separator, params, data)
+        _return = AbstractRawClient._get_request_kwargs(self, separator, params, data)
+
+        if (self._is_content_decoded):
+            headers = _return.setdefault("headers", { })
+
+            if ("accept-encoding" not in [ name.lower() for name in headers ]):
+                headers['accept-encoding'] = ", ".join(sorted(self.__class__._content_decoders))
+            #
+        #
+
+        if (self._request_compression_level is not None and "body" in _return): self._compress_request_body(_return)
+
+        return _return
     #
 
-    def request_trace(self, params = None, separator = ";"):
+    def _get_response_cache_url(self, path):
         """
-Do a TRACE request on the connected HTTP server.
+Returns the URL used as response cache key for the given request path.
 
-:param params: Query parameters as dict
-:param separator: Query parameter separator
+:param path: Request path including the query string
 
-:return: (mixed) Response data; Exception on error
+:return: (str) URL
 :since:  v1.0.0
         """
 
-        params = self._build_request_parameters(params, separator)
-        return self.request("TRACE", separator, params)
+        return "{0}://{1}{2}".format(self.scheme, self._host_header, path)
     #
 
-    def set_pem_cert_file(self, cert_file_name, key_file_name = None):
+    def _new_connection(self):
         """
-Sets a PEM-encoded certificate file name to be used. "key_file_name" is used
-if the private key is not part of the certificate file.
+Returns a new connection to the HTTP server.
+
+:return: (object) HTTP connection
+:since:  v1.0.0
+        """
+
+        _return = self.connection_factory.create_connection(self, self._connection_host, self.port, self.timeout)
+
+        if (hasattr(_return, "_create_connection")):
+            if (self._socket_options is not None):
+                _return._create_connection = partial(self._socket_options.create_connection, self._address_resolver)
+            elif (self._address_resolver is not None): _return._create_connection = self._address_resolver.create_connection
+        #
+
+        return _return
+    #
+
+    def _get_pipelined_request_data(self, method, url, headers = None):
+        """
+Returns the raw HTTP request data for a pipelined request.
+
+:param method: HTTP method
+:param url: Request path
+:param headers: Request headers
+
+:return: (bytes) Raw HTTP request data
+:since:  v1.0.0
+        """
+
+        request_headers = { "host": self._host_header, "accept-encoding": "identity" }
+
+        if (headers is not None):
+            for name in headers:
+                value = headers[name]
+                request_headers[name.lower()] = (", ".join(value) if (type(value) is list) else str(value))
+            #
+        #
+
+        _return = "{0} {1} HTTP/1.1\r\n".format(method, url)
+        for name in request_headers: _return += "{0}: {1}\r\n".format(name, request_headers[name])
+        _return += "\r\n"
+
+        return Binary.utf8_bytes(_return)
+    #
+
+    def _new_cached_raw_response(self, method, cache_entry):
+        """
+Returns the raw response dict for the given response cache entry.
+
+:param method: HTTP method
+:param cache_entry: ResponseCacheEntry instance
+
+:return: (dict) Response data
+:since:  v1.0.0
+        """
+
+        headers = cache_entry.headers.copy()
+        headers['age'] = str(int(self._response_cache.get_age(cache_entry)))
+
+        body = cache_entry.body
+        body_decoder = self._get_body_decoder(method, headers.get("content_encoding"))
+
+        _return = { "code": cache_entry.code, "headers": headers, "body": None }
+
+        if (self._return_reader):
+            _return['body_reader'] = (body.read if (hasattr(body, "read")) else BytesIO(body).read)
+            if (body_decoder is not None): _return['body_decoder'] = body_decoder
+        #
+
+        if (cache_entry.code < 100 or cache_entry.code >= 400):
+            _return['body'] = http_client.HTTPException("{0} {1}".format(str(cache_entry.code), str(cache_entry.reason)), cache_entry.code)
+        elif (method != "HEAD" and (not self._return_reader)):
+            _return['body'] = (body[:] if (body_decoder is None) else body_decoder(BytesIO(body).read)())
+        #
+
+        return _return
+    #
+
+    def _new_buffered_raw_response(self, method, response, body):
+        """
+Returns the raw response dict for an already received response body.
+
+:param method: HTTP method
+:param response: HTTP response object of "http.client"
+:param body: Response body received
+
+:return: (dict) Response data
+:since:  v1.0.0
+        """
+
+        body_decoder = self._get_body_decoder(method, response.getheader("content-encoding"))
+        if (body_decoder is not None): body = body_decoder(BytesIO(body).read)()
+
+        _return = { "code": response.status, "headers": { }, "body": None }
+        for header in response.getheaders(): _return['headers'][header[0].lower().replace("-", "_")] = header[1]
+
+        if (self._return_reader): _return['body_reader'] = BytesIO(body).read
+
+        if (response.status < 100 or response.status >= 400):
+            _return['body'] = http_client.HTTPException("{0} {1}".format(str(response.status), str(response.reason)), response.status)
+        elif (method != "HEAD" and (not self._return_reader)): _return['body'] = body
+
+        return _return
+    #
+
+    def _prepare_retry(self, kwargs, body_position, raw_response):
+        """
+Discards the response of a failed attempt and rewinds the body to be sent
+again.
+
+:param kwargs: Keyword arguments for "_request()"
+:param body_position: Position to rewind a file object given as body to
+:param raw_response: Response data; None if an exception has been raised
+
+:since: v1.0.0
+        """
+
+        body = kwargs.get("body")
+        if (hasattr(body, "seek")): body.seek(body_position)
+
+        if (raw_response is not None):
+            close_callback = getattr(raw_response.get("body_reader"), "close", None)
+            if (close_callback is not None): close_callback()
+        #
+    #
+
+    def _is_failure_status(self, code):
+        """
+Returns true if the given HTTP status code is counted as failure of the
+host.
+
+:param code: HTTP status code
+
+:return: (bool) True if failed
+:since:  v1.0.0
+        """
+
+        return (code in (CircuitBreaker.DEFAULT_FAILURE_STATUS_CODES
+                         if (self._circuit_breaker is None) else
+                         self._circuit_breaker.failure_status_codes
+                        ))
+    #
+
+    def _record_request_result(self, request_time, code, is_probe, peer_address = None):
+        """
+Records the result of a request in the circuit breaker, the concurrency
+limiter and the address resolver.
+
+:param request_time: UNIX timestamp the request has been started at
+:param code: HTTP status code received; None if the request failed
+:param is_probe: True if the request is a probe of a half-open circuit
+:param peer_address: Socket address of the peer; None if unknown
+
+:since: v1.0.0
+        """
+
+        host_key = self._host_key
+
+        if (self._is_cancelled):
+            self._release_request_limits(is_probe)
+            return
+        #
+
+        is_failure = (code is None or self._is_failure_status(code))
+        request_duration = time() - request_time
+
+        if (self._circuit_breaker is not None): self._circuit_breaker.record(host_key, request_duration, is_failure, is_probe)
+
+        if (self._concurrency_limiter is not None):
+            self._concurrency_limiter.release(host_key,
+                                              request_duration,
+                                              (code is None or code in self._concurrency_limiter.drop_status_codes)
+                                             )
+        #
+
+        if (peer_address is not None and self._address_resolver is not None): self._address_resolver.record_address_result(peer_address, is_failure)
+    #
+
+    def _release_connection(self, connection_pool, connection_pool_key, connection, is_reusable):
+        """
+Releases the given connection after the response body has been read
+completely or the body reader has been closed.
+
+:param connection_pool: Connection pool the connection has been borrowed
+                        from; None if not pooled
+:param connection_pool_key: Connection pool key
+:param connection: HTTP connection
+:param is_reusable: True if the connection can be used for further requests
+
+:since: v1.0.0
+        """
+
+        if (connection_pool is None):
+            if (not is_reusable): connection.close()
+        else:
+            if (self.connection is connection): self.connection = None
+            connection_pool.release(connection_pool_key, connection, is_reusable)
+        #
+    #
+
+    def _release_request_limits(self, is_probe):
+        """
+Releases the circuit breaker probe and the concurrency limiter slot of a
+request without recording a result.
+
+:param is_probe: True if the request is a probe of a half-open circuit
+
+:since: v1.0.0
+        """
+
+        host_key = self._host_key
+
+        if (self._circuit_breaker is not None): self._circuit_breaker.release(host_key, is_probe)
+        if (self._concurrency_limiter is not None): self._concurrency_limiter.release(host_key)
+    #
+
+    def request(self, method, separator = ";", params = None, data = None):
+        """
+Call a given request method on the connected HTTP server. Failed requests
+are sent again as defined by the retry policy.
+
+:param method: HTTP method
+:param separator: Query parameter separator
+:param params: Parsed query parameters as str
+:param data: HTTP body
+
+:return: (dict) Response data; 'body' may contain the catched exception
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,star-args
+
+        if (self._retry_policy is None): _return = AbstractRawClient.request(self, method, separator, params, data)
+        else:
+            if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.request({1})- (#echo(__LINE__)#)", self, method)
+
+            try:
+                kwargs = self._get_request_kwargs(separator, params, data)
+                _return = self._request_retried(method, kwargs)
+            except Exception as handled_exception: _return = { "code": None, "headers": None, "body": handled_exception }
+        #
+
+        return _return
+    #
+
+    def _request(self, method, deadline = None, **kwargs):
+        """
+Sends the request to the connected HTTP server and returns the result.
+
+:param method: HTTP method
+:param deadline: Deadline shared by all attempts of the request; None to
+                 create one based on the total timeout
+
+:return: (dict) Response data; 'body' may contain the catched Exception
+:since:  v1.0.0
+        """
+
+        # pylint: disable=star-args
+
+        ( _return, cache_entry ) = self._get_cached_raw_response(method, kwargs)
+        if (_return is not None): return _return
+
+        if (deadline is None): deadline = RequestDeadline(self._total_timeout)
+        read_idle_timeout = self._get_phase_timeout(self._read_idle_timeout)
+
+        self._acquire_request_limits(deadline)
+
+        try: is_probe = (False if (self._circuit_breaker is None) else self._circuit_breaker.acquire(self._host_key))
+        except Exception:
+            self._release_request_limits(False)
+            raise
+        #
+
+        request_time = time()
+
+        connection_pool = self._connection_pool
+        connection_pool_key = self._connection_pool_key
+
+        try: connection = self._get_connection(deadline)
+        except Exception:
+            self._record_request_result(request_time, None, is_probe)
+            raise
+        #
+
+        sock = connection.sock
+        peer_address = (None if (self._address_resolver is None) else self._get_peer_address(sock))
+
+        try:
+            deadline.apply(sock, read_idle_timeout)
+            connection.request(method, **kwargs)
+
+            sock = connection.sock
+            deadline.apply(sock, self._get_phase_timeout(self._first_byte_timeout))
+
+            response = connection.getresponse()
+        except Exception:
+            self._release_connection(connection_pool, connection_pool_key, connection, False)
+            self._record_request_result(request_time, None, is_probe, peer_address)
+
+            raise
+        #
+
+        self._record_request_result(request_time, response.status, is_probe, peer_address)
+
+        _return = { "code": response.status, "headers": { }, "body": None }
+        for header in response.getheaders(): _return['headers'][header[0].lower().replace("-", "_")] = header[1]
+
+        body_reader = BodyReader(response,
+                                 partial(self._release_connection, connection_pool, connection_pool_key, connection),
+                                 self._raw_chunked_reading,
+                                 sock,
+                                 deadline,
+                                 read_idle_timeout
+                                )
+
+        revalidated_response = self._get_revalidated_raw_response(method, kwargs, cache_entry, response, _return['headers'], request_time)
+
+        if (revalidated_response is not None):
+            body_reader()
+            return revalidated_response
+        #
+
+        body_reader = self._get_caching_body_reader(method, kwargs, response, _return['headers'], body_reader, request_time)
+        body_decoder = self._get_body_decoder(method, response.getheader("content-encoding"))
+
+        if (self._return_reader):
+            _return['body_reader'] = body_reader
+            if (body_decoder is not None): _return['body_decoder'] = body_decoder
+        #
+
+        if (response.status < 100 or response.status >= 400):
+            _return['body'] = http_client.HTTPException("{0} {1}".format(str(response.status), str(response.reason)), response.status)
+
+            if (not self._return_reader):
+                error_body = body_reader()
+                if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -RawClient._request()- reporting: {0:d} for '{1}'", response.status, error_body)
+            #
+        elif (method != "HEAD" and (not self._return_reader)):
+            _return['body'] = (body_reader() if (body_decoder is None) else body_decoder(body_reader)())
+        #
+
+        return _return
+    #
+
+    def _request_retried(self, method, kwargs):
+        """
+Sends the request and repeats it as defined by the retry policy. All
+attempts share the deadline of the request. Cancelled requests are not
+repeated.
+
+:param method: HTTP method
+:param kwargs: Keyword arguments for "_request()"
+
+:return: (dict) Response data of the last attempt
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,star-args
+
+        body_position = self._get_body_replay_position(kwargs.get("body"))
+        deadline = RequestDeadline(self._total_timeout)
+        retry_count = 0
+
+        if (self._retry_policy.budget is not None): self._retry_policy.budget.deposit(self._host_key)
+
+        while True:
+            exception = None
+            retry_count += 1
+
+            try: _return = self._request(method, deadline, **kwargs)
+            except Exception as handled_exception:
+                _return = None
+                exception = handled_exception
+            #
+
+            delay = (None if (body_position is None or self._is_cancelled) else self._get_retry_delay(method, retry_count, _return, exception, deadline))
+            if (delay is None): break
+
+            if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -RawClient._request_retried()- retrying {0} in {1:.3f} seconds", method, delay)
+
+            self._prepare_retry(kwargs, body_position, _return)
+            if (delay > 0): sleep(delay)
+        #
+
+        if (exception is not None): raise exception
+        return _return
+    #
+
+    def _request_pipelined(self, requests, responses):
+        """
+Sends the given requests back-to-back on one connection and appends the
+responses received in order. Processing stops as soon as the server closes
+the connection. The requests share one deadline, circuit breaker call and
+concurrency limiter slot but take a rate limiter token each.
+
+:param requests: List of tuples containing the HTTP method and keyword
+                 arguments for "_request()"
+:param responses: List the raw response dicts are appended to
+
+:since: v1.0.0
+        """
+
+        deadline = RequestDeadline(self._total_timeout)
+        read_idle_timeout = self._get_phase_timeout(self._read_idle_timeout)
+
+        self._acquire_request_limits(deadline, len(requests))
+
+        try: is_probe = (False if (self._circuit_breaker is None) else self._circuit_breaker.acquire(self._host_key))
+        except Exception:
+            self._release_request_limits(False)
+            raise
+        #
+
+        request_time = time()
+
+        connection_pool = self._connection_pool
+        connection_pool_key = self._connection_pool_key
+
+        try: connection = self._get_connection(deadline)
+        except Exception:
+            self._record_request_result(request_time, None, is_probe)
+            raise
+        #
+
+        code = None
+        is_reusable = False
+        peer_address = None
+        reader = None
+
+        try:
+            if (connection.sock is None): connection.connect()
+
+            sock = connection.sock
+            if (self._address_resolver is not None): peer_address = self._get_peer_address(sock)
+
+            request_data = Binary.BYTES_TYPE().join([ self._get_pipelined_request_data(method, **kwargs)
+                                                      for ( method, kwargs ) in requests
+                                                    ])
+
+            deadline.apply(sock, read_idle_timeout)
+            sock.sendall(request_data)
+
+            reader = sock.makefile("rb")
+            pipeline_socket = PipelineSocket(reader)
+
+            for ( method, kwargs ) in requests:
+                deadline.apply(sock, self._get_phase_timeout(self._first_byte_timeout))
+
+                response = http_client.HTTPResponse(pipeline_socket, method = method)
+                response.begin()
+
+                deadline.apply(sock, read_idle_timeout)
+                body = response.read()
+
+                raw_response = self._new_buffered_raw_response(method, response, body)
+                self._get_caching_body_reader(method, kwargs, response, raw_response['headers'], BytesIO(body).read, request_time)()
+
+                responses.append(raw_response)
+                if (code is None or (not self._is_failure_status(code))): code = response.status
+
+                if (response.will_close): break
+            #
+
+            is_reusable = (len(responses) == len(requests) and (not response.will_close))
+        except Exception:
+            self._record_request_result(request_time, None, is_probe, peer_address)
+            raise
+        finally:
+            if (reader is not None): reader.close()
+            self._release_connection(connection_pool, connection_pool_key, connection, is_reusable)
+        #
+
+        self._record_request_result(request_time, code, is_probe, peer_address)
+    #
+
+    def request_delete(self, params = None, separator = ";", data = None):
+        """
+Do a DELETE request on the connected HTTP server.
+
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+:param data: HTTP body
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("DELETE", separator, params, data)
+    #
+
+    def request_get(self, params = None, separator = ";"):
+        """
+Do a GET request on the connected HTTP server.
+
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("GET", separator, params)
+    #
+
+    def request_head(self, params = None, separator = ";"):
+        """
+Do a HEAD request on the connected HTTP server.
+
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("HEAD", separator, params)
+    #
+
+    def request_patch(self, data = None, params = None, separator = ";"):
+        """
+Do a PATCH request on the connected HTTP server.
+
+:param data: HTTP body
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("PATCH", separator, params, data)
+    #
+
+    def request_post(self, data = None, params = None, separator = ";"):
+        """
+Do a POST request on the connected HTTP server.
+
+:param data: HTTP body
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("POST", separator, params, data)
+    #
+
+    def request_put(self, data = None, params = None, separator = ";"):
+        """
+Do a PUT request on the connected HTTP server.
+
+:param data: HTTP body
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("PUT", separator, params, data)
+    #
+
+    def request_options(self, params = None, separator = ";", data = None):
+        """
+Do a OPTIONS request on the connected HTTP server.
+
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+:param data: HTTP body
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("OPTIONS", separator, params, data)
+    #
+
+    def request_trace(self, params = None, separator = ";"):
+        """
+Do a TRACE request on the connected HTTP server.
+
+:param params: Query parameters as dict
+:param separator: Query parameter separator
+
+:return: (mixed) Response data; Exception on error
+:since:  v1.0.0
+        """
+
+        params = self._build_request_parameters(params, separator)
+        return self.request("TRACE", separator, params)
+    #
+
+    def request_pipelined(self, requests, separator = ";"):
+        """
+Sends the given idempotent requests pipelined on one connection to the
+connected HTTP server. Fresh responses are returned from the response cache
+and stale ones are revalidated one after another. Requests not answered on
+the pipelined connection are sent one after another as well.
+
+:param requests: List of tuples containing the HTTP method and query
+                 parameters as dict
+:param separator: Query parameter separator
+
+:return: (list) List of response data
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.request_pipelined()- (#echo(__LINE__)#)", self)
+
+        pipelined_requests = [ ]
+
+        for request in requests:
+            method = request[0].upper()
+            if (method not in RawClient.PIPELINING_METHODS): raise TypeException("HTTP method '{0}' can not be pipelined".format(method))
+
+            params = self._build_request_parameters((request[1] if (len(request) > 1) else None), separator)
+            pipelined_requests.append(( method, params ))
+        #
+
+        _return = [ None ] * len(pipelined_requests)
+        uncached_indices = [ ]
+        uncached_requests = [ ]
+
+        for ( index, ( method, params ) ) in enumerate(pipelined_requests):
+            kwargs = self._get_request_kwargs(separator, params)
+            ( raw_response, cache_entry ) = self._get_cached_raw_response(method, kwargs)
+
+            if (raw_response is not None): _return[index] = raw_response
+            elif (cache_entry is None):
+                uncached_indices.append(index)
+                uncached_requests.append(( method, kwargs ))
+            #
+        #
+
+        if (len(uncached_requests) > 1):
+            pipelined_responses = [ ]
+
+            try: self._request_pipelined(uncached_requests, pipelined_responses)
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.request_pipelined()- falling back to serial requests: {1!r}", self, handled_exception)
+            #
+
+            for ( index, raw_response ) in zip(uncached_indices, pipelined_responses): _return[index] = raw_response
+        #
+
+        for ( index, ( method, params ) ) in enumerate(pipelined_requests):
+            if (_return[index] is None): _return[index] = RawClient.request(self, method, separator, params)
+        #
+
+        return _return
+    #
+
+    def set_address_resolver(self, address_resolver, is_prefetched = False):
+        """
+Sets the address resolver used to connect to the HTTP server. Resolved
+addresses are cached and raced as described in RFC 8305.
+
+:param address_resolver: AddressResolver instance; None to let
+                         "http.client" resolve host names
+:param is_prefetched: True to resolve the host name in the background
+                      immediately
+
+:since: v1.0.0
+        """
+
+        self._address_resolver = address_resolver
+
+        if (address_resolver is not None and is_prefetched): address_resolver.prefetch(self._connection_host, self.port)
+    #
+
+    def set_circuit_breaker(self, circuit_breaker):
+        """
+Sets the circuit breaker rejecting requests to failing hosts immediately.
+
+:param circuit_breaker: CircuitBreaker instance; None to disable it
+
+:since: v1.0.0
+        """
+
+        self._circuit_breaker = circuit_breaker
+    #
+
+    def set_concurrency_limiter(self, concurrency_limiter):
+        """
+Sets the concurrency limiter adapting the number of requests in flight per
+host. A slot is acquired before a connection is used.
+
+:param concurrency_limiter: ConcurrencyLimiter instance; None to disable it
+
+:since: v1.0.0
+        """
+
+        self._concurrency_limiter = concurrency_limiter
+    #
+
+    def set_connection_factory(self, connection_factory):
+        """
+Sets the connection factory used for new connections of this client
+instance. "None" uses the one registered for the URL scheme.
+
+:param connection_factory: Connection factory; None for the scheme default
+
+:since: v1.0.0
+        """
+
+        if (self._connection_factory is not connection_factory):
+            if (self._connection_pool is None and self.connection is not None): self.connection.close()
+            self.connection = None
+        #
+
+        self._connection_factory = connection_factory
+    #
+
+    def set_connection_pool(self, connection_pool):
+        """
+Sets the connection pool to borrow connections from. "None" disables
+pooling and uses one connection per client instance.
+
+:param connection_pool: ConnectionPool instance; None to disable pooling
+
+:since: v1.0.0
+        """
+
+        if (self._connection_pool is not connection_pool):
+            if (self._connection_pool is None and self.connection is not None): self.connection.close()
+            self.connection = None
+        #
+
+        self._connection_pool = connection_pool
+    #
+
+    def set_content_decoding(self, is_enabled = True, max_size = None, max_ratio = None):
+        """
+Sets if content-coded response bodies are requested and decoded
+incrementally. Decoding fails with an "IOException" if the limits given are
+exceeded. The ratio is only checked after more than 1 MiB has been decoded.
+
+:param is_enabled: True to enable content decoding
+:param max_size: Maximum decoded body size accepted; None for unlimited
+:param max_ratio: Maximum ratio of decoded to encoded body size accepted;
+                  None for unlimited
+
+:since: v1.0.0
+        """
+
+        self._is_content_decoded = is_enabled
+        self._max_decoded_ratio = max_ratio
+        self._max_decoded_size = max_size
+    #
+
+    def set_pem_cert_file(self, cert_file_name, key_file_name = None):
+        """
+Sets a PEM-encoded certificate file name to be used. "key_file_name" is used
+if the private key is not part of the certificate file.
 
 :param cert_file_name: Path and file name of the PEM-encoded certificate file
 :param key_file_name: Path and file name of the private key
@@ -359,4 +1551,207 @@ if the private key is not part of the certificate file.
         self._pem_cert_file_name = cert_file_name
         self._pem_key_file_name = key_file_name
     #
+
+    def set_rate_limiter(self, rate_limiter):
+        """
+Sets the rate limiter for requests per host. A token is acquired before a
+connection is used.
+
+:param rate_limiter: RateLimiter instance; None to disable it
+
+:since: v1.0.0
+        """
+
+        self._rate_limiter = rate_limiter
+    #
+
+    def set_raw_chunked_reading(self, is_enabled = True):
+        """
+Sets if chunked transfer-encoded bodies are decoded by the incremental
+decoder of "Response" reading from the raw socket instead of "http.client".
+
+:param is_enabled: True to enable raw chunked reading
+
+:since: v1.0.0
+        """
+
+        self._raw_chunked_reading = is_enabled
+    #
+
+    def set_request_compression(self, is_enabled = True, min_size = 1024, level = 6):
+        """
+Sets if request bodies are sent "gzip" compressed. Bodies of known length
+smaller than "min_size" are sent uncompressed. Streamed bodies are
+compressed while they are sent using chunked transfer-encoding.
+
+:param is_enabled: True to enable request compression
+:param min_size: Minimum size of bodies of known length to be compressed
+:param level: zlib compression level
+
+:since: v1.0.0
+        """
+
+        self._request_compression_level = (level if (is_enabled) else None)
+        self._request_compression_min_size = min_size
+    #
+
+    def set_response_cache(self, response_cache):
+        """
+Sets the response cache used for requests. Fresh responses stored are
+returned without contacting the server.
+
+:param response_cache: ResponseCache instance; None to disable caching
+
+:since: v1.0.0
+        """
+
+        self._response_cache = response_cache
+    #
+
+    def set_retry_policy(self, retry_policy):
+        """
+Sets the retry policy defining which failed requests are sent again.
+Requests with streamed bodies that can not be rewound are never retried.
+
+:param retry_policy: RetryPolicy instance; None to never retry
+
+:since: v1.0.0
+        """
+
+        self._retry_policy = retry_policy
+    #
+
+    def set_socket_options(self, socket_options):
+        """
+Sets the socket options applied to new TCP connections of plain and
+SSL/TLS protected connections.
+
+:param socket_options: SocketOptions instance; None for the defaults
+
+:since: v1.0.0
+        """
+
+        self._socket_options = socket_options
+    #
+
+    def set_timeouts(self, connect_timeout = None, tls_handshake_timeout = None, first_byte_timeout = None, read_idle_timeout = None, total_timeout = None):
+        """
+Sets the timeouts of the individual phases of requests. Phase timeouts not
+given fall back to the socket timeout and are limited by the total timeout
+of the request.
+
+:param connect_timeout: Timeout in seconds for connecting
+:param tls_handshake_timeout: Timeout in seconds for the SSL/TLS handshake
+:param first_byte_timeout: Timeout in seconds to wait for the response
+                           after the request has been sent
+:param read_idle_timeout: Timeout in seconds for sending and each read of
+                          the response body
+:param total_timeout: Timeout in seconds for the request including reading
+                      the response body; None for no deadline
+
+:since: v1.0.0
+        """
+
+        self._connect_timeout = connect_timeout
+        self._first_byte_timeout = first_byte_timeout
+        self._read_idle_timeout = read_idle_timeout
+        self._tls_handshake_timeout = tls_handshake_timeout
+        self._total_timeout = total_timeout
+    #
+
+    def set_tls_verification(self, is_verified = True, ca_file_name = None):
+        """
+Sets how the peer certificate of SSL/TLS connections is verified.
+
+:param is_verified: False to disable peer certificate and host name
+                    verification
+:param ca_file_name: Path and file name of the CA certificates to verify
+                     the peer with; None for the system default
+
+:since: v1.0.0
+        """
+
+        self._tls_ca_file_name = ca_file_name
+        self._tls_verified = is_verified
+    #
+
+    @classmethod
+    def register_connection_factory(cls, scheme, connection_factory):
+        """
+Registers a connection factory for the given URL scheme.
+
+:param scheme: URL scheme
+:param connection_factory: Connection factory; None to unregister
+
+:since: v1.0.0
+        """
+
+        connection_factories = cls._connection_factories.copy()
+        scheme = scheme.lower()
+
+        if (connection_factory is not None): connection_factories[scheme] = connection_factory
+        elif (scheme in connection_factories): del(connection_factories[scheme])
+
+        cls._connection_factories = connection_factories
+    #
+
+    @classmethod
+    def register_content_decoder(cls, content_encoding, content_decoder_class):
+        """
+Registers a content decoder class for the given content-coding. The class is
+instantiated with the content-coding for each response.
+
+:param content_encoding: Content-coding
+:param content_decoder_class: Content decoder class; None to unregister
+
+:since: v1.0.0
+        """
+
+        content_decoders = cls._content_decoders.copy()
+        content_encoding = content_encoding.lower()
+
+        if (content_decoder_class is not None): content_decoders[content_encoding] = content_decoder_class
+        elif (content_encoding in content_decoders): del(content_decoders[content_encoding])
+
+        cls._content_decoders = content_decoders
+    #
+
+    @staticmethod
+    def _get_body_replay_position(body):
+        """
+Returns the position to rewind the given body to for sending it again.
+
+:param body: HTTP body
+
+:return: (int) Position; None if the body can not be sent again
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (hasattr(body, "read")):
+            try: _return = (body.tell() if (hasattr(body, "seek")) else None)
+            except Exception: _return = None
+        elif (body is None or isinstance(body, ( str, Binary.BYTES_TYPE, bytearray, memoryview, MultipartFormData ))): _return = 0
+        else: _return = None
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_peer_address(sock):
+        """
+Returns the socket address of the peer of the given socket.
+
+:param sock: Connected socket
+
+:return: (tuple) Socket address; None if unknown
+:since:  v1.0.0
+        """
+
+        try: _return = (None if (sock is None) else sock.getpeername())
+        except socket.error: _return = None
+
+        return _return
+    #
 #
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from threading import Event, RLock
+
+class RequestCoalescer(object):
+    """
+Thread-safe single-flight execution of identical requests. Callers using
+the same key while a call is in flight wait for and share its result.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_calls", "_lock" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide RequestCoalescer instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(RequestCoalescer)
+
+:since: v1.0.0
+        """
+
+        self._calls = { }
+        """
+Calls in flight per key
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+    #
+
+    @property
+    def in_flight_count(self):
+        """
+Returns the number of calls currently in flight.
+
+:return: (int) Number of calls
+:since:  v1.0.0
+        """
+
+        with self._lock: return len(self._calls)
+    #
+
+    def execute(self, key, callback):
+        """
+Calls the given callback unless a call for the same key is already in
+flight. The result or exception of the call is returned to all callers.
+
+:param key: Hashable key identifying identical calls
+:param callback: Callable without arguments
+
+:return: (mixed) Result of the call
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except,raising-bad-type
+
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = (call is None)
+
+            if (is_leader):
+                call = { "event": Event(), "result": None, "exception": None }
+                self._calls[key] = call
+            #
+        #
+
+        if (is_leader):
+            try: call['result'] = callback()
+            except Exception as handled_exception: call['exception'] = handled_exception
+            finally:
+                with self._lock: del(self._calls[key])
+                call['event'].set()
+            #
+        else: call['event'].wait()
+
+        if (call['exception'] is not None): raise call['exception']
+        return call['result']
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide RequestCoalescer instance.
+
+:return: (object) RequestCoalescer instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+#
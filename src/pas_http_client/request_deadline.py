@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+from time import time
+
+from dpt_runtime.io_exception import IOException
+
+class RequestDeadline(object):
+    """
+Deadline of a request limiting the timeouts of all of its phases to the
+time left.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "expiry_time" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, timeout = None):
+        """
+Constructor __init__(RequestDeadline)
+
+:param timeout: Total timeout in seconds; None for no deadline
+
+:since: v1.0.0
+        """
+
+        self.expiry_time = (None if (timeout is None) else time() + timeout)
+        """
+UNIX timestamp the request expires at; None for no deadline
+        """
+    #
+
+    @property
+    def is_expired(self):
+        """
+Returns true if the deadline has been exceeded.
+
+:return: (bool) True if expired
+:since:  v1.0.0
+        """
+
+        return (self.expiry_time is not None and time() >= self.expiry_time)
+    #
+
+    @property
+    def remaining_time(self):
+        """
+Returns the number of seconds left until the deadline.
+
+:return: (float) Seconds left; None for no deadline
+:since:  v1.0.0
+        """
+
+        return (None if (self.expiry_time is None) else max(0, self.expiry_time - time()))
+    #
+
+    def apply(self, sock, timeout):
+        """
+Sets the timeout of the given socket for the next phase of the request.
+
+:param sock: Socket to set the timeout for; None to only check the deadline
+:param timeout: Timeout in seconds of the phase; None for no timeout
+
+:since: v1.0.0
+        """
+
+        timeout = self.get_timeout(timeout)
+        if (sock is not None): sock.settimeout(timeout)
+    #
+
+    def get_timeout(self, timeout):
+        """
+Returns the given timeout of a request phase limited to the time left.
+
+:param timeout: Timeout in seconds of the phase; None for no timeout
+
+:return: (float) Timeout in seconds; None for no timeout
+:since:  v1.0.0
+        """
+
+        _return = timeout
+        remaining_time = self.remaining_time
+
+        if (remaining_time is not None):
+            if (remaining_time <= 0): raise IOException("Request deadline exceeded")
+            if (_return is None or _return > remaining_time): _return = remaining_time
+        #
+
+        return _return
+    #
+#
@@ -17,7 +17,13 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-class Response(object):
+import os
+
+from io import BytesIO
+
+from .chunked_reader_mixin import ChunkedReaderMixin
+
+class Response(ChunkedReaderMixin):
     """
 HTTP response object handling chunked transfer-encoded data transparently.
 
@@ -30,7 +36,7 @@ HTTP response object handling chunked transfer-encoded data transparently.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "body_reader", "_code", "_exception", "_headers" ]
+    __slots__ = [ "_body_reader", "_code", "_decoding_reader", "_exception", "_headers" ] + ChunkedReaderMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -43,6 +49,8 @@ Constructor __init__(Response)
 :since: v1.0.0
         """
 
+        ChunkedReaderMixin.__init__(self)
+
         self._body_reader = None
         """
 Body reader callable
@@ -50,6 +58,10 @@ Body reader callable
         self._code = None
         """
 HTTP status code
+        """
+        self._decoding_reader = None
+        """
+Body reader decoding the content-coding of the body
         """
         self._exception = None
         """
@@ -124,6 +136,31 @@ exception occurred while processing the request.
         return (self._body_reader is not None and self.exception is None)
     #
 
+    @property
+    def trailers(self):
+        """
+Returns the trailer fields received after the last chunk if chunked
+transfer-encoded data has been decoded from the raw socket.
+
+:return: (dict) Trailer fields with lowercase names; None otherwise
+:since:  v1.0.0
+        """
+
+        return self._get_chunked_trailers()
+    #
+
+    def close(self):
+        """
+Closes the response body reader. The connection is only reused if the body
+has been read completely.
+
+:since: v1.0.0
+        """
+
+        close_callback = getattr(self._body_reader, "close", None)
+        if (close_callback is not None): close_callback()
+    #
+
     def get_header(self, name):
         """
 Returns the response header if defined.
@@ -138,10 +175,54 @@ Returns the response header if defined.
         return self._headers.get(name)
     #
 
+    def iter_content(self, chunk_size = 65536):
+        """
+Returns a generator yielding the response body in parts of the given size.
+
+:param chunk_size: Maximum size of each part
+
+:return: (object) Generator yielding bytes
+:since:  v1.0.0
+        """
+
+        while True:
+            data = self.read(chunk_size)
+            if (not data): break
+
+            yield data
+        #
+    #
+
+    def iter_lines(self, chunk_size = 65536, delimiter = None):
+        """
+Returns a generator yielding the response body line by line. Lines are
+returned without the line terminator.
+
+:param chunk_size: Maximum size of each part read
+:param delimiter: Line delimiter; None for LF and CRLF
+
+:return: (object) Generator yielding bytes
+:since:  v1.0.0
+        """
+
+        line_delimiter = (ChunkedReaderMixin.BINARY_NEWLINE[-1:] if (delimiter is None) else delimiter)
+        pending_data = bytearray()
+
+        for data in self.iter_content(chunk_size):
+            pending_data += data
+            lines = pending_data.split(line_delimiter)
+            pending_data = lines.pop()
+
+            for line in lines: yield self._get_line_bytes(line, delimiter is None)
+        #
+
+        if (len(pending_data) > 0): yield self._get_line_bytes(pending_data, delimiter is None)
+    #
+
     def read(self, n = 0):
         """
-Reads data using the given body reader. Chunked transfer-encoded data is
-handled automatically.
+Reads data using the given body reader. Chunked transfer-encoded and
+content-coded data is handled automatically.
 
 :param n: How many bytes to read from the current position (0 means until
           EOF)
@@ -150,7 +231,233 @@ handled automatically.
 :since:  v1.0.0
         """
 
-        return (self._body_reader() if (n < 1) else self._body_reader(n))
+        if (self._decoding_reader is None): _return = self._read_undecoded(n)
+        else: _return = (self._decoding_reader() if (n < 1) else self._decoding_reader(n))
+
+        return _return
+    #
+
+    def readinto(self, buffer):
+        """
+Reads data into the given writable buffer.
+
+:param buffer: Writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        buffer_view = memoryview(buffer)
+        size = len(buffer_view)
+
+        if (self._decoding_reader is not None):
+            data = self.read(size)
+            _return = len(data)
+
+            buffer_view[:_return] = data
+        elif (getattr(self._body_reader, "is_raw_chunked", False)):
+            position = [ 0 ]
+
+            def callback(data):
+                """
+Copies decoded data into the buffer.
+                """
+
+                data_size = len(data)
+                buffer_view[position[0]:position[0] + data_size] = data
+                position[0] += data_size
+            #
+
+            self._read_raw_chunked_to_callback(callback, size)
+            _return = position[0]
+        elif (hasattr(self._body_reader, "readinto")): _return = self._body_reader.readinto(buffer_view)
+        else:
+            data = self.read(size)
+            _return = len(data)
+
+            buffer_view[:_return] = data
+        #
+
+        return _return
+    #
+
+    def _read_raw_chunked(self, n = 0):
+        """
+Reads and decodes chunked transfer-encoded data from the raw socket of the
+body reader.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        data = bytearray()
+        self._read_raw_chunked_to_callback(data.extend, (-1 if (n < 1) else n))
+
+        return bytes(data)
+    #
+
+    def _read_raw_chunked_to_callback(self, callback, size = -1):
+        """
+Reads and decodes chunked transfer-encoded data from the raw socket of the
+body reader to the given callback.
+
+:param callback: Callback for data read
+:param size: Byte size to read; -1 to read until the last chunk
+
+:since: v1.0.0
+        """
+
+        if (not self._is_chunked_data_eof):
+            try:
+                self._body_reader.apply_read_timeout()
+                self._read_chunked_data(self._body_reader.raw_file, callback, size, deadline = self._body_reader.deadline)
+            except Exception:
+                self._body_reader.close()
+                raise
+            #
+
+            if (self._is_chunked_data_eof): self._body_reader.mark_eof()
+        #
+    #
+
+    def _read_undecoded(self, n = 0):
+        """
+Reads data still content-coded using the given body reader. Chunked
+transfer-encoded data is handled automatically.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        if (getattr(self._body_reader, "is_raw_chunked", False)): _return = self._read_raw_chunked(n)
+        else: _return = (self._body_reader() if (n < 1) else self._body_reader(n))
+
+        return _return
+    #
+
+    def save_to(self, path_or_fd, progress_callback = None, hash_object = None, buffer_size = 65536):
+        """
+Streams the response body to the given file using a reused buffer. Bodies
+of plaintext connections are moved by the kernel directly from the socket
+to the file if supported, not content-coded and no hash is calculated.
+
+:param path_or_fd: Path and file name, file descriptor or file object to
+                   write to
+:param progress_callback: Callback called with the number of bytes written
+                          so far
+:param hash_object: Object of "hashlib" updated with the data written
+:param buffer_size: Size of the buffer used
+
+:return: (int) Number of bytes written
+:since:  v1.0.0
+        """
+
+        is_file_opened = (not isinstance(path_or_fd, int)) and (not hasattr(path_or_fd, "write"))
+        _file = (open(path_or_fd, "wb") if (is_file_opened) else path_or_fd)
+
+        try: _return = self._save_to_file(_file, progress_callback, hash_object, buffer_size)
+        finally:
+            if (is_file_opened): _file.close()
+        #
+
+        return _return
+    #
+
+    def _save_to_file(self, _file, progress_callback, hash_object, buffer_size):
+        """
+Streams the response body to the given file descriptor or file object.
+
+:param _file: File descriptor or file object to write to
+:param progress_callback: Callback called with the number of bytes written
+                          so far
+:param hash_object: Object of "hashlib" updated with the data written
+:param buffer_size: Size of the buffer used
+
+:return: (int) Number of bytes written
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (isinstance(_file, int)): fd = _file
+        else:
+            try:
+                _file.flush()
+                fd = _file.fileno()
+            except Exception: fd = None
+        #
+
+        _return = None
+
+        if (fd is not None
+            and hash_object is None
+            and self._decoding_reader is None
+            and hasattr(self._body_reader, "splice_to")
+           ):
+            _return = self._body_reader.splice_to(fd, progress_callback, buffer_size)
+        #
+
+        if (_return is None):
+            _return = 0
+
+            buffer_data = bytearray(buffer_size)
+            buffer_view = memoryview(buffer_data)
+
+            while True:
+                size = self.readinto(buffer_view)
+                if (size < 1): break
+
+                data_view = buffer_view[:size]
+                if (hash_object is not None): hash_object.update(data_view)
+
+                if (fd is None): _file.write(data_view)
+                else:
+                    while (len(data_view) > 0): data_view = data_view[os.write(fd, data_view):]
+                #
+
+                _return += size
+                if (progress_callback is not None): progress_callback(_return)
+            #
+        #
+
+        return _return
+    #
+
+    def _set_body(self, data):
+        """
+Sets the body already received completely for this response object.
+
+:param data: Response body
+
+:since: v1.0.0
+        """
+
+        self._body_reader = BytesIO(data).read
+        self._decoding_reader = None
+        self._reset_chunked_buffer()
+    #
+
+    def _set_body_decoder(self, decoding_reader_factory):
+        """
+Sets the factory returning the reader decoding the content-coding of the
+body. It is called with the read callable for the still encoded data.
+
+:param decoding_reader_factory: Decoding body reader factory; None if the
+                                body is not content-coded
+
+:since: v1.0.0
+        """
+
+        self._decoding_reader = (None
+                                 if (decoding_reader_factory is None) else
+                                 decoding_reader_factory(self._read_undecoded)
+                                )
     #
 
     def _set_body_reader(self, body_reader):
@@ -163,6 +470,7 @@ Sets the body reader callable of this response object.
         """
 
         self._body_reader = body_reader
+        self._reset_chunked_buffer()
     #
 
     def _set_code(self, code):
@@ -200,4 +508,20 @@ Sets the headers of the response.
 
         if (headers is not None): self._headers = headers
     #
+
+    @staticmethod
+    def _get_line_bytes(line, is_cr_stripped):
+        """
+Returns the given line as bytes.
+
+:param line: Line data
+:param is_cr_stripped: True to remove a trailing carriage return
+
+:return: (bytes) Line
+:since:  v1.0.0
+        """
+
+        if (is_cr_stripped and line[-1:] == ChunkedReaderMixin.BINARY_NEWLINE[:1]): line = line[:-1]
+        return bytes(line)
+    #
 #
@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from email.utils import mktime_tz, parsedate_tz
+from time import time
+
+from .memory_response_cache_store import MemoryResponseCacheStore
+from .response_cache_entry import ResponseCacheEntry
+
+class ResponseCache(object):
+    """
+Private HTTP response cache as defined in RFC 9111 honoring
+"Cache-Control", "Expires" and "Vary". Entries are kept in a pluggable
+store. Stale entries are revalidated using "ETag" and "Last-Modified".
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    HOP_BY_HOP_HEADERS = ( "connection", "content_length", "keep_alive", "transfer_encoding" )
+    """
+Headers of a "304 Not Modified" response not updating a stored response
+    """
+    HEURISTICALLY_CACHEABLE_CODES = ( 200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501 )
+    """
+Status codes cacheable without explicit freshness information
+    """
+    HEURISTIC_MAX_LIFETIME = 86400
+    """
+Maximum heuristic freshness lifetime in seconds
+    """
+    UNSAFE_METHODS = ( "DELETE", "PATCH", "POST", "PUT" )
+    """
+HTTP methods invalidating stored responses of the target URL
+    """
+
+    __slots__ = [ "__weakref__", "max_entry_size", "store" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, store = None, max_entry_size = 8388608):
+        """
+Constructor __init__(ResponseCache)
+
+:param store: Response cache store; None for an in-memory one
+:param max_entry_size: Maximum body size of responses to be stored
+
+:since: v1.0.0
+        """
+
+        self.max_entry_size = max_entry_size
+        """
+Maximum body size of responses to be stored
+        """
+        self.store = (MemoryResponseCacheStore() if (store is None) else store)
+        """
+Response cache store
+        """
+    #
+
+    def clear(self):
+        """
+Removes all stored responses.
+
+:since: v1.0.0
+        """
+
+        self.store.clear()
+    #
+
+    def get_age(self, entry, current_time = None):
+        """
+Returns the current age of the given entry.
+
+:param entry: ResponseCacheEntry instance
+:param current_time: UNIX timestamp to calculate the age for
+
+:return: (float) Age in seconds
+:since:  v1.0.0
+        """
+
+        if (current_time is None): current_time = time()
+
+        date = self._get_http_date(entry.headers.get("date"))
+        apparent_age = (0 if (date is None) else max(0, entry.response_time - date))
+
+        try: age = max(0, int(entry.headers.get("age", 0)))
+        except ValueError: age = 0
+
+        corrected_age = age + (entry.response_time - entry.request_time)
+
+        return max(apparent_age, corrected_age) + (current_time - entry.response_time)
+    #
+
+    def get_conditional_headers(self, entry):
+        """
+Returns the request headers to revalidate the given entry.
+
+:param entry: ResponseCacheEntry instance
+
+:return: (dict) Conditional request headers; empty if the entry can not be
+         revalidated
+:since:  v1.0.0
+        """
+
+        _return = { }
+
+        if ("etag" in entry.headers): _return['if-none-match'] = entry.headers['etag']
+        if ("last_modified" in entry.headers): _return['if-modified-since'] = entry.headers['last_modified']
+
+        return _return
+    #
+
+    def get_entry(self, method, url, request_headers = None):
+        """
+Returns the stored response for the given request if it matches the
+selecting request headers regardless of its freshness.
+
+:param method: HTTP method
+:param url: Request URL
+:param request_headers: Request headers
+
+:return: (object) ResponseCacheEntry instance; None if not stored
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        request_headers = self._get_lowercase_headers(request_headers)
+        request_cache_control = self._get_request_cache_control(request_headers)
+
+        if (method in ( "GET", "HEAD" ) and "no-store" not in request_cache_control):
+            _return = self.store.get(url)
+
+            if (_return is not None
+                and _return.request_headers != self._get_selecting_headers(_return.headers, request_headers)
+               ): _return = None
+        #
+
+        return _return
+    #
+
+    def get_fresh_entry(self, method, url, request_headers = None):
+        """
+Returns the stored response for the given request if it can be used
+without contacting the server.
+
+:param method: HTTP method
+:param url: Request URL
+:param request_headers: Request headers
+
+:return: (object) ResponseCacheEntry instance; None if not stored or stale
+:since:  v1.0.0
+        """
+
+        _return = self.get_entry(method, url, request_headers)
+        if (_return is not None and (not self.is_fresh(_return, request_headers))): _return = None
+
+        return _return
+    #
+
+    def get_freshness_lifetime(self, entry):
+        """
+Returns the freshness lifetime of the given entry.
+
+:param entry: ResponseCacheEntry instance
+
+:return: (float) Freshness lifetime in seconds
+:since:  v1.0.0
+        """
+
+        headers = entry.headers
+        cache_control = self._get_cache_control(headers.get("cache_control"))
+
+        date = self._get_http_date(headers.get("date"))
+        if (date is None): date = entry.response_time
+
+        if ("max-age" in cache_control): _return = self._get_seconds(cache_control['max-age'])
+        elif ("expires" in headers):
+            expires = self._get_http_date(headers['expires'])
+            _return = (0 if (expires is None) else max(0, expires - date))
+        else:
+            last_modified = self._get_http_date(headers.get("last_modified"))
+
+            _return = (0
+                       if (last_modified is None or entry.code not in self.__class__.HEURISTICALLY_CACHEABLE_CODES) else
+                       min(self.__class__.HEURISTIC_MAX_LIFETIME, max(0, date - last_modified) / 10)
+                      )
+        #
+
+        return _return
+    #
+
+    def is_fresh(self, entry, request_headers = None):
+        """
+Returns true if the given entry can be used for the request without
+contacting the server.
+
+:param entry: ResponseCacheEntry instance
+:param request_headers: Request headers
+
+:return: (bool) True if fresh
+:since:  v1.0.0
+        """
+
+        request_cache_control = self._get_request_cache_control(self._get_lowercase_headers(request_headers))
+        response_cache_control = self._get_cache_control(entry.headers.get("cache_control"))
+
+        age = self.get_age(entry)
+        freshness_lifetime = self.get_freshness_lifetime(entry)
+
+        if ("no-cache" in request_cache_control
+            or "no-cache" in response_cache_control
+            or freshness_lifetime <= age
+           ): _return = False
+        elif ("max-age" in request_cache_control
+              and age > self._get_seconds(request_cache_control['max-age'])
+             ): _return = False
+        elif ("min-fresh" in request_cache_control
+              and freshness_lifetime - age < self._get_seconds(request_cache_control['min-fresh'])
+             ): _return = False
+        else: _return = True
+
+        return _return
+    #
+
+    def invalidate(self, url):
+        """
+Removes the stored response for the given URL.
+
+:param url: Request URL
+
+:since: v1.0.0
+        """
+
+        self.store.delete(url)
+    #
+
+    def is_storable(self, method, code, headers, request_headers = None):
+        """
+Returns true if the given response may be stored.
+
+:param method: HTTP method
+:param code: HTTP status code
+:param headers: Response headers dict as returned by "RawClient"
+:param request_headers: Request headers
+
+:return: (bool) True if storable
+:since:  v1.0.0
+        """
+
+        cache_control = self._get_cache_control(headers.get("cache_control"))
+        request_cache_control = self._get_request_cache_control(self._get_lowercase_headers(request_headers))
+
+        return (method == "GET"
+                and code >= 200
+                and code not in ( 206, 304 )
+                and "no-store" not in cache_control
+                and "no-store" not in request_cache_control
+                and headers.get("vary", "").strip() != "*"
+                and ("max-age" in cache_control
+                     or "expires" in headers
+                     or "etag" in headers
+                     or "last_modified" in headers
+                    )
+               )
+    #
+
+    def set(self, url, code, reason, headers, body, request_headers, request_time, response_time):
+        """
+Stores the given response.
+
+:param url: Request URL
+:param code: HTTP status code
+:param reason: HTTP reason phrase
+:param headers: Response headers dict as returned by "RawClient"
+:param body: Response body
+:param request_headers: Request headers
+:param request_time: UNIX timestamp the request has been sent
+:param response_time: UNIX timestamp the response has been received
+
+:since: v1.0.0
+        """
+
+        if (len(body) <= self.max_entry_size):
+            selecting_headers = self._get_selecting_headers(headers, self._get_lowercase_headers(request_headers))
+            self.store.set(url, ResponseCacheEntry(code, reason, headers, body, selecting_headers, request_time, response_time))
+        #
+    #
+
+    def update(self, url, entry, headers, request_headers, request_time, response_time):
+        """
+Updates the given entry with the headers of a "304 Not Modified" response
+received while revalidating it.
+
+:param url: Request URL
+:param entry: ResponseCacheEntry instance revalidated
+:param headers: Response headers dict of the "304 Not Modified" response
+:param request_headers: Request headers
+:param request_time: UNIX timestamp the request has been sent
+:param response_time: UNIX timestamp the response has been received
+
+:return: (object) Updated ResponseCacheEntry instance
+:since:  v1.0.0
+        """
+
+        updated_headers = entry.headers.copy()
+
+        for name in headers:
+            if (name not in self.__class__.HOP_BY_HOP_HEADERS): updated_headers[name] = headers[name]
+        #
+
+        if ("age" not in headers and "age" in updated_headers): del(updated_headers['age'])
+
+        _return = ResponseCacheEntry(entry.code,
+                                     entry.reason,
+                                     updated_headers,
+                                     entry.body,
+                                     entry.request_headers,
+                                     request_time,
+                                     response_time
+                                    )
+
+        if (self.is_storable("GET", entry.code, updated_headers, request_headers)): self.store.set(url, _return)
+        else: self.invalidate(url)
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_cache_control(value):
+        """
+Returns the directives of the given "Cache-Control" header value.
+
+:param value: Header value
+
+:return: (dict) Directives with lowercase names and their argument
+:since:  v1.0.0
+        """
+
+        _return = { }
+
+        if (value is not None):
+            for directive in value.split(","):
+                directive = directive.strip()
+
+                if (directive != ""):
+                    ( name, _, argument ) = directive.partition("=")
+                    _return[name.strip().lower()] = argument.strip().strip('"')
+                #
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_http_date(value):
+        """
+Returns the UNIX timestamp of the given HTTP date.
+
+:param value: HTTP date
+
+:return: (float) UNIX timestamp; None if invalid
+:since:  v1.0.0
+        """
+
+        date = (None if (value is None) else parsedate_tz(value))
+        return (None if (date is None) else mktime_tz(date))
+    #
+
+    @staticmethod
+    def _get_lowercase_headers(headers):
+        """
+Returns the given request headers with lowercase names.
+
+:param headers: Request headers
+
+:return: (dict) Request headers
+:since:  v1.0.0
+        """
+
+        return ({ } if (headers is None) else dict(( name.lower(), headers[name] ) for name in headers))
+    #
+
+    @staticmethod
+    def _get_request_cache_control(request_headers):
+        """
+Returns the "Cache-Control" directives of the given request headers.
+"Pragma: no-cache" is handled like "Cache-Control: no-cache".
+
+:param request_headers: Request headers with lowercase names
+
+:return: (dict) Directives with lowercase names and their argument
+:since:  v1.0.0
+        """
+
+        _return = ResponseCache._get_cache_control(request_headers.get("cache-control"))
+
+        if ("no-cache" in str(request_headers.get("pragma", "")).lower()
+            and "cache-control" not in request_headers
+           ): _return['no-cache'] = ""
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_seconds(value):
+        """
+Returns the number of seconds given as directive argument.
+
+:param value: Directive argument
+
+:return: (int) Seconds; 0 if invalid
+:since:  v1.0.0
+        """
+
+        try: return max(0, int(value))
+        except ValueError: return 0
+    #
+
+    @staticmethod
+    def _get_selecting_headers(headers, request_headers):
+        """
+Returns the request header values selected by the "Vary" header of the
+given response. "Authorization" is always selected to keep responses of
+different credentials apart.
+
+:param headers: Response headers dict as returned by "RawClient"
+:param request_headers: Request headers with lowercase names
+
+:return: (dict) Selected request header values
+:since:  v1.0.0
+        """
+
+        names = [ name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip() != "" ]
+        names.append("authorization")
+
+        return dict(( name, (None if (request_headers.get(name) is None) else str(request_headers[name])) ) for name in names)
+    #
+#
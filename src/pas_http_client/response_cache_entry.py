@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class ResponseCacheEntry(object):
+    """
+Response stored in a response cache.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__",
+                  "body",
+                  "code",
+                  "headers",
+                  "reason",
+                  "request_headers",
+                  "request_time",
+                  "response_time"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, code, reason, headers, body, request_headers, request_time, response_time):
+        """
+Constructor __init__(ResponseCacheEntry)
+
+:param code: HTTP status code
+:param reason: HTTP reason phrase
+:param headers: Response headers dict as returned by "RawClient"
+:param body: Response body as bytes or read-only buffer
+:param request_headers: Request header values selected by "Vary"
+:param request_time: UNIX timestamp the request has been sent
+:param response_time: UNIX timestamp the response has been received
+
+:since: v1.0.0
+        """
+
+        self.body = body
+        """
+Response body as bytes or read-only buffer
+        """
+        self.code = code
+        """
+HTTP status code
+        """
+        self.headers = headers
+        """
+Response headers dict
+        """
+        self.reason = reason
+        """
+HTTP reason phrase
+        """
+        self.request_headers = request_headers
+        """
+Request header values selected by "Vary" with lowercase names
+        """
+        self.request_time = request_time
+        """
+UNIX timestamp the request has been sent
+        """
+        self.response_time = response_time
+        """
+UNIX timestamp the response has been received
+        """
+    #
+
+    @property
+    def size(self):
+        """
+Returns the approximate number of bytes used by this entry.
+
+:return: (int) Entry size
+:since:  v1.0.0
+        """
+
+        _return = len(self.body)
+
+        for name in self.headers: _return += len(name) + len(str(self.headers[name]))
+        return _return
+    #
+#
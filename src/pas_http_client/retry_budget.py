@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import Lock
+
+class RetryBudget(object):
+    """
+Token bucket per host limiting retries to a ratio of the requests sent.
+Each request deposits a fraction of a token and each retry withdraws a
+whole one.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_buckets", "_lock", "max_tokens", "token_ratio" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_tokens = 10, token_ratio = 0.1):
+        """
+Constructor __init__(RetryBudget)
+
+:param max_tokens: Maximum number of tokens per host; buckets start full
+:param token_ratio: Fraction of a token deposited for each request
+
+:since: v1.0.0
+        """
+
+        self._buckets = { }
+        """
+Number of tokens available per host key
+        """
+        self._lock = Lock()
+        """
+Lock protecting the buckets
+        """
+        self.max_tokens = max_tokens
+        """
+Maximum number of tokens per host
+        """
+        self.token_ratio = token_ratio
+        """
+Fraction of a token deposited for each request
+        """
+    #
+
+    def clear(self):
+        """
+Resets the buckets of all hosts.
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._buckets.clear()
+    #
+
+    def deposit(self, key):
+        """
+Deposits the token fraction of a request sent to the given host.
+
+:param key: Host key
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._buckets[key] = min(self.max_tokens, self._buckets.get(key, self.max_tokens) + self.token_ratio)
+    #
+
+    def get_tokens(self, key):
+        """
+Returns the number of tokens available for the given host.
+
+:param key: Host key
+
+:return: (float) Number of tokens
+:since:  v1.0.0
+        """
+
+        with self._lock: return self._buckets.get(key, self.max_tokens)
+    #
+
+    def withdraw(self, key):
+        """
+Withdraws a token for a retry to the given host.
+
+:param key: Host key
+
+:return: (bool) True if a token has been available
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            tokens = self._buckets.get(key, self.max_tokens)
+            _return = (tokens >= 1)
+
+            if (_return): self._buckets[key] = tokens - 1
+        #
+
+        return _return
+    #
+#
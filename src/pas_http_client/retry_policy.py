@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module,undefined-variable
+
+import socket
+
+from email.utils import mktime_tz, parsedate_tz
+from random import uniform
+from time import time
+
+try: import http.client as http_client
+except ImportError: import httplib as http_client
+
+from .retry_budget import RetryBudget
+
+class RetryPolicy(object):
+    """
+Policy defining which failed requests are sent again and how long to wait
+before. Delays grow exponentially with random jitter and retries are
+limited by a retry budget per host.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    try: CONNECTION_DROP_EXCEPTIONS = ( BrokenPipeError, ConnectionResetError, http_client.RemoteDisconnected )
+    except NameError: CONNECTION_DROP_EXCEPTIONS = ( socket.error, http_client.BadStatusLine )
+    """
+Exceptions raised if the server closed a connection, e.g. an idle pooled one
+    """
+    try: DEFAULT_EXCEPTION_CLASSES = CONNECTION_DROP_EXCEPTIONS + ( ConnectionError, socket.timeout )
+    except NameError: DEFAULT_EXCEPTION_CLASSES = CONNECTION_DROP_EXCEPTIONS + ( socket.timeout, )
+    """
+Exceptions retried by default
+    """
+    DEFAULT_METHODS = ( "DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE" )
+    """
+Idempotent HTTP methods retried by default
+    """
+    DEFAULT_STATUS_CODES = ( 429, 502, 503, 504 )
+    """
+HTTP status codes retried by default
+    """
+
+    __slots__ = [ "__weakref__",
+                  "backoff_factor",
+                  "budget",
+                  "exception_classes",
+                  "is_jittered",
+                  "is_retry_after_respected",
+                  "max_backoff",
+                  "max_retries",
+                  "max_retry_after",
+                  "methods",
+                  "status_codes"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self,
+                 max_retries = 3,
+                 methods = None,
+                 status_codes = None,
+                 exception_classes = None,
+                 backoff_factor = 0.1,
+                 max_backoff = 10,
+                 is_jittered = True,
+                 is_retry_after_respected = True,
+                 max_retry_after = 60,
+                 budget = None
+                ):
+        """
+Constructor __init__(RetryPolicy)
+
+:param max_retries: Maximum number of retries per request
+:param methods: HTTP methods retried; None for the idempotent ones
+:param status_codes: HTTP status codes retried; None for the defaults
+:param exception_classes: Exception classes retried; None for the defaults
+:param backoff_factor: Delay in seconds before the first retry; doubled for
+                       each further one
+:param max_backoff: Maximum delay in seconds calculated
+:param is_jittered: True to wait a random time up to the delay calculated
+:param is_retry_after_respected: True to wait as long as requested by a
+                                 "Retry-After" header
+:param max_retry_after: Maximum "Retry-After" delay in seconds accepted;
+                        responses requesting longer ones are returned
+:param budget: RetryBudget limiting the retries per host; None for a new
+               one per policy
+
+:since: v1.0.0
+        """
+
+        self.backoff_factor = backoff_factor
+        """
+Delay in seconds before the first retry
+        """
+        self.budget = (RetryBudget() if (budget is None) else budget)
+        """
+RetryBudget limiting the retries per host
+        """
+        self.exception_classes = (self.__class__.DEFAULT_EXCEPTION_CLASSES if (exception_classes is None) else tuple(exception_classes))
+        """
+Exception classes retried
+        """
+        self.is_jittered = is_jittered
+        """
+True to wait a random time up to the delay calculated
+        """
+        self.is_retry_after_respected = is_retry_after_respected
+        """
+True to wait as long as requested by a "Retry-After" header
+        """
+        self.max_backoff = max_backoff
+        """
+Maximum delay in seconds calculated
+        """
+        self.max_retries = max_retries
+        """
+Maximum number of retries per request
+        """
+        self.max_retry_after = max_retry_after
+        """
+Maximum "Retry-After" delay in seconds accepted
+        """
+        self.methods = (self.__class__.DEFAULT_METHODS if (methods is None) else tuple(method.upper() for method in methods))
+        """
+HTTP methods retried
+        """
+        self.status_codes = (self.__class__.DEFAULT_STATUS_CODES if (status_codes is None) else tuple(status_codes))
+        """
+HTTP status codes retried
+        """
+    #
+
+    def get_backoff(self, retry_count):
+        """
+Returns the delay before the given retry.
+
+:param retry_count: Number of the retry starting with 1
+
+:return: (float) Delay in seconds
+:since:  v1.0.0
+        """
+
+        _return = min(self.max_backoff, self.backoff_factor * (2 ** (retry_count - 1)))
+        if (self.is_jittered): _return = uniform(0, _return)
+
+        return _return
+    #
+
+    def get_retry_delay(self, method, retry_count, code = None, headers = None, exception = None):
+        """
+Returns the delay before sending the request again after the given
+response or exception. A connection dropped on the first attempt is
+retried at once.
+
+:param method: HTTP method
+:param retry_count: Number of the retry starting with 1
+:param code: HTTP status code of the response
+:param headers: Response headers with lowercase names and underscores
+:param exception: Exception raised while sending the request
+
+:return: (float) Delay in seconds; None if the request is not retried
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (method.upper() in self.methods and retry_count <= self.max_retries):
+            if (exception is not None):
+                if (self.is_connection_dropped(exception) and retry_count == 1): _return = 0
+                elif (isinstance(exception, self.exception_classes)): _return = self.get_backoff(retry_count)
+            elif (code in self.status_codes):
+                retry_after = (self.get_retry_after(headers) if (self.is_retry_after_respected) else None)
+
+                if (retry_after is None): _return = self.get_backoff(retry_count)
+                elif (retry_after <= self.max_retry_after): _return = retry_after
+            #
+        #
+
+        return _return
+    #
+
+    def is_connection_dropped(self, exception):
+        """
+Returns true if the given exception has been raised because the server
+closed the connection.
+
+:param exception: Exception raised while sending the request
+
+:return: (bool) True if dropped
+:since:  v1.0.0
+        """
+
+        return isinstance(exception, self.__class__.CONNECTION_DROP_EXCEPTIONS)
+    #
+
+    @staticmethod
+    def get_retry_after(headers):
+        """
+Returns the delay requested by the "Retry-After" header of the given
+response headers.
+
+:param headers: Response headers with lowercase names and underscores
+
+:return: (float) Delay in seconds; None if not requested
+:since:  v1.0.0
+        """
+
+        _return = None
+        value = (None if (headers is None) else headers.get("retry_after"))
+
+        if (value is not None):
+            value = value.strip()
+
+            if (value.isdigit()): _return = int(value)
+            else:
+                date = parsedate_tz(value)
+                if (date is not None): _return = max(0, mktime_tz(date) - time())
+            #
+        #
+
+        return _return
+    #
+#
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+import socket
+import sys
+
+class SocketOptions(object):
+    """
+Low-level options applied to sockets of new connections. Options not
+supported by the platform are ignored if noted.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    TCP_FASTOPEN_CONNECT = getattr(socket, "TCP_FASTOPEN_CONNECT", (30 if (sys.platform.startswith("linux")) else None))
+    """
+Socket option enabling TCP Fast Open for outgoing connections
+    """
+
+    __slots__ = [ "__weakref__",
+                  "is_keepalive_enabled",
+                  "is_tcp_fastopen_enabled",
+                  "keepalive_count",
+                  "keepalive_idle",
+                  "keepalive_interval",
+                  "receive_buffer_size",
+                  "send_buffer_size",
+                  "tcp_nodelay"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self,
+                 tcp_nodelay = True,
+                 is_keepalive_enabled = False,
+                 keepalive_idle = None,
+                 keepalive_interval = None,
+                 keepalive_count = None,
+                 send_buffer_size = None,
+                 receive_buffer_size = None,
+                 is_tcp_fastopen_enabled = False
+                ):
+        """
+Constructor __init__(SocketOptions)
+
+:param tcp_nodelay: True to disable Nagle's algorithm; None to keep the
+                    default
+:param is_keepalive_enabled: True to enable TCP keepalive probes
+:param keepalive_idle: Seconds a connection is idle before probes are sent
+:param keepalive_interval: Seconds between probes
+:param keepalive_count: Number of unanswered probes before the connection
+                        is dropped
+:param send_buffer_size: Socket send buffer size in bytes
+:param receive_buffer_size: Socket receive buffer size in bytes
+:param is_tcp_fastopen_enabled: True to use TCP Fast Open where available
+
+:since: v1.0.0
+        """
+
+        self.is_keepalive_enabled = is_keepalive_enabled
+        """
+True to enable TCP keepalive probes
+        """
+        self.is_tcp_fastopen_enabled = is_tcp_fastopen_enabled
+        """
+True to use TCP Fast Open where available
+        """
+        self.keepalive_count = keepalive_count
+        """
+Number of unanswered probes before the connection is dropped
+        """
+        self.keepalive_idle = keepalive_idle
+        """
+Seconds a connection is idle before probes are sent
+        """
+        self.keepalive_interval = keepalive_interval
+        """
+Seconds between probes
+        """
+        self.receive_buffer_size = receive_buffer_size
+        """
+Socket receive buffer size in bytes
+        """
+        self.send_buffer_size = send_buffer_size
+        """
+Socket send buffer size in bytes
+        """
+        self.tcp_nodelay = tcp_nodelay
+        """
+True to disable Nagle's algorithm; None to keep the default
+        """
+    #
+
+    def apply(self, sock, is_connected = False):
+        """
+Applies the options to the given socket. Buffer sizes and TCP Fast Open
+are only fully effective if applied before connecting.
+
+:param sock: Socket
+:param is_connected: True if the socket is already connected
+
+:since: v1.0.0
+        """
+
+        if (sock.family not in ( socket.AF_INET, getattr(socket, "AF_INET6", None) )): return
+
+        if (self.send_buffer_size is not None): sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        if (self.receive_buffer_size is not None): sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size)
+
+        if (self.tcp_nodelay is not None): sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, (1 if (self.tcp_nodelay) else 0))
+
+        if (self.is_keepalive_enabled):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self._apply_keepalive_timing(sock)
+        #
+
+        if (self.is_tcp_fastopen_enabled and (not is_connected) and self.__class__.TCP_FASTOPEN_CONNECT is not None):
+            try: sock.setsockopt(socket.IPPROTO_TCP, self.__class__.TCP_FASTOPEN_CONNECT, 1)
+            except socket.error: pass
+        #
+    #
+
+    def _apply_keepalive_timing(self, sock):
+        """
+Applies the keepalive timing options supported by the platform.
+
+:param sock: Socket
+
+:since: v1.0.0
+        """
+
+        if (hasattr(socket, "SIO_KEEPALIVE_VALS") and hasattr(sock, "ioctl")):
+            if (self.keepalive_idle is not None or self.keepalive_interval is not None):
+                sock.ioctl(socket.SIO_KEEPALIVE_VALS,
+                           ( 1,
+                             int(1000 * (7200 if (self.keepalive_idle is None) else self.keepalive_idle)),
+                             int(1000 * (1 if (self.keepalive_interval is None) else self.keepalive_interval))
+                           )
+                          )
+            #
+        else:
+            keepalive_idle_option = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+
+            if (self.keepalive_idle is not None and keepalive_idle_option is not None):
+                sock.setsockopt(socket.IPPROTO_TCP, keepalive_idle_option, int(self.keepalive_idle))
+            #
+
+            if (self.keepalive_interval is not None and hasattr(socket, "TCP_KEEPINTVL")):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, int(self.keepalive_interval))
+            #
+        #
+
+        if (self.keepalive_count is not None and hasattr(socket, "TCP_KEEPCNT")):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, int(self.keepalive_count))
+        #
+    #
+
+    def create_connection(self, address_resolver, address, timeout = socket._GLOBAL_DEFAULT_TIMEOUT, source_address = None):
+        """
+Connects to the given address applying the options before connecting and
+returns the socket. Compatible with "socket.create_connection()" if the
+address resolver argument is bound.
+
+:param address_resolver: AddressResolver instance; None to resolve the host
+                         name for this connection only
+:param address: Tuple of host and port
+:param timeout: Socket timeout in seconds
+:param source_address: Tuple of host and port to bind to before connecting
+
+:return: (object) Connected socket
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        if (address_resolver is not None): return address_resolver.create_connection(address, timeout, source_address, self)
+
+        exception = None
+
+        for ( family, socket_type, protocol, _, socket_address ) in socket.getaddrinfo(address[0], address[1], 0, socket.SOCK_STREAM):
+            sock = None
+
+            try:
+                sock = socket.socket(family, socket_type, protocol)
+                self.apply(sock)
+
+                if (timeout is not socket._GLOBAL_DEFAULT_TIMEOUT): sock.settimeout(timeout)
+                if (source_address is not None): sock.bind(source_address)
+
+                sock.connect(socket_address)
+                return sock
+            except socket.error as handled_exception:
+                exception = handled_exception
+                if (sock is not None): sock.close()
+            #
+        #
+
+        raise (socket.error("No address found for {0!r}".format(address)) if (exception is None) else exception)
+    #
+#
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+import ssl
+
+from os import stat
+from threading import RLock
+
+class TlsContextCache(object):
+    """
+Cache for SSL/TLS contexts and sessions. Contexts are invalidated if a
+file used to create them has been modified. Sessions are kept per host to
+resume them on reconnects.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "__weakref__", "_contexts", "_lock", "max_sessions", "_sessions" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance = None
+    """
+Process-wide TlsContextCache instance
+    """
+    _instance_lock = RLock()
+    """
+Thread safety lock for the process-wide instance
+    """
+
+    def __init__(self, max_sessions = 256):
+        """
+Constructor __init__(TlsContextCache)
+
+:param max_sessions: Maximum number of cached SSL/TLS sessions
+
+:since: v1.0.0
+        """
+
+        self._contexts = { }
+        """
+Cached contexts and file modification times per context key
+        """
+        self._lock = RLock()
+        """
+Thread safety lock
+        """
+        self.max_sessions = max_sessions
+        """
+Maximum number of cached SSL/TLS sessions
+        """
+        self._sessions = { }
+        """
+Cached SSL/TLS sessions per host and port
+        """
+    #
+
+    def clear(self):
+        """
+Removes all cached contexts and sessions.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._contexts.clear()
+            self._sessions.clear()
+        #
+    #
+
+    def get_context(self, cert_file_name = None, key_file_name = None, ca_file_name = None, is_verified = True):
+        """
+Returns a cached SSL/TLS context for the given parameters. A new context is
+created if none is cached or a file has been modified since.
+
+:param cert_file_name: Path and file name of the PEM-encoded certificate
+                       file
+:param key_file_name: Path and file name of the private key
+:param ca_file_name: Path and file name of the CA certificates to verify
+                     the peer with; None for the system default
+:param is_verified: False to disable peer certificate and host name
+                    verification
+
+:return: (object) SSL/TLS context
+:since:  v1.0.0
+        """
+
+        key = ( cert_file_name, key_file_name, ca_file_name, is_verified )
+        file_mtimes = self._get_file_mtimes(cert_file_name, key_file_name, ca_file_name)
+
+        with self._lock:
+            cached_entry = self._contexts.get(key)
+            if (cached_entry is not None and cached_entry[1] == file_mtimes): return cached_entry[0]
+        #
+
+        _return = ssl.create_default_context(cafile = ca_file_name)
+
+        if (not is_verified):
+            _return.check_hostname = False
+            _return.verify_mode = ssl.CERT_NONE
+        #
+
+        if (cert_file_name is not None):
+            if (key_file_name is not None): _return.load_cert_chain(cert_file_name, key_file_name)
+            else: _return.load_cert_chain(cert_file_name)
+        #
+
+        with self._lock: self._contexts[key] = ( _return, file_mtimes )
+
+        return _return
+    #
+
+    def get_session(self, host, port, context):
+        """
+Returns the SSL/TLS session cached for the given host to resume it.
+
+:param host: Host name
+:param port: Port
+:param context: SSL/TLS context the session must belong to
+
+:return: (object) SSL/TLS session; None if not cached
+:since:  v1.0.0
+        """
+
+        with self._lock: cached_entry = self._sessions.get(( host, port ))
+        return (cached_entry[1] if (cached_entry is not None and cached_entry[0] is context) else None)
+    #
+
+    def set_session(self, host, port, context, session):
+        """
+Caches the given SSL/TLS session for the host.
+
+:param host: Host name
+:param port: Port
+:param context: SSL/TLS context the session belongs to
+:param session: SSL/TLS session
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            if (len(self._sessions) >= self.max_sessions and ( host, port ) not in self._sessions): self._sessions.clear()
+            self._sessions[( host, port )] = ( context, session )
+        #
+    #
+
+    @classmethod
+    def get_instance(cls):
+        """
+Returns the process-wide TlsContextCache instance.
+
+:return: (object) TlsContextCache instance
+:since:  v1.0.0
+        """
+
+        with cls._instance_lock:
+            if (cls._instance is None): cls._instance = cls()
+            return cls._instance
+        #
+    #
+
+    @staticmethod
+    def _get_file_mtimes(*file_names):
+        """
+Returns the modification times of the given files.
+
+:return: (tuple) Modification times; None for files not accessible
+:since:  v1.0.0
+        """
+
+        _return = [ ]
+
+        for file_name in file_names:
+            file_mtime = None
+
+            if (file_name is not None):
+                try: file_mtime = stat(file_name).st_mtime
+                except OSError: pass
+            #
+
+            _return.append(file_mtime)
+        #
+
+        return tuple(_return)
+    #
+#
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+try: import http.client as http_client
+except ImportError: import httplib as http_client
+
+from .tls_context_cache import TlsContextCache
+
+class TlsSessionConnection(http_client.HTTPSConnection):
+    """
+HTTPS connection resuming cached SSL/TLS sessions on reconnects to the same
+host.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=protected-access
+
+    tls_handshake_timeout = None
+    """
+Timeout in seconds for the SSL/TLS handshake; None to use the socket timeout
+    """
+
+    @property
+    def _server_hostname(self):
+        """
+Returns the host name used for SNI and certificate verification.
+
+:return: (str) Server host name
+:since:  v1.0.0
+        """
+
+        return (self.host if (self._tunnel_host is None) else self._tunnel_host)
+    #
+
+    def connect(self):
+        """
+Connects to the host and resumes a cached SSL/TLS session if available. The
+handshake is limited by "tls_handshake_timeout" if set.
+
+:since: v1.0.0
+        """
+
+        http_client.HTTPConnection.connect(self)
+
+        server_hostname = self._server_hostname
+        session = TlsContextCache.get_instance().get_session(server_hostname, self.port, self._context)
+
+        sock_timeout = self.sock.gettimeout()
+        if (self.tls_handshake_timeout is not None): self.sock.settimeout(self.tls_handshake_timeout)
+
+        self.sock = self._context.wrap_socket(self.sock, server_hostname = server_hostname, session = session)
+        self.sock.settimeout(sock_timeout)
+    #
+
+    def getresponse(self):
+        """
+Returns the response and caches the SSL/TLS session afterwards. Session
+tickets of TLS 1.3 are only available after the handshake has completed.
+
+:return: (object) HTTP response object
+:since:  v1.0.0
+        """
+
+        sock = self.sock
+        _return = http_client.HTTPSConnection.getresponse(self)
+
+        session = getattr(sock, "session", None)
+        if (session is not None): TlsContextCache.get_instance().set_session(self._server_hostname, self.port, self._context, session)
+
+        return _return
+    #
+#
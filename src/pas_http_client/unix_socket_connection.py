@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module,protected-access
+
+import socket
+
+try: import http.client as http_client
+except ImportError: import httplib as http_client
+
+class UnixSocketConnection(http_client.HTTPConnection):
+    """
+HTTP connection using a UNIX domain socket as transport.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def __init__(self, socket_path, host, port = None, timeout = socket._GLOBAL_DEFAULT_TIMEOUT):
+        """
+Constructor __init__(UnixSocketConnection)
+
+:param socket_path: Path of the UNIX domain socket
+:param host: Host name used for the "Host" header
+:param port: Port used for the "Host" header
+:param timeout: Socket timeout in seconds
+
+:since: v1.0.0
+        """
+
+        http_client.HTTPConnection.__init__(self, host, port, timeout = timeout)
+
+        self.socket_path = socket_path
+        """
+Path of the UNIX domain socket
+        """
+    #
+
+    def connect(self):
+        """
+Connects to the UNIX domain socket.
+
+:since: v1.0.0
+        """
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            if (self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT): sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except Exception:
+            sock.close()
+            raise
+        #
+
+        self.sock = sock
+    #
+#
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .abstract_connection_factory import AbstractConnectionFactory
+from .async_connection import AsyncConnection
+from .unix_socket_connection import UnixSocketConnection
+
+class UnixSocketConnectionFactory(AbstractConnectionFactory):
+    """
+Factory creating HTTP connections to a local UNIX domain socket, e.g. for
+sidecar processes. The host of the URL is only used for the "Host" header.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "socket_path" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, socket_path):
+        """
+Constructor __init__(UnixSocketConnectionFactory)
+
+:param socket_path: Path of the UNIX domain socket
+
+:since: v1.0.0
+        """
+
+        self.socket_path = socket_path
+        """
+Path of the UNIX domain socket
+        """
+    #
+
+    def create_async_connection(self, client, host, port, timeout):
+        """
+Returns a new, not yet connected asyncio based HTTP connection.
+
+:param client: Client instance requesting the connection
+:param host: Host name or address to connect to
+:param port: Port to connect to
+:param timeout: Timeout in seconds for connecting
+
+:return: (object) AsyncConnection instance
+:since:  v1.0.0
+        """
+
+        return AsyncConnection(host, port, timeout, socket_path = self.socket_path)
+    #
+
+    def create_connection(self, client, host, port, timeout):
+        """
+Returns a new, not yet connected HTTP connection.
+
+:param client: Client instance requesting the connection
+:param host: Host name or address to connect to
+:param port: Port to connect to
+:param timeout: Socket timeout in seconds
+
+:return: (object) HTTP connection compatible with "http.client"
+:since:  v1.0.0
+        """
+
+        return UnixSocketConnection(self.socket_path, host, port, timeout)
+    #
+#
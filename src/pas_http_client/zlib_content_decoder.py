@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import zlib
+
+from dpt_runtime.binary import Binary
+
+from .abstract_content_decoder import AbstractContentDecoder
+
+class ZlibContentDecoder(AbstractContentDecoder):
+    """
+Incremental decoder for the "gzip" and "deflate" content-codings based on
+zlib.
+
+:author:     direct Netware Group
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas.http
+:subpackage: client
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_decompressor", "_encoding", "_pending_data" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, encoding = "gzip"):
+        """
+Constructor __init__(ZlibContentDecoder)
+
+:param encoding: Content-coding to decode
+
+:since: v1.0.0
+        """
+
+        self._decompressor = None
+        """
+zlib decompression object
+        """
+        self._encoding = encoding.lower()
+        """
+Content-coding to decode
+        """
+        self._pending_data = Binary.BYTES_TYPE()
+        """
+Input not yet consumed by the decompression object
+        """
+
+        if (self._encoding != "deflate"): self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    #
+
+    @property
+    def is_pending(self):
+        """
+Returns true if decoded data is pending without providing further input.
+Input kept until the "deflate" header is complete is not pending as it
+requires further input.
+
+:return: (bool) True if pending
+:since:  v1.0.0
+        """
+
+        return (self._decompressor is not None and len(self._pending_data) > 0)
+    #
+
+    def decode(self, data, max_length = 0):
+        """
+Decodes the given data.
+
+:param data: Encoded data; empty to continue with pending input
+:param max_length: Maximum number of bytes returned; 0 for unlimited
+
+:return: (bytes) Decoded data
+:since:  v1.0.0
+        """
+
+        data = (self._pending_data + data if (len(self._pending_data) > 0) else data)
+
+        if (self._decompressor is None):
+            """
+"deflate" is defined as zlib wrapped data but often sent as raw deflate
+data. A valid zlib header is detected by its checksum.
+            """
+
+            if (len(data) < 2):
+                self._pending_data = data
+                return Binary.BYTES_TYPE()
+            #
+
+            header = bytearray(data[:2])
+            is_zlib_wrapped = ((header[0] & 0x0F) == 8 and ((header[0] << 8) | header[1]) % 31 == 0)
+
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS if (is_zlib_wrapped) else -zlib.MAX_WBITS)
+        #
+
+        _return = self._decompressor.decompress(data, max_length)
+        self._pending_data = self._decompressor.unconsumed_tail
+
+        return _return
+    #
+
+    def flush(self):
+        """
+Returns remaining decoded data after all input has been provided.
+
+:return: (bytes) Decoded data
+:since:  v1.0.0
+        """
+
+        return (Binary.BYTES_TYPE() if (self._decompressor is None) else self._decompressor.flush())
+    #
+#
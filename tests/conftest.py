@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from os import path
+import os
+import sys
+
+sys.path.insert(0, path.join(path.dirname(path.dirname(path.abspath(__file__))), "src"))
+
+from threading import Lock, Thread
+from time import sleep
+import re
+import socket
+import ssl
+import zlib
+
+try: from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError: from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+try: from socketserver import ThreadingMixIn, UnixStreamServer
+except ImportError: from SocketServer import ThreadingMixIn, UnixStreamServer
+
+import pytest
+
+class TestHttpServerMixin(object):
+    """
+Threaded HTTP server counting the connections accepted and the requests
+received per path. The request headers with lowercase names and the response
+code of each request are recorded as well as the maximum number of "/slow"
+requests handled concurrently.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        self.connection_count = 0
+        self.hits = { }
+        self.in_flight_count = 0
+        self.lock = Lock()
+        self.max_in_flight_count = 0
+        self.requests = [ ]
+    #
+
+    def add_request(self, path, headers, code):
+        with self.lock: self.requests.append(( path, headers, code ))
+    #
+
+    def change_in_flight_count(self, delta):
+        with self.lock:
+            self.in_flight_count += delta
+            self.max_in_flight_count = max(self.max_in_flight_count, self.in_flight_count)
+        #
+    #
+
+    def count_connection(self):
+        with self.lock: self.connection_count += 1
+    #
+
+    def count_hit(self, path):
+        with self.lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            return self.hits[path]
+        #
+    #
+
+    def get_hits(self, path):
+        with self.lock: return self.hits.get(path, 0)
+    #
+
+    def get_requests(self, path):
+        with self.lock: return [ request[1:] for request in self.requests if (request[0] == path) ]
+    #
+
+    def handle_error(self, request, client_address): pass
+#
+
+class TestHttpServer(TestHttpServerMixin, ThreadingMixIn, HTTPServer):
+    """
+Test HTTP server listening on a TCP port of the loopback interface. The
+socket is protected with SSL/TLS if a context is given.
+    """
+
+    def __init__(self, ssl_context = None):
+        TestHttpServerMixin.__init__(self)
+        HTTPServer.__init__(self, ( "127.0.0.1", 0 ), TestHttpRequestHandler)
+
+        self.scheme = ("http" if (ssl_context is None) else "https")
+        if (ssl_context is not None): self.socket = ssl_context.wrap_socket(self.socket, server_side = True)
+    #
+
+    @property
+    def url(self): return "{0}://127.0.0.1:{1:d}".format(self.scheme, self.server_port)
+#
+
+class TestUnixHttpServer(TestHttpServerMixin, ThreadingMixIn, UnixStreamServer):
+    """
+Test HTTP server listening on a UNIX domain socket.
+    """
+
+    def __init__(self, socket_path):
+        TestHttpServerMixin.__init__(self)
+        UnixStreamServer.__init__(self, socket_path, TestHttpRequestHandler)
+    #
+#
+
+class TestHttpRequestHandler(BaseHTTPRequestHandler):
+    """
+Request handler providing the endpoints used by the tests:
+
+/alternate: Every odd request is answered after one second
+/cache: Cacheable response revalidated with "If-None-Match"
+/cache-fresh: Response fresh for 60 seconds containing the request number
+/cache-modified: Cacheable response revalidated with "If-Modified-Since"
+/chunked: Chunked transfer-encoded response
+/close: Static response closing the connection afterwards
+/data: Uncompressed "DEFLATE_DATA" sent in two parts
+/deflate: "deflate" content-coded response
+/flaky: "503 Service Unavailable" for the first two requests
+/hello: Static response
+/lines: "LINES_DATA" with mixed line terminators
+/no-store: Response not to be stored by caches
+/slow: Query string answered after the number of seconds given as "delay"
+
+HEAD requests are answered with the headers of "/hello" and POST and PUT
+requests with the request body received for all paths.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.count_connection()
+    #
+
+    def do_GET(self):
+        ( path, _, query ) = self.path.partition("?")
+        hits = self.server.count_hit(path)
+
+        if (path == "/alternate"):
+            if (hits % 2 == 1): sleep(1)
+            self._send_body(200, "alternate {0:d}".format(hits).encode("ascii"))
+        elif (path == "/cache"):
+            if (self.headers.get("If-None-Match") == '"v1"'): self._send_body(304, None, { "ETag": '"v1"', "Cache-Control": "max-age=0" })
+            else: self._send_body(200, b"cached", { "ETag": '"v1"', "Cache-Control": "max-age=0" })
+        elif (path == "/cache-fresh"): self._send_body(200, "fresh {0:d}".format(hits).encode("ascii"), { "Cache-Control": "max-age=60" })
+        elif (path == "/cache-modified"):
+            headers = { "Last-Modified": LAST_MODIFIED, "Cache-Control": "max-age=0" }
+
+            if (self.headers.get("If-Modified-Since") == LAST_MODIFIED): self._send_body(304, None, headers)
+            else: self._send_body(200, b"modified", headers)
+        elif (path == "/chunked"):
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            for data in CHUNKED_DATA: self.wfile.write("{0:x};ext=1\r\n".format(len(data)).encode("ascii") + data + b"\r\n")
+            self.wfile.write(b"0\r\nX-Trailer: 1\r\n\r\n")
+        elif (path == "/close"):
+            self.close_connection = True
+            self._send_body(200, b"closed", { "Connection": "close" })
+        elif (path == "/data"):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(DEFLATE_DATA)))
+            self.end_headers()
+
+            self.wfile.write(DEFLATE_DATA[:1024])
+            self.wfile.flush()
+            sleep(0.1)
+            self.wfile.write(DEFLATE_DATA[1024:])
+        elif (path == "/deflate"): self._send_body(200, zlib.compress(DEFLATE_DATA), { "Content-Encoding": "deflate" })
+        elif (path == "/flaky"):
+            if (hits <= 2): self._send_body(503, b"busy", { "Retry-After": "0" })
+            else: self._send_body(200, "flaky {0:d}".format(hits).encode("ascii"))
+        elif (path == "/lines"): self._send_body(200, LINES_DATA)
+        elif (path == "/no-store"): self._send_body(200, "no-store {0:d}".format(hits).encode("ascii"), { "Cache-Control": "no-store" })
+        elif (path == "/slow"):
+            self.server.change_in_flight_count(1)
+
+            try:
+                params = dict(param.split("=", 1) for param in re.split("[&;]", query) if ("=" in param))
+                sleep(float(params.get("delay", 0.2)))
+            finally: self.server.change_in_flight_count(-1)
+
+            self._send_body(200, query.encode("ascii"))
+        else: self._send_body(200, b"hello world")
+    #
+
+    def do_HEAD(self):
+        self.server.count_hit(self.path.split("?", 1)[0])
+
+        self.send_response(200)
+        self.send_header("Content-Length", "11")
+        self.end_headers()
+    #
+
+    def do_POST(self):
+        self.server.count_hit(self.path.split("?", 1)[0])
+        self._send_body(200, self._read_body())
+    #
+
+    do_PUT = do_POST
+
+    def _read_body(self):
+        if (self.headers.get("Transfer-Encoding", "").lower() != "chunked"): _return = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        else:
+            _return = b""
+
+            while True:
+                chunk_size = int(self.rfile.readline().split(b";", 1)[0], 16)
+
+                if (chunk_size < 1):
+                    while (self.rfile.readline().strip() != b""): pass
+                    break
+                #
+
+                _return += self.rfile.read(chunk_size)
+                self.rfile.readline()
+            #
+        #
+
+        return _return
+    #
+
+    def send_response(self, code, message = None):
+        self.server.add_request(self.path.split("?", 1)[0], dict(( name.lower(), value ) for ( name, value ) in self.headers.items()), code)
+        BaseHTTPRequestHandler.send_response(self, code, message)
+    #
+
+    def _send_body(self, code, body, headers = None):
+        self.send_response(code)
+
+        if (headers is not None):
+            for name in headers: self.send_header(name, headers[name])
+        #
+
+        if (body is None): self.end_headers()
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            self.wfile.write(body)
+        #
+    #
+
+    def log_message(self, *args): pass
+#
+
+CHUNKED_DATA = [ "chunk {0:d} ".format(i).encode("ascii") * 10 for i in range(5) ]
+DEFLATE_DATA = b"direct PAS HTTP client " * 4096
+FD_SETSIZE = 1024
+LAST_MODIFIED = "Thu, 01 Jan 2015 00:00:00 GMT"
+LINES_DATA = b"line 0\r\nline 1\n\nline 3\r\nline 4"
+TLS_CERT_FILE_NAME = path.join(path.dirname(path.abspath(__file__)), "data", "localhost.pem")
+TLS_KEY_FILE_NAME = path.join(path.dirname(path.abspath(__file__)), "data", "localhost.key")
+
+@pytest.fixture
+def high_file_descriptors():
+    """
+Opens file descriptors until new ones exceed FD_SETSIZE of "select()".
+    """
+
+    resource = pytest.importorskip("resource")
+
+    ( soft_limit, hard_limit ) = resource.getrlimit(resource.RLIMIT_NOFILE)
+    is_limit_raised = (soft_limit < FD_SETSIZE + 64)
+
+    if (is_limit_raised):
+        if (hard_limit != resource.RLIM_INFINITY and hard_limit < FD_SETSIZE + 64): pytest.skip("File descriptor limit too low")
+        resource.setrlimit(resource.RLIMIT_NOFILE, ( FD_SETSIZE + 64, hard_limit ))
+    #
+
+    file_descriptors = [ ]
+
+    try:
+        while (len(file_descriptors) < 1 or file_descriptors[-1] < FD_SETSIZE): file_descriptors.append(os.dup(0))
+        yield file_descriptors
+    finally:
+        for file_descriptor in file_descriptors: os.close(file_descriptor)
+        if (is_limit_raised): resource.setrlimit(resource.RLIMIT_NOFILE, ( soft_limit, hard_limit ))
+    #
+#
+
+def _serve(server):
+    """
+Serves requests in a background thread until the test is finished.
+    """
+
+    Thread(target = server.serve_forever, daemon = True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+#
+
+@pytest.fixture
+def http_server():
+    yield from _serve(TestHttpServer())
+#
+
+@pytest.fixture
+def https_server():
+    ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ssl_context.load_cert_chain(TLS_CERT_FILE_NAME, TLS_KEY_FILE_NAME)
+
+    yield from _serve(TestHttpServer(ssl_context))
+#
+
+@pytest.fixture
+def unix_http_server(tmp_path):
+    if (not hasattr(socket, "AF_UNIX")): pytest.skip("UNIX domain sockets are not supported")
+    yield from _serve(TestUnixHttpServer(str(tmp_path / "http.sock")))
+#
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import pytest
+
+from pas_http_client import AddressResolver, Client
+
+from .conftest import FD_SETSIZE
+
+def test_request_with_address_resolver(http_server):
+    client = Client(http_server.url + "/hello")
+    client.set_address_resolver(AddressResolver())
+
+    assert client.request_get().read() == b"hello world"
+#
+
+@pytest.mark.usefixtures("high_file_descriptors")
+def test_connect_with_file_descriptors_above_fd_setsize(http_server):
+    sock = AddressResolver().create_connection(( "127.0.0.1", http_server.server_port ), 5)
+
+    try: assert sock.fileno() > FD_SETSIZE
+    finally: sock.close()
+#
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+
+from threading import Thread
+
+from pas_http_client import AsyncClient, AsyncConnectionPool
+
+class PooledConnection(object):
+    """
+Connection stub counting calls of "close()".
+    """
+
+    def __init__(self):
+        self.close_count = 0
+    #
+
+    @property
+    def is_connected(self): return (self.close_count < 1)
+
+    def close(self): self.close_count += 1
+#
+
+def _request_get(http_server, connection_pool, count = 1):
+    """
+Runs the given number of requests in a new event loop.
+    """
+
+    async def request_get():
+        client = AsyncClient(http_server.url + "/hello")
+        client.set_connection_pool(connection_pool)
+
+        _return = [ ]
+
+        for _ in range(count):
+            response = await client.request_get()
+            _return.append(( response.code, await response.read() ))
+        #
+
+        return _return
+    #
+
+    return asyncio.run(request_get())
+#
+
+def test_connection_reuse_within_event_loop(http_server):
+    connection_pool = AsyncConnectionPool()
+
+    assert _request_get(http_server, connection_pool, 3) == [ ( 200, b"hello world" ) ] * 3
+    assert http_server.get_hits("/hello") == 3
+    assert connection_pool.idle_count == 1
+#
+
+def test_connection_pool_across_event_loops(http_server):
+    connection_pool = AsyncConnectionPool()
+
+    for _ in range(3): assert _request_get(http_server, connection_pool) == [ ( 200, b"hello world" ) ]
+    assert connection_pool.idle_count == 1
+#
+
+def test_process_wide_connection_pool_across_event_loops(http_server):
+    connection_pool = AsyncConnectionPool.get_instance()
+
+    for _ in range(2): assert _request_get(http_server, connection_pool) == [ ( 200, b"hello world" ) ]
+#
+
+def test_release_from_another_thread():
+    connection_pool = AsyncConnectionPool(max_connections_per_host = 1)
+    loop = asyncio.new_event_loop()
+
+    try:
+        connection = loop.run_until_complete(connection_pool.borrow("a", PooledConnection))
+
+        thread = Thread(target = connection_pool.release, args = ( "a", connection, False ))
+        thread.start()
+        thread.join()
+
+        assert loop.run_until_complete(connection_pool.borrow("a", PooledConnection, 0.5)) is not connection
+        assert connection.close_count == 1
+    finally: loop.close()
+#
+
+def test_release_with_cancelled_waiter():
+    connection_pool = AsyncConnectionPool(max_connections_per_host = 1)
+
+    async def borrow_after_cancellation():
+        connection = await connection_pool.borrow("a", PooledConnection)
+
+        cancelled_task = asyncio.ensure_future(connection_pool.borrow("a", PooledConnection))
+        task = asyncio.ensure_future(connection_pool.borrow("a", PooledConnection, 1))
+        await asyncio.sleep(0.01)
+
+        connection_pool.release("a", connection)
+        cancelled_task.cancel()
+
+        return ((await task) is connection and cancelled_task.cancelled())
+    #
+
+    assert asyncio.run(borrow_after_cancellation())
+#
+
+def test_shared_by_event_loops_in_threads():
+    connection_pool = AsyncConnectionPool(max_connections_per_host = 2)
+
+    async def borrow_and_release():
+        for _ in range(500):
+            connection = await connection_pool.borrow("a", PooledConnection, 5)
+            await asyncio.sleep(0)
+            connection_pool.release("a", connection)
+        #
+    #
+
+    threads = [ Thread(target = asyncio.run, args = ( borrow_and_release(), )) for _ in range(4) ]
+
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    assert connection_pool.idle_count <= 4
+
+    connection_pool.clear()
+    assert connection_pool.idle_count == 0
+#
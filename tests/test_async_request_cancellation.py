@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+
+import pytest
+
+from pas_http_client import AddressResolver, AsyncClient, AsyncConnectionPool, CircuitBreaker, ConcurrencyLimiter
+
+def test_cancelled_requests_not_recorded(http_server):
+    circuit_breaker = CircuitBreaker(minimum_calls = 4)
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 10)
+    address_resolver = AddressResolver(max_address_failures = 1)
+    host_key = ( "http", "127.0.0.1", http_server.server_port )
+
+    async def request_get():
+        client = AsyncClient(http_server.url + "/alternate")
+        client.set_address_resolver(address_resolver)
+        client.set_circuit_breaker(circuit_breaker)
+        client.set_concurrency_limiter(concurrency_limiter)
+        client.set_connection_pool(AsyncConnectionPool())
+
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError): await asyncio.wait_for(client.request_get(), 0.2)
+
+            response = await client.request_get()
+            assert response.code == 200
+            await response.read()
+        #
+    #
+
+    asyncio.run(request_get())
+
+    assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_CLOSED
+    assert concurrency_limiter.get_limit(host_key) >= 10
+    assert concurrency_limiter.get_in_flight_count(host_key) == 0
+    assert not address_resolver.is_address_ejected(( "127.0.0.1", http_server.server_port ))
+#
+
+def test_cancelled_probe_released(http_server):
+    circuit_breaker = CircuitBreaker(minimum_calls = 1, open_duration = 0.1)
+    host_key = ( "http", "127.0.0.1", http_server.server_port )
+
+    async def request_get():
+        client = AsyncClient(http_server.url + "/flaky")
+        client.set_circuit_breaker(circuit_breaker)
+
+        assert (await client.request_get()).code == 503
+        assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_OPEN
+
+        await asyncio.sleep(0.2)
+
+        client = AsyncClient(http_server.url + "/alternate")
+        client.set_circuit_breaker(circuit_breaker)
+
+        with pytest.raises(asyncio.TimeoutError): await asyncio.wait_for(client.request_get(), 0.2)
+
+        response = await client.request_get()
+        assert response.code == 200
+        await response.read()
+    #
+
+    asyncio.run(request_get())
+    assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_CLOSED
+#
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module,protected-access
+
+from io import RawIOBase
+
+import pytest
+
+from dpt_runtime.io_exception import IOException
+
+from pas_http_client.chunked_reader_mixin import ChunkedReaderMixin
+
+CHUNKED_BODY = (b"5;ext=1\r\nhello\r\n"
+                + b"1\r\n \r\n"
+                + b"6\r\nworld!\r\n"
+                + b"0\r\nX-Trailer: value\r\n\r\n"
+               )
+
+class ChunkedReader(ChunkedReaderMixin):
+    """
+Chunked reader used for testing.
+    """
+
+    __slots__ = ChunkedReaderMixin._mixin_slots_
+
+    def read_all(self, reader, size = -1):
+        data = bytearray()
+        self._read_chunked_data(reader, lambda part: data.extend(part), size)
+
+        return bytes(data)
+    #
+#
+
+class OneByteRawReader(RawIOBase):
+    """
+Raw file-like reader returning one byte per call.
+    """
+
+    def __init__(self, data):
+        RawIOBase.__init__(self)
+        self._data = data
+        self._position = 0
+    #
+
+    def readable(self): return True
+
+    def readinto(self, buffer):
+        if (self._position >= len(self._data) or len(buffer) < 1): return 0
+
+        buffer[0] = self._data[self._position]
+        self._position += 1
+
+        return 1
+    #
+#
+
+def _get_byte_source(data):
+    """
+Returns a read callback providing one byte of the given data per call.
+    """
+
+    reader = OneByteRawReader(data)
+    return (lambda n: reader.read(1))
+#
+
+def test_read_callback_byte_by_byte():
+    chunked_reader = ChunkedReader()
+
+    assert chunked_reader.read_all(_get_byte_source(CHUNKED_BODY)) == b"hello world!"
+    assert chunked_reader._is_chunked_data_eof
+    assert chunked_reader._get_chunked_trailers() == { "x-trailer": "value" }
+#
+
+def test_read_file_byte_by_byte():
+    chunked_reader = ChunkedReader()
+
+    assert chunked_reader.read_all(OneByteRawReader(CHUNKED_BODY)) == b"hello world!"
+    assert chunked_reader._get_chunked_trailers() == { "x-trailer": "value" }
+#
+
+def test_read_sized_parts():
+    chunked_reader = ChunkedReader()
+    reader = _get_byte_source(CHUNKED_BODY)
+
+    parts = [ ]
+    while (not chunked_reader._is_chunked_data_eof): parts.append(chunked_reader.read_all(reader, 4))
+
+    assert b"".join(parts) == b"hello world!"
+    assert max(len(part) for part in parts) <= 4
+#
+
+def test_read_truncated_data():
+    with pytest.raises(IOException): ChunkedReader().read_all(_get_byte_source(CHUNKED_BODY[:20]))
+#
+
+def test_read_invalid_chunk_size():
+    with pytest.raises(IOException): ChunkedReader().read_all(_get_byte_source(b"xyz\r\nhello\r\n0\r\n\r\n"))
+#
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from time import sleep
+
+from pas_http_client import AddressResolver, CircuitBreaker, Client
+
+def test_open_circuit_rejects_requests(http_server):
+    circuit_breaker = CircuitBreaker(minimum_calls = 1, open_duration = 60)
+    host_key = ( "http", "127.0.0.1", http_server.server_port )
+
+    client = Client(http_server.url + "/flaky")
+    client.set_circuit_breaker(circuit_breaker)
+
+    assert client.request_get().code == 503
+    assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_OPEN
+
+    response = client.request_get()
+
+    assert response.code is None
+    assert response.exception is not None
+    assert http_server.get_hits("/flaky") == 1
+#
+
+def test_half_open_circuit_closed_by_probe(http_server):
+    circuit_breaker = CircuitBreaker(minimum_calls = 1, open_duration = 0.1)
+    host_key = ( "http", "127.0.0.1", http_server.server_port )
+
+    client = Client(http_server.url + "/flaky")
+    client.set_circuit_breaker(circuit_breaker)
+
+    assert client.request_get().code == 503
+    sleep(0.2)
+
+    assert client.request_get().code == 503
+    assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_OPEN
+    sleep(0.2)
+
+    response = client.request_get()
+
+    assert response.code == 200
+    assert response.read() == b"flaky 3"
+    assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_CLOSED
+#
+
+def test_failing_address_ejected(http_server):
+    address_resolver = AddressResolver(max_address_failures = 2)
+    socket_address = ( "127.0.0.1", http_server.server_port )
+
+    client = Client(http_server.url + "/flaky")
+    client.set_address_resolver(address_resolver)
+
+    assert client.request_get().code == 503
+    assert not address_resolver.is_address_ejected(socket_address)
+
+    assert client.request_get().code == 503
+    assert address_resolver.is_address_ejected(socket_address)
+#
+
+def test_successful_request_resets_address_failures(http_server):
+    address_resolver = AddressResolver(max_address_failures = 2)
+    socket_address = ( "127.0.0.1", http_server.server_port )
+
+    client = Client(http_server.url + "/flaky")
+    client.set_address_resolver(address_resolver)
+
+    assert client.request_get().code == 503
+
+    client.url = http_server.url + "/hello"
+    assert client.request_get().code == 200
+
+    client.url = http_server.url + "/flaky"
+    assert client.request_get().code == 503
+    assert not address_resolver.is_address_ejected(socket_address)
+#
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from time import sleep
+
+from pas_http_client import AddressResolver, CircuitBreaker, Client, ConcurrencyLimiter, ConnectionPool, HedgingPolicy, RetryPolicy
+
+def _new_hedged_client(http_server):
+    """
+Returns a client sending a hedged request after 0.1 seconds.
+    """
+
+    _return = Client(http_server.url + "/alternate")
+    _return.set_connection_pool(ConnectionPool())
+    _return.set_hedging_policy(HedgingPolicy(max_delay = 0.1, minimum_samples = 1000))
+
+    return _return
+#
+
+def test_hedged_request(http_server):
+    client = _new_hedged_client(http_server)
+    response = client.request_get()
+
+    assert response.code == 200
+    assert response.read() == b"alternate 2"
+#
+
+def test_hedged_request_with_retry_policy(http_server):
+    client = _new_hedged_client(http_server)
+    client.set_retry_policy(RetryPolicy())
+
+    response = client.request_get()
+    assert response.read() == b"alternate 2"
+
+    sleep(1.5)
+    assert http_server.get_hits("/alternate") == 2
+#
+
+def test_hedged_request_with_circuit_breaker(http_server):
+    circuit_breaker = CircuitBreaker(minimum_calls = 4)
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 10)
+    address_resolver = AddressResolver(max_address_failures = 1)
+
+    client = _new_hedged_client(http_server)
+    client.set_address_resolver(address_resolver)
+    client.set_circuit_breaker(circuit_breaker)
+    client.set_concurrency_limiter(concurrency_limiter)
+
+    for _ in range(2): assert client.request_get().code == 200
+
+    sleep(1.5)
+    host_key = ( "http", "127.0.0.1", http_server.server_port )
+
+    assert circuit_breaker.get_state(host_key) == CircuitBreaker.STATE_CLOSED
+    assert concurrency_limiter.get_limit(host_key) >= 10
+    assert concurrency_limiter.get_in_flight_count(host_key) == 0
+    assert not address_resolver.is_address_ejected(( "127.0.0.1", http_server.server_port ))
+#
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+
+try: import http.client as http_client
+except ImportError: import httplib as http_client
+
+import pytest
+
+from dpt_runtime.type_exception import TypeException
+
+from pas_http_client import AsyncClient, Client, ConnectionPool, HttpConnectionFactory, UnixSocketConnectionFactory
+
+def test_plain_http_connection(http_server):
+    connection = HttpConnectionFactory().create_connection(None, "127.0.0.1", http_server.server_port, 5)
+
+    assert isinstance(connection, http_client.HTTPConnection)
+    assert not isinstance(connection, http_client.HTTPSConnection)
+
+    client = Client(http_server.url + "/hello")
+    client.set_connection_pool(None)
+
+    assert client.request_get().read() == b"hello world"
+    assert not isinstance(client.connection, http_client.HTTPSConnection)
+#
+
+def test_unsupported_scheme():
+    client = Client("gopher://127.0.0.1/hello")
+    with pytest.raises(TypeException): _ = client.connection_factory
+#
+
+def test_unix_socket_connection(unix_http_server):
+    connection_pool = ConnectionPool()
+
+    client = Client("http://localhost/hello")
+    client.set_connection_factory(UnixSocketConnectionFactory(unix_http_server.server_address))
+    client.set_connection_pool(connection_pool)
+
+    for _ in range(2): assert client.request_get().read() == b"hello world"
+
+    assert unix_http_server.connection_count == 1
+    assert unix_http_server.get_requests("/hello")[0][0]['host'] == "localhost"
+#
+
+def test_unix_socket_connection_async(unix_http_server):
+    async def request_get():
+        client = AsyncClient("http://localhost/hello")
+        client.set_connection_factory(UnixSocketConnectionFactory(unix_http_server.server_address))
+
+        response = await client.request_get()
+        return await response.read()
+    #
+
+    assert asyncio.run(request_get()) == b"hello world"
+#
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from threading import Thread
+from time import sleep, time
+
+import pytest
+
+from dpt_runtime.io_exception import IOException
+
+from pas_http_client import Client, ConnectionPool
+
+class PooledConnection(object):
+    """
+Connection stub counting calls of "close()".
+    """
+
+    def __init__(self):
+        self.close_count = 0
+        self.sock = None
+    #
+
+    def close(self): self.close_count += 1
+#
+
+def _borrow_in_thread(connection_pool, key, timeout, results):
+    """
+Borrows a connection for the given key in a new thread and stores the time
+needed or the exception raised.
+    """
+
+    def borrow():
+        start_time = time()
+
+        try:
+            connection_pool.borrow(key, PooledConnection, timeout)
+            results[key] = time() - start_time
+        except IOException as handled_exception: results[key] = handled_exception
+    #
+
+    _return = Thread(target = borrow)
+    _return.start()
+
+    return _return
+#
+
+def test_connection_reuse_across_clients(http_server):
+    connection_pool = ConnectionPool()
+
+    for _ in range(3):
+        client = Client(http_server.url + "/hello")
+        client.set_connection_pool(connection_pool)
+
+        assert client.request_get().read() == b"hello world"
+    #
+
+    assert http_server.connection_count == 1
+    assert connection_pool.idle_count == 1
+#
+
+def test_borrow_timeout_at_connection_limit():
+    connection_pool = ConnectionPool(max_connections_per_host = 1)
+    connection = connection_pool.borrow("a", PooledConnection)
+
+    with pytest.raises(IOException): connection_pool.borrow("a", PooledConnection, 0.1)
+
+    connection_pool.release("a", connection)
+
+    assert connection.close_count == 1
+    assert connection_pool.borrow("a", PooledConnection, 0.1) is not connection
+#
+
+def test_release_wakes_waiter_of_the_same_key():
+    connection_pool = ConnectionPool(max_connections_per_host = 1)
+    connection = connection_pool.borrow("a", PooledConnection)
+    connection_pool.borrow("b", PooledConnection)
+
+    results = { }
+    threads = [ _borrow_in_thread(connection_pool, "b", 2, results) ]
+    sleep(0.1)
+    threads.append(_borrow_in_thread(connection_pool, "a", 2, results))
+    sleep(0.1)
+
+    connection_pool.release("a", connection)
+    for thread in threads: thread.join()
+
+    assert results['a'] < 1
+    assert isinstance(results['b'], IOException)
+#
+
+@pytest.mark.usefixtures("high_file_descriptors")
+def test_connection_reuse_with_file_descriptors_above_fd_setsize(http_server):
+    connection_pool = ConnectionPool()
+
+    client = Client(http_server.url + "/hello")
+    client.set_connection_pool(connection_pool)
+
+    for _ in range(2): assert client.request_get().read() == b"hello world"
+
+    assert http_server.connection_count == 1
+#
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from dpt_runtime.io_exception import IOException
+
+from pas_http_client import Client
+from pas_http_client.async_decoding_body_reader import AsyncDecodingBodyReader
+from pas_http_client.decoding_body_reader import DecodingBodyReader
+from pas_http_client.zlib_content_decoder import ZlibContentDecoder
+
+from .conftest import DEFLATE_DATA
+
+DATA = b"direct PAS HTTP client " * 4096
+
+def _get_byte_source(data):
+    """
+Returns a read callback providing one byte of the given data per call.
+    """
+
+    position = [ 0 ]
+
+    def read(n = None):
+        _return = data[position[0]:position[0] + 1]
+        position[0] += len(_return)
+
+        return _return
+    #
+
+    return read
+#
+
+def _get_deflate_data(is_zlib_wrapped):
+    """
+Returns "deflate" encoded test data with or without the zlib wrapper.
+    """
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, (zlib.MAX_WBITS if (is_zlib_wrapped) else -zlib.MAX_WBITS))
+    return compressor.compress(DATA) + compressor.flush()
+#
+
+def test_deflate_read_byte_by_byte():
+    for is_zlib_wrapped in ( True, False ):
+        reader = DecodingBodyReader(_get_byte_source(_get_deflate_data(is_zlib_wrapped)), ZlibContentDecoder("deflate"))
+
+        assert reader() == DATA
+        assert reader.is_eof
+    #
+#
+
+def test_deflate_read_byte_by_byte_async():
+    for is_zlib_wrapped in ( True, False ):
+        read = _get_byte_source(_get_deflate_data(is_zlib_wrapped))
+
+        async def source(n = None): return read(n)
+
+        reader = AsyncDecodingBodyReader(source, ZlibContentDecoder("deflate"))
+        assert asyncio.run(reader()) == DATA
+    #
+#
+
+def test_gzip_read_byte_by_byte_in_blocks():
+    reader = DecodingBodyReader(_get_byte_source(gzip.compress(DATA)), ZlibContentDecoder("gzip"))
+    data = bytearray()
+
+    while (not reader.is_eof): data += reader(1000)
+
+    assert bytes(data) == DATA
+#
+
+def test_deflate_max_size():
+    reader = DecodingBodyReader(_get_byte_source(_get_deflate_data(True)), ZlibContentDecoder("deflate"), max_size = 1024)
+
+    with pytest.raises(IOException): reader()
+#
+
+def test_deflate_response(http_server):
+    client = Client(http_server.url + "/deflate")
+    assert client.request_get().read() == zlib.compress(DEFLATE_DATA)
+
+    client.set_content_decoding()
+    assert client.request_get().read() == DEFLATE_DATA
+#
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module,protected-access
+
+from pas_http_client import LoadBalancedClient, LoadBalancer
+
+def test_join_upstream_path():
+    assert LoadBalancedClient._join_upstream_path("", "/") == "/"
+    assert LoadBalancedClient._join_upstream_path("/", "/hello") == "/hello"
+    assert LoadBalancedClient._join_upstream_path("/api/", "/hello?a=1") == "/api/hello?a=1"
+    assert LoadBalancedClient._join_upstream_path("/api?key=1", "/hello?a=1") == "/api/hello?key=1&a=1"
+#
+
+def test_request_path_joined_to_upstream_base(http_server):
+    client = LoadBalancedClient([ http_server.url + "/a", http_server.url + "/b/" ])
+
+    client.path = "/hello"
+    for _ in range(2): assert client.request_get().read() == b"hello world"
+
+    client.url = "http://localhost/other?x=1"
+    for _ in range(2): assert client.request_get().code == 200
+
+    assert [ http_server.get_hits(path) for path in ( "/a/hello", "/b/hello", "/a/other", "/b/other" ) ] == [ 1, 1, 1, 1 ]
+#
+
+def test_failed_upstream_penalized(http_server):
+    client = LoadBalancedClient([ "http://127.0.0.1:1", http_server.url ], strategy = LoadBalancer.STRATEGY_POWER_OF_TWO_CHOICES)
+    client.path = "/hello"
+
+    codes = [ client.request_get().code for _ in range(10) ]
+
+    assert codes.count(None) <= 2
+    assert client.load_balancer.get_latency(0) >= client.load_balancer.failure_penalty
+#
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import pytest
+
+from dpt_runtime.type_exception import TypeException
+
+from pas_http_client import Client, MultipartFormData
+
+def _get_part(name, value, file_name = None, content_type = None):
+    """
+Returns the expected encoding of a part.
+    """
+
+    _return = '--test\r\nContent-Disposition: form-data; name="{0}"'.format(name).encode("utf-8")
+    if (file_name is not None): _return += '; filename="{0}"'.format(file_name).encode("utf-8")
+    if (content_type is not None): _return += "\r\nContent-Type: {0}".format(content_type).encode("utf-8")
+
+    return _return + b"\r\n\r\n" + value + b"\r\n"
+#
+
+def test_fields_and_files(http_server, tmp_path):
+    file_path_name = str(tmp_path / "upload.bin")
+    with open(file_path_name, "wb") as _file: _file.write(b"\x00file data\xff")
+
+    form_data = MultipartFormData("test")
+    form_data.add_field("text", "ä")
+    form_data.add_field("bytes", b"\x00\xff")
+    form_data.add_field("bytearray", bytearray(b"array"))
+    form_data.add_field("memoryview", memoryview(b"view data")[:4], "text/plain")
+    form_data.add_field("number", 42)
+    form_data.add_file("path", file_path_name)
+
+    with open(file_path_name, "rb") as _file:
+        _file.seek(1)
+        form_data.add_file("object", _file, "other.bin")
+
+        expected_body = (_get_part("text", "ä".encode("utf-8"))
+                         + _get_part("bytes", b"\x00\xff")
+                         + _get_part("bytearray", b"array")
+                         + _get_part("memoryview", b"view", content_type = "text/plain")
+                         + _get_part("number", b"42")
+                         + _get_part("path", b"\x00file data\xff", "upload.bin", "application/octet-stream")
+                         + _get_part("object", b"file data\xff", "other.bin", "application/octet-stream")
+                         + b"--test--\r\n"
+                        )
+
+        assert form_data.length == len(expected_body)
+
+        response = Client(http_server.url + "/echo").request_post(form_data)
+    #
+
+    assert response.read() == expected_body
+
+    headers = http_server.get_requests("/echo")[0][0]
+
+    assert headers['content-type'] == "multipart/form-data; boundary=test"
+    assert headers['content-length'] == str(len(expected_body))
+#
+
+def test_text_mode_file_rejected(http_server, tmp_path):
+    file_path_name = str(tmp_path / "upload.txt")
+    with open(file_path_name, "w", encoding = "utf-8") as _file: _file.write("ä")
+
+    with open(file_path_name, "r", encoding = "utf-8") as _file:
+        with pytest.raises(TypeException): MultipartFormData().add_file("text", _file)
+
+        response = Client(http_server.url + "/echo").request_post(_file)
+    #
+
+    assert isinstance(response.exception, TypeException)
+    assert http_server.get_hits("/echo") == 0
+#
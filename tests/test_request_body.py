@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import asyncio
+
+from pas_http_client import AsyncClient, Client
+
+from .conftest import DEFLATE_DATA
+
+def _request_post(http_server, data):
+    """
+Posts the given body to the test server and returns the body echoed and
+the request headers received.
+    """
+
+    response = Client(http_server.url + "/echo").request_post(data)
+    assert response.code == 200
+
+    return ( response.read(), http_server.get_requests("/echo")[-1][0] )
+#
+
+def test_file_body(http_server, tmp_path):
+    file_path_name = str(tmp_path / "data.bin")
+    with open(file_path_name, "wb") as _file: _file.write(DEFLATE_DATA)
+
+    with open(file_path_name, "rb") as _file:
+        _file.seek(100)
+        ( body, headers ) = _request_post(http_server, _file)
+    #
+
+    assert body == DEFLATE_DATA[100:]
+    assert headers['content-length'] == str(len(DEFLATE_DATA) - 100)
+    assert "transfer-encoding" not in headers
+#
+
+def test_memoryview_body(http_server):
+    ( body, headers ) = _request_post(http_server, memoryview(DEFLATE_DATA)[10:20])
+
+    assert body == DEFLATE_DATA[10:20]
+    assert headers['content-length'] == "10"
+#
+
+def test_iterable_body_chunked(http_server):
+    ( body, headers ) = _request_post(http_server, ( DEFLATE_DATA[i:i + 1000] for i in range(0, len(DEFLATE_DATA), 1000) ))
+
+    assert body == DEFLATE_DATA
+    assert headers['transfer-encoding'] == "chunked"
+    assert "content-length" not in headers
+#
+
+def test_async_iterable_body_chunked(http_server):
+    async def get_data():
+        for i in range(0, len(DEFLATE_DATA), 1000):
+            await asyncio.sleep(0)
+            yield DEFLATE_DATA[i:i + 1000]
+        #
+    #
+
+    async def request_post():
+        response = await AsyncClient(http_server.url + "/echo").request_post(get_data())
+        return await response.read()
+    #
+
+    assert asyncio.run(request_post()) == DEFLATE_DATA
+    assert http_server.get_requests("/echo")[-1][0]['transfer-encoding'] == "chunked"
+#
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pas_http_client import Client, RequestCoalescer
+
+def _request_get_concurrently(url, request_coalescer, params_list):
+    """
+Requests the given URL concurrently once per query parameters given and
+returns the response bodies read.
+    """
+
+    def request_get(params):
+        client = Client(url)
+        client.set_request_coalescer(request_coalescer)
+
+        return client.request_get(params).read()
+    #
+
+    with ThreadPoolExecutor(max_workers = len(params_list)) as executor: return list(executor.map(request_get, params_list))
+#
+
+def test_identical_requests_coalesced(http_server):
+    request_coalescer = RequestCoalescer()
+    bodies = _request_get_concurrently(http_server.url + "/slow", request_coalescer, [ { "delay": "0.5" } ] * 5)
+
+    assert bodies == [ b"delay=0.5" ] * 5
+    assert http_server.get_hits("/slow") == 1
+    assert request_coalescer.in_flight_count == 0
+#
+
+def test_different_requests_not_coalesced(http_server):
+    params_list = [ { "delay": "0.2", "n": str(i) } for i in range(3) ]
+    bodies = _request_get_concurrently(http_server.url + "/slow", RequestCoalescer(), params_list)
+
+    assert bodies == [ "delay=0.2;n={0:d}".format(i).encode("ascii") for i in range(3) ]
+    assert http_server.get_hits("/slow") == 3
+#
+
+def test_sequential_requests_not_coalesced(http_server):
+    client = Client(http_server.url + "/hello")
+    client.set_request_coalescer(RequestCoalescer())
+
+    for _ in range(2): assert client.request_get().read() == b"hello world"
+    assert http_server.get_hits("/hello") == 2
+#
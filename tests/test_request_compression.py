@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import gzip
+
+from pas_http_client import Client
+
+from .conftest import DEFLATE_DATA
+
+def _request_post(http_server, data, min_size = 1024):
+    """
+Posts the given body with request compression enabled and returns the body
+received by the test server and its request headers.
+    """
+
+    client = Client(http_server.url + "/echo")
+    client.set_request_compression(min_size = min_size)
+
+    response = client.request_post(data)
+    assert response.code == 200
+
+    return ( response.read(), http_server.get_requests("/echo")[-1][0] )
+#
+
+def test_bytes_body_compressed(http_server):
+    ( body, headers ) = _request_post(http_server, DEFLATE_DATA)
+
+    assert gzip.decompress(body) == DEFLATE_DATA
+    assert headers['content-encoding'] == "gzip"
+    assert headers['content-length'] == str(len(body))
+    assert len(body) < len(DEFLATE_DATA)
+#
+
+def test_streamed_body_compressed(http_server, tmp_path):
+    file_path_name = str(tmp_path / "data.bin")
+    with open(file_path_name, "wb") as _file: _file.write(DEFLATE_DATA)
+
+    with open(file_path_name, "rb") as _file: ( body, headers ) = _request_post(http_server, _file)
+
+    assert gzip.decompress(body) == DEFLATE_DATA
+    assert headers['content-encoding'] == "gzip"
+    assert headers['transfer-encoding'] == "chunked"
+
+    ( body, headers ) = _request_post(http_server, iter([ DEFLATE_DATA[:100], DEFLATE_DATA[100:] ]))
+
+    assert gzip.decompress(body) == DEFLATE_DATA
+    assert headers['content-encoding'] == "gzip"
+#
+
+def test_small_body_not_compressed(http_server):
+    ( body, headers ) = _request_post(http_server, b"small")
+
+    assert body == b"small"
+    assert "content-encoding" not in headers
+#
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Timer
+from time import time
+import asyncio
+
+from pas_http_client import AsyncClient, CircuitBreaker, Client, ConcurrencyLimiter, ConnectionPool, RateLimiter
+
+def test_concurrency_limited(http_server):
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 2, max_limit = 2)
+
+    def request_get(i):
+        """
+Sends one slow request limited by the shared concurrency limiter.
+        """
+
+        client = Client(http_server.url + "/slow")
+        client.set_concurrency_limiter(concurrency_limiter)
+
+        return client.request_get({ "delay": 0.2, "n": i }).code
+    #
+
+    with ThreadPoolExecutor(6) as executor: codes = list(executor.map(request_get, range(6)))
+
+    assert codes == [ 200 ] * 6
+    assert http_server.max_in_flight_count == 2
+    assert concurrency_limiter.get_in_flight_count(( "http", "127.0.0.1", http_server.server_port )) == 0
+#
+
+def test_concurrency_limited_async(http_server):
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 2, max_limit = 2)
+
+    async def request_get(i):
+        client = AsyncClient(http_server.url + "/slow")
+        client.set_concurrency_limiter(concurrency_limiter)
+
+        response = await client.request_get({ "delay": 0.2, "n": i })
+        await response.read()
+
+        return response.code
+    #
+
+    async def request_all():
+        return await asyncio.gather(*[ request_get(i) for i in range(6) ])
+    #
+
+    assert asyncio.run(request_all()) == [ 200 ] * 6
+    assert http_server.max_in_flight_count == 2
+#
+
+def test_async_waiter_woken_by_release_in_thread():
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 1, max_limit = 1)
+    assert concurrency_limiter.acquire("host")
+
+    async def acquire():
+        assert not (await concurrency_limiter.acquire_async("host", False))
+
+        Timer(0.1, concurrency_limiter.release, ( "host", )).start()
+        return await concurrency_limiter.acquire_async("host", timeout = 2)
+    #
+
+    start_time = time()
+
+    assert asyncio.run(acquire())
+    assert time() - start_time < 1
+    assert concurrency_limiter.get_in_flight_count("host") == 1
+#
+
+def test_async_waiter_timeout():
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 1, max_limit = 1)
+    assert concurrency_limiter.acquire("host")
+
+    assert not asyncio.run(concurrency_limiter.acquire_async("host", timeout = 0.1))
+    assert concurrency_limiter.get_in_flight_count("host") == 1
+#
+
+def test_rate_limited(http_server):
+    client = Client(http_server.url + "/hello")
+    client.set_rate_limiter(RateLimiter(rate = 10, burst = 1))
+
+    start_time = time()
+    for _ in range(3): assert client.request_get().code == 200
+
+    assert time() - start_time >= 0.15
+#
+
+def test_rate_limit_exceeded(http_server):
+    client = Client(http_server.url + "/hello")
+    client.set_rate_limiter(RateLimiter(rate = 1, burst = 1, is_blocking = False))
+
+    assert client.request_get().code == 200
+    assert client.request_get().exception is not None
+    assert http_server.get_hits("/hello") == 1
+#
+
+def test_pipelined_requests_rejected_by_open_circuit(http_server):
+    circuit_breaker = CircuitBreaker(minimum_calls = 1, open_duration = 60)
+
+    client = Client(http_server.url + "/flaky")
+    client.set_circuit_breaker(circuit_breaker)
+    client.set_connection_pool(ConnectionPool())
+
+    responses = client.request_pipelined([ ( "GET", ) ] * 2)
+
+    assert [ response.code for response in responses ] == [ 503, 503 ]
+    assert circuit_breaker.get_state(( "http", "127.0.0.1", http_server.server_port )) == CircuitBreaker.STATE_OPEN
+
+    responses = client.request_pipelined([ ( "GET", ) ] * 2)
+
+    assert [ response.code for response in responses ] == [ None, None ]
+    assert http_server.get_hits("/flaky") == 2
+#
+
+def test_pipelined_requests_concurrency_limited(http_server):
+    concurrency_limiter = ConcurrencyLimiter(initial_limit = 1, max_limit = 1, is_blocking = False)
+    host_key = ( "http", "127.0.0.1", http_server.server_port )
+
+    client = Client(http_server.url + "/hello")
+    client.set_concurrency_limiter(concurrency_limiter)
+    client.set_connection_pool(ConnectionPool())
+
+    assert concurrency_limiter.acquire(host_key)
+    assert [ response.code for response in client.request_pipelined([ ( "GET", ) ] * 2) ] == [ None, None ]
+
+    concurrency_limiter.release(host_key)
+    assert [ response.code for response in client.request_pipelined([ ( "GET", ) ] * 2) ] == [ 200, 200 ]
+
+    assert http_server.get_hits("/hello") == 2
+    assert concurrency_limiter.get_in_flight_count(host_key) == 0
+#
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from pas_http_client import Client
+
+def test_bounded_concurrency(http_server):
+    client = Client(http_server.url + "/slow")
+    requests = [ ( "GET", { "delay": "0.2", "n": str(i) } ) for i in range(6) ]
+
+    results = list(client.request_many(requests, max_concurrency = 2))
+
+    assert [ result[0] for result in results ] == list(range(6))
+
+    for ( index, response ) in results:
+        assert response.code == 200
+        assert "n={0:d}".format(index) in response.read().decode("ascii")
+    #
+
+    assert http_server.max_in_flight_count == 2
+#
+
+def test_unordered_results(http_server):
+    client = Client(http_server.url + "/slow")
+    requests = [ ( "GET", { "delay": "0.5" } ), ( "GET", { "delay": "0" } ) ]
+
+    assert [ result[0] for result in client.request_many(requests, is_ordered = False) ] == [ 1, 0 ]
+#
+
+def test_error_responses_per_request(http_server):
+    requests = [ ( "GET", ) for _ in range(3) ]
+    results = list(Client(http_server.url + "/flaky").request_many(requests, max_concurrency = 1))
+
+    assert [ result[1].code for result in results ] == [ 503, 503, 200 ]
+#
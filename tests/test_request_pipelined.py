@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import pytest
+
+from dpt_runtime.type_exception import TypeException
+
+from pas_http_client import Client, ConnectionPool
+
+def _new_client(url):
+    """
+Returns a client using a new connection pool.
+    """
+
+    _return = Client(url)
+    _return.set_connection_pool(ConnectionPool())
+
+    return _return
+#
+
+def test_requests_pipelined_on_one_connection(http_server):
+    client = _new_client(http_server.url + "/slow")
+    responses = client.request_pipelined([ ( "GET", { "delay": "0", "n": str(i) } ) for i in range(3) ] + [ ( "HEAD", ) ])
+
+    assert [ response.code for response in responses ] == [ 200 ] * 4
+    assert [ response.read() for response in responses[:3] ] == [ "delay=0;n={0:d}".format(i).encode("ascii") for i in range(3) ]
+    assert http_server.connection_count == 1
+    assert http_server.get_hits("/slow") == 4
+#
+
+def test_requests_sent_again_after_connection_close(http_server):
+    client = _new_client(http_server.url + "/close")
+    responses = client.request_pipelined([ ( "GET", ) ] * 3)
+
+    assert [ response.read() for response in responses ] == [ b"closed" ] * 3
+    assert http_server.connection_count == 3
+#
+
+def test_non_idempotent_method_rejected(http_server):
+    client = _new_client(http_server.url + "/hello")
+    with pytest.raises(TypeException): client.request_pipelined([ ( "GET", ), ( "POST", ) ])
+
+    assert http_server.get_hits("/hello") == 0
+#
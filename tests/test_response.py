@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from hashlib import sha256
+import os
+
+import pytest
+
+from pas_http_client import Client, ConnectionPool
+
+from .conftest import CHUNKED_DATA, DEFLATE_DATA, LINES_DATA
+
+def test_chunked_response(http_server):
+    for is_raw_chunked_reading in ( False, True ):
+        client = Client(http_server.url + "/chunked")
+        client.set_raw_chunked_reading(is_raw_chunked_reading)
+
+        assert client.request_get().read() == b"".join(CHUNKED_DATA)
+    #
+#
+
+def test_raw_chunked_response_read_in_parts(http_server):
+    client = Client(http_server.url + "/chunked")
+    client.set_raw_chunked_reading()
+
+    response = client.request_get()
+    parts = [ ]
+
+    while True:
+        data = response.read(7)
+        if (len(data) < 1): break
+
+        assert len(data) <= 7
+        parts.append(data)
+    #
+
+    assert b"".join(parts) == b"".join(CHUNKED_DATA)
+    assert response.trailers == { "x-trailer": "1" }
+#
+
+def test_iter_content_releases_connection(http_server):
+    connection_pool = ConnectionPool()
+
+    client = Client(http_server.url + "/deflate")
+    client.set_connection_pool(connection_pool)
+    client.set_content_decoding()
+
+    parts = list(client.request_get().iter_content(1000))
+
+    assert b"".join(parts) == DEFLATE_DATA
+    assert max(len(part) for part in parts) <= 1000
+    assert connection_pool.idle_count == 1
+#
+
+def test_iter_lines(http_server):
+    response = Client(http_server.url + "/lines").request_get()
+    assert list(response.iter_lines(3)) == [ b"line 0", b"line 1", b"", b"line 3", b"line 4" ]
+
+    response = Client(http_server.url + "/lines").request_get()
+    assert list(response.iter_lines(delimiter = b"\r\n")) == LINES_DATA.split(b"\r\n")
+#
+
+def test_readinto(http_server):
+    for is_raw_chunked_reading in ( False, True ):
+        client = Client(http_server.url + "/chunked")
+        client.set_raw_chunked_reading(is_raw_chunked_reading)
+
+        response = client.request_get()
+
+        buffer = bytearray(16)
+        data = bytearray()
+
+        while True:
+            size = response.readinto(buffer)
+            if (size < 1): break
+
+            data += buffer[:size]
+        #
+
+        assert bytes(data) == b"".join(CHUNKED_DATA)
+    #
+#
+
+def _get_splice_counter(monkeypatch):
+    """
+Counts the calls of "os.splice()".
+    """
+
+    if (not hasattr(os, "splice")): pytest.skip("os.splice() is not supported")
+
+    _return = [ 0 ]
+    splice = os.splice
+
+    def splice_counted(*args):
+        _return[0] += 1
+        return splice(*args)
+    #
+
+    monkeypatch.setattr(os, "splice", splice_counted)
+    return _return
+#
+
+def test_save_to_path_with_hash(http_server, tmp_path):
+    file_path_name = str(tmp_path / "data.bin")
+    progress = [ ]
+    hash_object = sha256()
+
+    size = Client(http_server.url + "/data").request_get().save_to(file_path_name, progress.append, hash_object, 4096)
+
+    assert size == len(DEFLATE_DATA)
+    assert progress[-1] == size
+    assert hash_object.digest() == sha256(DEFLATE_DATA).digest()
+
+    with open(file_path_name, "rb") as _file: assert _file.read() == DEFLATE_DATA
+#
+
+def test_save_to_file_object_decoded(http_server, tmp_path):
+    client = Client(http_server.url + "/deflate")
+    client.set_content_decoding()
+
+    with open(str(tmp_path / "data.bin"), "w+b") as _file:
+        assert client.request_get().save_to(_file) == len(DEFLATE_DATA)
+
+        _file.seek(0)
+        assert _file.read() == DEFLATE_DATA
+    #
+#
+
+def test_save_to_fd_spliced(http_server, tmp_path, monkeypatch):
+    splice_counter = _get_splice_counter(monkeypatch)
+    file_path_name = str(tmp_path / "data.bin")
+
+    fd = os.open(file_path_name, os.O_WRONLY | os.O_CREAT)
+
+    try: assert Client(http_server.url + "/data").request_get().save_to(fd) == len(DEFLATE_DATA)
+    finally: os.close(fd)
+
+    assert splice_counter[0] > 0
+
+    with open(file_path_name, "rb") as _file: assert _file.read() == DEFLATE_DATA
+#
+
+@pytest.mark.usefixtures("high_file_descriptors")
+def test_save_to_spliced_with_file_descriptors_above_fd_setsize(http_server, tmp_path, monkeypatch):
+    splice_counter = _get_splice_counter(monkeypatch)
+    file_path_name = str(tmp_path / "data.bin")
+
+    assert Client(http_server.url + "/data").request_get().save_to(file_path_name) == len(DEFLATE_DATA)
+    assert splice_counter[0] > 0
+
+    with open(file_path_name, "rb") as _file: assert _file.read() == DEFLATE_DATA
+#
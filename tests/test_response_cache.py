@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from pas_http_client import Client, ConnectionPool, FileResponseCacheStore, MemoryResponseCacheStore, ResponseCache
+
+from .conftest import LAST_MODIFIED
+
+def _request_get_repeated(url, count, store = None):
+    """
+Requests the given URL with a response cache and returns the bodies read.
+    """
+
+    client = Client(url)
+    client.set_response_cache(ResponseCache(MemoryResponseCacheStore() if (store is None) else store))
+
+    _return = [ ]
+
+    for _ in range(count):
+        response = client.request_get()
+
+        assert response.code == 200
+        _return.append(response.read())
+    #
+
+    return _return
+#
+
+def test_fresh_response_served_from_cache(http_server):
+    assert _request_get_repeated(http_server.url + "/cache-fresh", 3) == [ b"fresh 1" ] * 3
+    assert http_server.get_hits("/cache-fresh") == 1
+#
+
+def test_file_store(http_server, tmp_path):
+    url = http_server.url + "/cache-fresh"
+
+    assert _request_get_repeated(url, 2, FileResponseCacheStore(str(tmp_path))) == [ b"fresh 1" ] * 2
+    assert _request_get_repeated(url, 1, FileResponseCacheStore(str(tmp_path))) == [ b"fresh 1" ]
+    assert http_server.get_hits("/cache-fresh") == 1
+
+    store = FileResponseCacheStore(str(tmp_path))
+    assert store.size > 0
+
+    store.clear()
+    assert _request_get_repeated(url, 1, store) == [ b"fresh 2" ]
+#
+
+def test_no_store_response_not_cached(http_server):
+    assert _request_get_repeated(http_server.url + "/no-store", 2) == [ b"no-store 1", b"no-store 2" ]
+#
+
+def test_unsafe_request_invalidates_entry(http_server):
+    client = Client(http_server.url + "/cache-fresh")
+    client.set_response_cache(ResponseCache(MemoryResponseCacheStore()))
+
+    assert client.request_get().read() == b"fresh 1"
+    assert client.request_post(b"data").read() == b"data"
+    assert client.request_get().read() == b"fresh 3"
+#
+
+def test_revalidation_with_etag(http_server):
+    assert _request_get_repeated(http_server.url + "/cache", 3) == [ b"cached" ] * 3
+
+    requests = http_server.get_requests("/cache")
+
+    assert [ request[1] for request in requests ] == [ 200, 304, 304 ]
+    assert "if-none-match" not in requests[0][0]
+    assert all(request[0].get("if-none-match") == '"v1"' for request in requests[1:])
+#
+
+def test_revalidation_with_last_modified(http_server):
+    assert _request_get_repeated(http_server.url + "/cache-modified", 2) == [ b"modified" ] * 2
+
+    requests = http_server.get_requests("/cache-modified")
+
+    assert [ request[1] for request in requests ] == [ 200, 304 ]
+    assert requests[1][0].get("if-modified-since") == LAST_MODIFIED
+#
+
+def test_pipelined_requests_cached(http_server):
+    client = Client(http_server.url + "/cache-fresh")
+    client.set_connection_pool(ConnectionPool())
+    client.set_response_cache(ResponseCache(MemoryResponseCacheStore()))
+
+    for _ in range(2):
+        responses = client.request_pipelined([ ( "GET", { "n": "1" } ), ( "GET", { "n": "2" } ) ])
+        assert [ response.read() for response in responses ] == [ b"fresh 1", b"fresh 2" ]
+    #
+
+    assert http_server.get_hits("/cache-fresh") == 2
+    assert http_server.connection_count == 1
+#
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from time import time
+import asyncio
+
+from pas_http_client import AsyncClient, Client, RetryBudget, RetryPolicy
+
+def test_retry_on_503(http_server):
+    client = Client(http_server.url + "/flaky")
+    client.set_retry_policy(RetryPolicy(backoff_factor = 0))
+
+    response = client.request_get()
+
+    assert response.code == 200
+    assert response.read() == b"flaky 3"
+    assert http_server.get_hits("/flaky") == 3
+#
+
+def test_retries_limited(http_server):
+    client = Client(http_server.url + "/flaky")
+    client.set_retry_policy(RetryPolicy(max_retries = 1, backoff_factor = 0))
+
+    assert client.request_get().code == 503
+    assert http_server.get_hits("/flaky") == 2
+#
+
+def test_retries_limited_by_budget(http_server):
+    client = Client(http_server.url + "/flaky")
+    client.set_retry_policy(RetryPolicy(backoff_factor = 0, budget = RetryBudget(max_tokens = 1, token_ratio = 0)))
+
+    assert client.request_get().code == 503
+    assert http_server.get_hits("/flaky") == 2
+#
+
+def test_retries_limited_by_total_timeout(http_server):
+    client = Client(http_server.url + "/flaky")
+    client.set_retry_policy(RetryPolicy(backoff_factor = 0.2, is_jittered = False, is_retry_after_respected = False))
+    client.set_timeouts(total_timeout = 0.5)
+
+    start_time = time()
+
+    assert client.request_get().code == 503
+    assert time() - start_time < 0.5
+    assert http_server.get_hits("/flaky") == 2
+#
+
+def test_retries_limited_by_total_timeout_async(http_server):
+    async def request_get():
+        client = AsyncClient(http_server.url + "/flaky")
+        client.set_retry_policy(RetryPolicy(backoff_factor = 1, is_jittered = False, is_retry_after_respected = False))
+        client.set_timeouts(total_timeout = 0.5)
+
+        return await client.request_get()
+    #
+
+    start_time = time()
+
+    assert asyncio.run(request_get()).code == 503
+    assert time() - start_time < 0.5
+    assert http_server.get_hits("/flaky") == 1
+#
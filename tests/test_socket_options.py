@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module,protected-access
+
+import asyncio
+import socket
+
+from pas_http_client import AddressResolver, AsyncClient, Client, ConnectionPool, SocketOptions, UnixSocketConnectionFactory
+
+def _assert_socket_options(sock):
+    """
+Checks that the options of "_new_socket_options()" are set for the given
+socket.
+    """
+
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0
+    if (hasattr(socket, "TCP_KEEPIDLE")): assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+    if (hasattr(socket, "TCP_KEEPCNT")): assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 3
+#
+
+def _new_socket_options():
+    """
+Returns the socket options used for the tests.
+    """
+
+    return SocketOptions(tcp_nodelay = True, is_keepalive_enabled = True, keepalive_idle = 30, keepalive_count = 3)
+#
+
+def test_options_applied(http_server):
+    for address_resolver in ( None, AddressResolver() ):
+        client = Client(http_server.url + "/hello")
+        client.set_address_resolver(address_resolver)
+        client.set_connection_pool(None)
+        client.set_socket_options(_new_socket_options())
+
+        assert client.request_get().read() == b"hello world"
+        _assert_socket_options(client.connection.sock)
+    #
+#
+
+def test_options_applied_async(http_server):
+    async def request_get():
+        client = AsyncClient(http_server.url + "/hello")
+        client.set_connection_pool(None)
+        client.set_socket_options(_new_socket_options())
+
+        response = await client.request_get()
+        assert await response.read() == b"hello world"
+
+        _assert_socket_options(client.connection._writer.get_extra_info("socket"))
+    #
+
+    asyncio.run(request_get())
+#
+
+def test_options_separate_pooled_connections(http_server):
+    connection_pool = ConnectionPool()
+
+    for socket_options in ( None, _new_socket_options(), None ):
+        client = Client(http_server.url + "/hello")
+        client.set_connection_pool(connection_pool)
+        client.set_socket_options(socket_options)
+
+        assert client.request_get().read() == b"hello world"
+    #
+
+    assert http_server.connection_count == 2
+#
+
+def test_options_ignored_for_unix_sockets(unix_http_server):
+    client = Client("http://localhost/hello")
+    client.set_connection_factory(UnixSocketConnectionFactory(unix_http_server.server_address))
+    client.set_socket_options(_new_socket_options())
+
+    assert client.request_get().read() == b"hello world"
+#
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+from time import time
+
+import pytest
+
+from pas_http_client import Client
+
+from .conftest import DEFLATE_DATA
+
+def test_first_byte_timeout(http_server):
+    client = Client(http_server.url + "/slow")
+    client.set_timeouts(first_byte_timeout = 0.2)
+
+    start_time = time()
+    response = client.request_get({ "delay": 2 })
+
+    assert response.exception is not None
+    assert time() - start_time < 1.5
+#
+
+def test_first_byte_timeout_not_exceeded(http_server):
+    client = Client(http_server.url + "/slow")
+    client.set_timeouts(first_byte_timeout = 2)
+
+    response = client.request_get({ "delay": 0.1 })
+
+    assert response.code == 200
+    assert response.read() == b"delay=0.1"
+#
+
+def test_read_idle_timeout(http_server):
+    client = Client(http_server.url + "/data")
+    client.set_timeouts(read_idle_timeout = 1)
+
+    response = client.request_get()
+
+    assert response.code == 200
+    assert response.read() == DEFLATE_DATA
+#
+
+def test_total_timeout(http_server):
+    client = Client(http_server.url + "/slow")
+    client.set_timeouts(first_byte_timeout = 5, total_timeout = 0.3)
+
+    start_time = time()
+    response = client.request_get({ "delay": 2 })
+
+    assert response.exception is not None
+    assert time() - start_time < 1.5
+#
+
+def test_total_timeout_limits_body(http_server):
+    client = Client(http_server.url + "/data")
+    client.set_timeouts(total_timeout = 0.08)
+
+    response = client.request_get()
+    assert response.code == 200
+
+    with pytest.raises(Exception): response.read()
+#
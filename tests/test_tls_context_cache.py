@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;http;client
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasHttpClientVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,no-name-in-module
+
+import os
+import shutil
+
+from pas_http_client import Client, TlsContextCache
+
+from .conftest import TLS_CERT_FILE_NAME
+
+def _request_get(url, ca_file_name):
+    """
+Requests the given URL with a new client and returns the response body and
+the SSL/TLS socket used.
+    """
+
+    client = Client(url)
+    client.set_connection_pool(None)
+    client.set_tls_verification(ca_file_name = ca_file_name)
+
+    return ( client.request_get().read(), client.connection.sock )
+#
+
+def test_context_cached_until_modified(tmp_path):
+    ca_file_name = str(tmp_path / "ca.pem")
+    shutil.copy(TLS_CERT_FILE_NAME, ca_file_name)
+
+    tls_context_cache = TlsContextCache()
+    context = tls_context_cache.get_context(ca_file_name = ca_file_name)
+
+    assert tls_context_cache.get_context(ca_file_name = ca_file_name) is context
+    assert tls_context_cache.get_context(ca_file_name = ca_file_name, is_verified = False) is not context
+
+    file_stat = os.stat(ca_file_name)
+    os.utime(ca_file_name, ( file_stat.st_atime, file_stat.st_mtime + 10 ))
+
+    assert tls_context_cache.get_context(ca_file_name = ca_file_name) is not context
+#
+
+def test_session_resumed_on_reconnect(https_server):
+    TlsContextCache.get_instance().clear()
+
+    ( body, sock ) = _request_get(https_server.url + "/hello", TLS_CERT_FILE_NAME)
+
+    assert body == b"hello world"
+    assert not sock.session_reused
+
+    ( body, sock ) = _request_get(https_server.url + "/hello", TLS_CERT_FILE_NAME)
+
+    assert body == b"hello world"
+    assert sock.session_reused
+    assert https_server.connection_count == 2
+#